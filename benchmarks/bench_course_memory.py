@@ -0,0 +1,69 @@
+"""Measure the memory per course and the cost of converting courses to a dataframe.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_course_memory            # 1M courses
+    python -m benchmarks.bench_course_memory 100000     # quicker run
+
+Courses are built from rows with fresh strings, as a csv parser or the
+terminal input produces them, and the memory is what stays allocated for
+the courses once the rows are gone.
+"""
+import random
+import sys
+from time import perf_counter
+import tracemalloc
+
+from src.study_planner.timetable import Course, FrozenCourse, Timetable, WeekDay
+
+DEFAULT_COURSES = 1_000_000
+
+
+def course_rows(number_of_courses: int, seed: int = 0):
+    """Yield reproducible course rows, every text field a newly created string."""
+    rng = random.Random(seed)
+    week_days = list(WeekDay)
+    for i in range(number_of_courses):
+        yield (
+            f"Course {i % 500:03d}",
+            rng.choice([3, 4, 5, 6]),
+            rng.choice(week_days),
+            f"{rng.randint(7, 19)}:{rng.choice([0, 15, 30, 45]):02d}",
+            rng.choice([45, 60, 90, 120]),
+            f"Room {rng.randint(1, 40)}",
+            f"Lecturer {rng.randint(1, 200)}",
+        )
+
+
+def bytes_per_course(course_type, number_of_courses: int) -> float:
+    """Traced bytes that stay allocated per course after building them from rows."""
+    tracemalloc.start()
+    try:
+        courses = [course_type(*row) for row in course_rows(number_of_courses)]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / len(courses)
+
+
+def seconds(stage) -> float:
+    """Return the best of three runtimes of a stage in seconds."""
+    timings = []
+    for _ in range(3):
+        start = perf_counter()
+        stage()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    number_of_courses = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COURSES
+    rows = list(course_rows(number_of_courses))
+    timetable = Timetable([Course(*row) for row in rows])
+
+    print(f"{'':<24}{number_of_courses:>12} courses")
+    for course_type in (Course, FrozenCourse):
+        print(f"{course_type.__name__ + ' memory':<24}"
+              f"{bytes_per_course(course_type, number_of_courses):>12.1f} B/course")
+    print(f"{'Course creation':<24}{seconds(lambda: [Course(*row) for row in rows]) * 1e3:>12.1f} ms")
+    print(f"{'Timetable.to_df':<24}{seconds(timetable.to_df) * 1e3:>12.1f} ms")
@@ -0,0 +1,48 @@
+"""Compare build time and payload size of the dynamic render modes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_dynamic_render
+
+Every size is built twice, as a validated figure (display_timetable) and
+as a raw figure dict (figure_dict), and both are written as html.
+"""
+from time import perf_counter
+
+import plotly.io as pio
+
+from benchmarks.synthetic import synthetic_courses
+from src.study_planner.dynamic_timetable import DynamicTimetable
+from src.study_planner.themes import LightTheme
+from src.study_planner.timetable import RenderMode
+
+SIZES = {
+    RenderMode.PER_COURSE: [10, 100, 300],
+    RenderMode.BATCHED: [10, 100, 300, 1_000, 3_000, 10_000],
+}
+
+
+def bench(render_mode: RenderMode, number_of_courses: int, build) -> tuple[float, float, int]:
+    """Return the build and html export time in seconds and the html size in bytes."""
+    layout = DynamicTimetable(
+        synthetic_courses(number_of_courses), LightTheme(), (10, 8), "Bench", render_mode
+    )
+    build(layout)  # fill the skeleton caches
+    start = perf_counter()
+    fig = build(layout)
+    built = perf_counter()
+    html = pio.to_html(fig, include_plotlyjs="cdn", validate=False)
+    return built - start, perf_counter() - start, len(html)
+
+
+if __name__ == "__main__":
+    builds = {
+        "figure": DynamicTimetable.display_timetable,
+        "dict": DynamicTimetable.figure_dict,
+    }
+    print(f"{'mode':<12}{'courses':>10}{'build':>8}{'build [s]':>12}{'html [s]':>12}{'payload [kB]':>15}")
+    for mode, sizes in SIZES.items():
+        for n in sizes:
+            for name, build in builds.items():
+                built, exported, size = bench(mode, n, build)
+                print(f"{mode:<12}{n:>10}{name:>8}{built:>12.4f}{exported:>12.4f}{size / 1024:>15.1f}")
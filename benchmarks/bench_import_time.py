@@ -0,0 +1,44 @@
+"""Measure the cold start import time of the entry points.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time
+
+Every module is imported in a fresh interpreter with ``-X importtime``.
+The script also lists which plotting stacks were loaded by the import,
+since the backends should only be imported once a layout is chosen.
+"""
+import ast
+import subprocess
+import sys
+
+MODULES = ["src.main", "src.study_planner.auto_generation", "src.study_planner.helper_functions"]
+HEAVY_MODULES = ["matplotlib.pyplot", "plotly.graph_objects"]
+REPEATS = 5
+
+
+def import_time_us(module: str) -> tuple[int, list[str]]:
+    """Return the cumulative import time in microseconds and the heavy modules loaded."""
+    check = f"import sys, {module}; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        fields = [f.strip() for f in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            cumulative = int(fields[1])
+    return cumulative, ast.literal_eval(result.stdout)
+
+
+if __name__ == "__main__":
+    print(f"{'module':<40}{'import [ms]':>12}  heavy modules")
+    for module in MODULES:
+        timings = []
+        for _ in range(REPEATS):
+            cumulative, heavy = import_time_us(module)
+            timings.append(cumulative)
+        print(f"{module:<40}{min(timings) / 1000:>12.1f}  {', '.join(heavy) or '-'}")
@@ -0,0 +1,76 @@
+"""Measure the latency of the render service under concurrent load.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render_service
+    python -m benchmarks.bench_render_service --clients 64 --requests 512 --workers 4
+
+Every client sends distinct timetables back to back, so nothing is
+coalesced. Rejected requests are counted and left out of the latencies.
+"""
+import argparse
+import asyncio
+import json
+from time import perf_counter
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_courses
+from src.study_planner.render_service import RenderService, ServiceBusy
+
+
+def request_bodies(number_of_requests: int, number_of_courses: int) -> list[bytes]:
+    """Distinct json render requests, every one for another user."""
+    courses = [
+        {"course_name": c.course_name, "credits": c.credits, "week_day": str(c.week_day),
+         "start_time": c.start_time, "duration_minutes": c.duration_minutes, "room": c.room,
+         "lecturer": c.lecturer}
+        for c in synthetic_courses(number_of_courses)
+    ]
+    return [
+        json.dumps({"courses": courses, "user": f"User {i}", "figsize": [10, 8]}).encode()
+        for i in range(number_of_requests)
+    ]
+
+
+async def run_load(args) -> tuple[list[float], int]:
+    """Send all requests from the clients and return the latencies and rejections."""
+    bodies = request_bodies(args.requests, args.courses)
+    latencies = []
+    rejected = 0
+
+    async with RenderService(args.workers, args.max_queue) as service:
+        # Warm the workers up, so process start up is not measured.
+        await asyncio.gather(*(service.render(body) for body in bodies[:args.workers]))
+
+        async def client(first: int):
+            nonlocal rejected
+            for body in bodies[first::args.clients]:
+                start = perf_counter()
+                try:
+                    await service.render(body)
+                except ServiceBusy:
+                    rejected += 1
+                    await asyncio.sleep(0.01)
+                else:
+                    latencies.append(perf_counter() - start)
+
+        await asyncio.gather(*(client(i) for i in range(args.clients)))
+    return latencies, rejected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=256)
+    parser.add_argument("--courses", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=8)
+    args = parser.parse_args()
+
+    start = perf_counter()
+    latencies, rejected = asyncio.run(run_load(args))
+    elapsed = perf_counter() - start
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    print(f"{len(latencies)} rendered, {rejected} rejected in {elapsed:.1f} s")
+    print(f"p50 {p50:.0f} ms  p99 {p99:.0f} ms  max {max(latencies) * 1e3:.0f} ms")
@@ -0,0 +1,63 @@
+"""Check that course geometry and batched rendering scale linearly.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scaling
+
+The script exits with a non-zero status when the time per course at the
+largest size is more than ``MAX_SLOWDOWN`` times the time per course at
+the smallest size.
+"""
+import sys
+from time import perf_counter
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from benchmarks.synthetic import synthetic_courses
+from src.study_planner.dynamic_timetable import DynamicTimetable
+from src.study_planner.static_timetable import StaticTimetable
+from src.study_planner.themes import LightTheme
+from src.study_planner.timetable import RenderMode
+
+SIZES = [1_000, 2_500, 5_000, 10_000]
+MAX_SLOWDOWN = 3.0
+
+
+def time_per_course(stage, number_of_courses: int) -> float:
+    """Return the best of three timings of a stage divided by the number of courses."""
+    courses = synthetic_courses(number_of_courses)
+    timings = []
+    for _ in range(3):
+        start = perf_counter()
+        stage(courses)
+        timings.append(perf_counter() - start)
+    return min(timings) / number_of_courses
+
+
+def geometry(courses):
+    StaticTimetable(courses, LightTheme(), (10, 8), "Bench").compute_course_geometry()
+
+
+def static_batched(courses):
+    fig = StaticTimetable(courses, LightTheme(), (10, 8), "Bench", RenderMode.BATCHED).display_timetable()
+    plt.close(fig)
+
+
+def dynamic_batched(courses):
+    DynamicTimetable(courses, LightTheme(), (10, 8), "Bench", RenderMode.BATCHED).display_timetable()
+
+
+if __name__ == "__main__":
+    failed = False
+    for stage in (geometry, static_batched, dynamic_batched):
+        per_course = [time_per_course(stage, n) for n in SIZES]
+        slowdown = per_course[-1] / per_course[0]
+        failed |= slowdown > MAX_SLOWDOWN
+        timings = "  ".join(f"{n}: {t * 1e6:.1f}us" for n, t in zip(SIZES, per_course))
+        print(f"{stage.__name__:<16}{timings}  slowdown x{slowdown:.2f}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,50 @@
+"""Time the schedule solver on synthetic course catalogs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scheduler
+"""
+import random
+from time import perf_counter
+
+from src.study_planner.conflicts import validate_no_conflicts
+from src.study_planner.scheduler import SessionRequest, schedule_courses
+from src.study_planner.timetable import WeekDay
+
+SIZES = [100, 500, 1_000, 2_000, 5_000]
+
+
+def synthetic_requests(number_of_sessions: int, seed: int = 0) -> list[SessionRequest]:
+    """Reproducible catalog using about half of the available room time."""
+    rng = random.Random(seed)
+    week_days = list(WeekDay)
+    number_of_rooms = max(1, number_of_sessions // 40)
+    number_of_lecturers = max(1, number_of_sessions // 8)
+
+    requests = []
+    for i in range(number_of_sessions):
+        allowed_days = tuple(sorted(rng.sample(week_days, rng.randint(2, 7)), key=week_days.index))
+        requests.append(
+            SessionRequest(
+                course_name=f"Course {i:05d}",
+                credits=rng.choice([3, 4, 5, 6]),
+                duration_minutes=rng.choice([45, 60, 90, 120]),
+                room=f"Room {rng.randrange(number_of_rooms)}",
+                lecturer=f"Lecturer {rng.randrange(number_of_lecturers)}",
+                allowed_days=allowed_days,
+                earliest_start="8:00",
+                latest_end="20:00",
+            )
+        )
+    return requests
+
+
+if __name__ == "__main__":
+    print(f"{'sessions':>10}{'solve [s]':>12}")
+    for n in SIZES:
+        requests = synthetic_requests(n)
+        start = perf_counter()
+        timetable = schedule_courses(requests, time_budget=60, seed=0)
+        elapsed = perf_counter() - start
+        validate_no_conflicts(timetable.courses)
+        print(f"{n:>10}{elapsed:>12.2f}")
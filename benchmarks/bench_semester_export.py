@@ -0,0 +1,67 @@
+"""Stream the semester calendars of many students to iCalendar.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_semester_export            # 10k students
+    python -m benchmarks.bench_semester_export 1000       # quicker run
+
+Every student has 12 weekly courses over a 15 week semester with a two
+week break. All calendars are written to one stream in turn, and the
+traced peak memory should not grow with the number of students. The
+peak can include one rebuild of the interpreter's table of interned
+strings (about 2 MB), which Course fills and empties student by student.
+"""
+from datetime import date
+import os
+import sys
+from time import perf_counter
+import tracemalloc
+
+from benchmarks.synthetic import synthetic_courses
+from src.study_planner.semester import SemesterCalendar, expand_semester, write_ics
+
+DEFAULT_STUDENTS = 10_000
+COURSES_PER_STUDENT = 12
+
+
+def semester() -> SemesterCalendar:
+    """Fifteen teaching weeks plus a two week break over new year."""
+    calendar = SemesterCalendar(date(2026, 10, 12), date(2027, 2, 7))
+    calendar.add_break(date(2026, 12, 21), date(2027, 1, 3))
+    return calendar
+
+
+def export(number_of_students: int) -> tuple[int, float]:
+    """Return the number of events written and the runtime in seconds."""
+    calendar = semester()
+    events = 0
+    start = perf_counter()
+    with open(os.devnull, "w", encoding="utf-8", newline="") as stream:
+        for student in range(number_of_students):
+            # Each student's courses exist only while their calendar is written.
+            courses = synthetic_courses(COURSES_PER_STUDENT, seed=student)
+            events += write_ics(expand_semester(courses, calendar), stream, f"Student {student}")
+    return events, perf_counter() - start
+
+
+def peak_bytes(number_of_students: int) -> int:
+    """Traced peak memory of an export, after a warm up student."""
+    export(1)
+    tracemalloc.start()
+    try:
+        export(number_of_students)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    number_of_students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    events, elapsed = export(number_of_students)
+    print(f"{number_of_students} students, {events} events in {elapsed:.2f} s "
+          f"({elapsed / events * 1e6:.1f} us/event)")
+
+    # Tracing is slow, so the memory is compared on smaller exports.
+    for n in (number_of_students // 100, number_of_students // 10):
+        print(f"{'peak memory':<14}{max(n, 1):>8} students{peak_bytes(max(n, 1)) / 1024:>10.1f} kB")
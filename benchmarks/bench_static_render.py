@@ -0,0 +1,43 @@
+"""Compare draw time of the per-artist and the collection based static renderer.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_static_render
+"""
+from io import BytesIO
+from time import perf_counter
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from benchmarks.synthetic import synthetic_courses
+from src.study_planner.static_timetable import StaticTimetable
+from src.study_planner.themes import LightTheme
+from src.study_planner.timetable import RenderMode
+
+SIZES = [10, 100, 300, 1_000]
+
+
+def bench(render_mode: RenderMode, number_of_courses: int) -> tuple[float, float]:
+    """Return the build time and the time to save the figure as png in seconds."""
+    layout = StaticTimetable(
+        synthetic_courses(number_of_courses), LightTheme(), (10, 8), "Bench", render_mode
+    )
+    start = perf_counter()
+    fig = layout.display_timetable()
+    built = perf_counter()
+    fig.savefig(BytesIO(), format="png")
+    saved = perf_counter()
+    plt.close(fig)
+    return built - start, saved - built
+
+
+if __name__ == "__main__":
+    print(f"{'mode':<12}{'courses':>10}{'build [s]':>12}{'savefig [s]':>14}")
+    for n in SIZES:
+        for mode in RenderMode:
+            build, save = bench(mode, n)
+            print(f"{mode:<12}{n:>10}{build:>12.3f}{save:>14.3f}")
@@ -0,0 +1,203 @@
+"""Measure the load, layout and render hot paths and compare them to stored baselines.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_suite                    # compare to baselines.json
+    python -m benchmarks.bench_suite --update-baseline  # store new baselines
+    python -m benchmarks.bench_suite --max-courses 1000 # quick run
+
+Every stage is timed without tracing (best of ``--repeat`` runs, a single
+run from 10k courses) and then run once more under tracemalloc for its
+peak memory. Render stages also
+report the size of the rendered figure: png bytes for the static and json
+bytes for the dynamic timetable. The script exits with a non-zero status
+when a measurement exceeds its baseline by more than ``--tolerance``.
+"""
+import argparse
+from dataclasses import asdict, dataclass
+from io import BytesIO
+import json
+from pathlib import Path
+import sys
+import tempfile
+from time import perf_counter
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from benchmarks.synthetic import synthetic_courses
+from src.study_planner.dynamic_timetable import DynamicTimetable
+from src.study_planner.helper_functions import load_course_table
+from src.study_planner.static_timetable import StaticTimetable
+from src.study_planner.themes import LightTheme
+from src.study_planner.timetable import RenderMode, Timetable
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+BASELINE_FILE = Path(__file__).with_name("baselines.json")
+
+# Measurements smaller than these are too noisy to compare.
+_MIN_SECONDS: float = 0.005
+_MIN_BYTES: int = 64 * 1024
+
+
+@dataclass
+class Measurement:
+    """Result of one stage at one number of courses."""
+    seconds: float
+    peak_bytes: int
+    payload_bytes: int | None = None
+
+
+def load_stage(csv_file: Path):
+    """Parse a course csv file into a course table."""
+    return lambda: load_course_table(str(csv_file))
+
+
+def layout_stage(csv_file: Path):
+    """Compute the course geometry and the y-range of a timetable."""
+    layout = StaticTimetable(load_course_table(str(csv_file)), LightTheme(), (10, 8), "Bench")
+    return layout.calc_yrange_for_plotting
+
+
+def static_stage(csv_file: Path, render_mode: RenderMode = RenderMode.BATCHED):
+    """Build the matplotlib figure of a timetable."""
+    layout = StaticTimetable(
+        load_course_table(str(csv_file)), LightTheme(), (10, 8), "Bench", render_mode
+    )
+
+    def run():
+        fig = layout.display_timetable()
+        plt.close(fig)
+
+    def payload() -> int:
+        fig = layout.display_timetable()
+        stream = BytesIO()
+        fig.savefig(stream, format="png")
+        plt.close(fig)
+        return stream.tell()
+
+    return run, payload
+
+
+def static_per_course_stage(csv_file: Path):
+    """Build the matplotlib figure of a timetable with one artist per course."""
+    return static_stage(csv_file, RenderMode.PER_COURSE)
+
+
+def dynamic_stage(csv_file: Path):
+    """Build the plotly figure of a timetable."""
+    layout = DynamicTimetable(
+        load_course_table(str(csv_file)), LightTheme(), (10, 8), "Bench", RenderMode.BATCHED
+    )
+    return layout.display_timetable, lambda: len(layout.display_timetable().to_json().encode())
+
+
+# Stage factories with the largest number of courses they are run at. The
+# static timetable draws one label and legend entry per course, which takes
+# minutes beyond 10k courses, and one patch and text more per course when
+# drawn per course.
+STAGES = {
+    "load_course_table": (load_stage, SIZES[-1]),
+    "calc_yrange_for_plotting": (layout_stage, SIZES[-1]),
+    "static_display_timetable": (static_stage, 10_000),
+    "static_per_course_display_timetable": (static_per_course_stage, 1_000),
+    "dynamic_display_timetable": (dynamic_stage, SIZES[-1]),
+}
+
+# Sizes from which every stage is only timed once.
+_SINGLE_RUN_SIZE: int = 10_000
+
+
+def measure(stage, repeat: int) -> Measurement:
+    """Time a stage, then run it once more under tracemalloc for its peak memory."""
+    run, payload = stage if isinstance(stage, tuple) else (stage, None)
+
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(min(timings), peak, payload() if payload is not None else None)
+
+
+def run_suite(sizes: list[int], repeat: int) -> dict[str, dict]:
+    """Measure every stage at every size, keyed by ``stage/number_of_courses``."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            csv_file = Path(directory) / f"courses_{n}.csv"
+            Timetable(synthetic_courses(n)).to_df().to_csv(csv_file)
+
+            for name, (make_stage, max_courses) in STAGES.items():
+                if n > max_courses:
+                    continue
+                measurement = measure(make_stage(csv_file), repeat if n < _SINGLE_RUN_SIZE else 1)
+                results[f"{name}/{n}"] = asdict(measurement)
+                payload = measurement.payload_bytes
+                print(
+                    f"{name:<36}{n:>8}{measurement.seconds * 1e3:>12.2f} ms"
+                    f"{measurement.peak_bytes / 2**20:>10.2f} MiB"
+                    + (f"{payload / 2**10:>12.1f} KiB" if payload is not None else "")
+                )
+    return results
+
+
+def find_regressions(results: dict, baselines: dict, tolerance: float) -> list[str]:
+    """Describe every measurement that exceeds its baseline by more than the tolerance."""
+    regressions = []
+    for key, result in results.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            continue
+
+        for metric, minimum in (("seconds", _MIN_SECONDS), ("peak_bytes", _MIN_BYTES),
+                                ("payload_bytes", _MIN_BYTES)):
+            value, reference = result.get(metric), baseline.get(metric)
+            if value is None or reference is None or max(value, reference) < minimum:
+                continue
+            if value > reference * tolerance:
+                regressions.append(f"{key} {metric}: {value:.4g} > {reference:.4g} x {tolerance}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-courses", type=int, default=SIZES[-1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--baseline-file", type=Path, default=BASELINE_FILE)
+    args = parser.parse_args()
+
+    print(f"{'stage':<36}{'courses':>8}{'time':>15}{'peak':>14}{'payload':>16}")
+    results = run_suite([n for n in SIZES if n <= args.max_courses], args.repeat)
+
+    if args.update_baseline:
+        baselines = json.loads(args.baseline_file.read_text()) if args.baseline_file.exists() else {}
+        baselines.update(results)
+        args.baseline_file.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Stored {len(results)} baselines in {args.baseline_file}")
+        sys.exit(0)
+
+    if not args.baseline_file.exists():
+        print(f"No baselines in {args.baseline_file}, run with --update-baseline first.")
+        sys.exit(0)
+
+    regressions = find_regressions(
+        results, json.loads(args.baseline_file.read_text()), args.tolerance
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    sys.exit(1 if regressions else 0)
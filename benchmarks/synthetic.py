@@ -0,0 +1,24 @@
+import random
+
+from src.study_planner.timetable import Course, WeekDay
+
+
+def synthetic_courses(number_of_courses: int, seed: int = 0) -> list[Course]:
+    """Create reproducible random courses spread over all week days."""
+    rng = random.Random(seed)
+    week_days = list(WeekDay)
+
+    courses = []
+    for i in range(number_of_courses):
+        courses.append(
+            Course(
+                course_name=f"Course {i:05d}",
+                credits=rng.choice([3, 4, 5, 6]),
+                week_day=rng.choice(week_days),
+                start_time=f"{rng.randint(7, 19)}:{rng.choice([0, 15, 30, 45]):02d}",
+                duration_minutes=rng.choice([45, 60, 90, 120]),
+                room=f"Room {rng.randint(1, 40)}",
+                lecturer=f"Lecturer {rng.randint(1, 200)}",
+            )
+        )
+    return courses
@@ -1,6 +1,12 @@
+from contextlib import nullcontext
+from pathlib import Path
+
+from src.study_planner.course_io import iter_courses
+from src.study_planner.instrumentation import profiled, span
 from src.study_planner.timetable import Course
 from src.study_planner.helper_functions import LayoutType, TimetableTheme
-from src.study_planner.helper_functions import load_course_data, choose_layout, choose_theme
+from src.study_planner.helper_functions import choose_layout, choose_theme
+from src.study_planner.timetable_store import TimetableStore
 
 
 def auto_generation(
@@ -9,28 +15,33 @@ def auto_generation(
     theme,
     figsize_timetable: tuple[int, int],
     user: str,
+    output: Path | None = None,
+    store: TimetableStore | None = None,
+    profile: Path | bool = False,
 ) -> None:
     """
     Generate and display a timetable without CLI interaction.
+
+    If an output file is given, the timetable is exported to it instead of
+    being shown; the format is taken from the file suffix. With a timetable
+    store, filename is the name of a timetable stored in it. With profile
+    set, the render runs under cProfile and the stats are printed, or
+    dumped if profile is a path.
     """
-    df = load_course_data(filename)
-
-    courses: list[Course] = []
-
-    for subject, row in df.iterrows():
-        course = Course(
-            subject,
-            row["credits"],
-            row["week_day"],
-            row["start_time"],
-            row["duration_minutes"],
-            row["room"],
-            row["lecturer"]
-        )
-        courses.append(course)
+    with span("auto_generation.load_courses", file=filename):
+        if store is None:
+            courses: list[Course] = list(iter_courses(filename))
+        else:
+            courses = store.load(filename).to_courses()
 
     timetable = choose_layout(layout_type, courses, choose_theme(theme), figsize_timetable, user)
-    timetable.display_timetable().show()
+
+    capture = profiled(None if profile is True else profile) if profile else nullcontext()
+    with capture:
+        if output is not None:
+            timetable.export(output)
+        else:
+            timetable.display_timetable().show()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+import re
+from time import perf_counter
+
+import pandas as pd
+
+from src.study_planner.course_io import iter_course_batches
+from src.study_planner.helper_functions import LayoutType, TimetableTheme
+from src.study_planner.helper_functions import choose_layout, choose_theme
+from src.study_planner.render_cache import RenderCache
+from src.study_planner.timetable import CourseTable, ExportFormat, RenderMode
+
+# Workers are replaced after this many files so memory leaked by the
+# plotting libraries cannot pile up over a long batch.
+_MAX_TASKS_PER_WORKER: int = 50
+
+# Render cache of the current worker process, see init_worker.
+_worker_cache: RenderCache | None = None
+
+_OUTPUT_SUFFIX: dict[LayoutType, str] = {
+    LayoutType.STATIC: ".png",
+    LayoutType.DYNAMIC: ".html",
+}
+
+
+@dataclass
+class BatchJob:
+    """One timetable csv file to render for one user."""
+    source: Path
+    output: Path
+    user: str
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch run."""
+    rendered: list[Path] = field(default_factory=list)
+    failures: dict[Path, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Rendered timetables per second."""
+        if self.elapsed_seconds == 0:
+            return 0.0
+        return len(self.rendered) / self.elapsed_seconds
+
+    def summary(self) -> str:
+        """Human readable summary of the batch run."""
+        lines = [
+            f"Rendered {len(self.rendered)} timetables in {self.elapsed_seconds:.1f} s "
+            f"({self.throughput:.1f} per second), {len(self.failures)} failed."
+        ]
+        for source, error in self.failures.items():
+            lines.append(f"  {source.name}: {error}")
+        return "\n".join(lines)
+
+
+def collect_jobs(source: Path, output_dir: Path, layout_type: str) -> list[BatchJob]:
+    """Collect the render jobs from a directory of csv files or a manifest.
+
+    A directory renders every csv file in it for the user named like the
+    file. A manifest is a csv file with the columns ``filename`` and
+    ``user``; relative file names are resolved against the manifest folder.
+    Relative sources are resolved against the current working directory.
+    Files listed more than once are written once per user, named like the
+    file and the user. Raises a ValueError if two jobs would still write
+    the same output file.
+    """
+    suffix = _OUTPUT_SUFFIX[LayoutType(layout_type)]
+    source = source.absolute()
+
+    if source.is_dir():
+        pairs = [(path, path.stem) for path in sorted(source.glob("*.csv"))]
+    else:
+        manifest = pd.read_csv(source, dtype=str)
+        pairs = [
+            (source.parent / filename, user)
+            for filename, user in zip(manifest["filename"], manifest["user"])
+        ]
+
+    stems = Counter(path.stem for path, _ in pairs)
+    jobs = []
+    for path, user in pairs:
+        stem = path.stem if stems[path.stem] == 1 else f"{path.stem}_{_file_safe(user)}"
+        jobs.append(BatchJob(path, output_dir / f"{stem}{suffix}", user))
+
+    outputs = Counter(job.output for job in jobs)
+    duplicates = sorted(output.name for output, count in outputs.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Several jobs would write the same files: {', '.join(duplicates)}")
+
+    return jobs
+
+
+def batch_generation(
+    source: Path,
+    output_dir: Path,
+    layout_type: str,
+    theme,
+    figsize_timetable: tuple[int, int],
+    render_mode: RenderMode = RenderMode.BATCHED,
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+) -> BatchReport:
+    """Render many timetables to files in parallel without showing them.
+
+    Static timetables are written as png files using the non-GUI Agg
+    backend, dynamic timetables as html files linking plotly.js from a CDN.
+    Failing files are recorded in the report and do not stop the batch.
+    With a cache directory, unchanged timetables are copied from a shared
+    render cache instead of being rendered again.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = collect_jobs(source, output_dir, layout_type)
+    report = BatchReport()
+
+    start = perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=get_context("spawn"),
+        initializer=init_worker,
+        initargs=(cache_dir,),
+        max_tasks_per_child=_MAX_TASKS_PER_WORKER,
+    ) as executor:
+        futures = {
+            executor.submit(
+                render_job, job, layout_type, theme, figsize_timetable, render_mode
+            ): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                report.rendered.append(future.result())
+            except Exception as error:
+                report.failures[job.source] = f"{type(error).__name__}: {error}"
+
+    report.elapsed_seconds = perf_counter() - start
+    return report
+
+
+def init_worker(cache_dir: Path | None = None) -> None:
+    """Select the non-GUI matplotlib backend and open the render cache in a worker."""
+    global _worker_cache
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    if cache_dir is not None:
+        _worker_cache = RenderCache(cache_dir)
+
+
+def render_job(
+    job: BatchJob,
+    layout_type: str,
+    theme,
+    figsize_timetable: tuple[int, int],
+    render_mode: RenderMode,
+) -> Path:
+    """Render a single timetable csv file into its output file."""
+    courses = CourseTable.concat(list(iter_course_batches(str(job.source))))
+    timetable = choose_layout(
+        layout_type, courses, choose_theme(theme), figsize_timetable, job.user, render_mode
+    )
+
+    if _worker_cache is None:
+        timetable.export(job.output, self_contained=False)
+    else:
+        export_format = ExportFormat(job.output.suffix.lstrip("."))
+        job.output.write_bytes(_worker_cache.render(timetable, export_format, self_contained=False))
+
+    return job.output
+
+
+def _file_safe(name: str) -> str:
+    """Name with every run of characters other than letters, digits, dots and dashes replaced by _."""
+    return re.sub(r"[^\w.-]+", "_", name)
+
+
+if __name__ == "__main__":
+    from src.study_planner.helper_functions import DATA_DIR
+
+    batch_report = batch_generation(
+        source=DATA_DIR,
+        output_dir=DATA_DIR.parent / "output",
+        layout_type=LayoutType.STATIC,
+        theme=TimetableTheme.LIGHT,
+        figsize_timetable=(10, 10),
+    )
+    print(batch_report.summary())
@@ -1,10 +1,13 @@
-from datetime import datetime
 from pathlib import Path
 
+from src.study_planner.course_io import iter_courses
 from src.study_planner.helper_functions import LayoutType, TimetableTheme
-from src.study_planner.helper_functions import choose_layout, choose_theme, load_course_data
-from src.study_planner.helper_functions import DATA_DIR, _MAX_MINUTES_IN_A_DAY
-from src.study_planner.timetable import Course, Timetable, WeekDay
+from src.study_planner.helper_functions import choose_layout, choose_theme
+from src.study_planner.helper_functions import DATA_DIR, _MAX_CREDITS, _MAX_MINUTES_IN_A_DAY
+from src.study_planner.instrumentation import span
+from src.study_planner.timetable import Course, Timetable, WeekDay, minutes_since_midnight
+from src.study_planner.timetable_file import TIMETABLE_FILE_SUFFIX
+from src.study_planner.timetable_store import TimetableStore
 
 
 def show_welcome() -> str:
@@ -20,8 +23,11 @@ def instructions() -> str:
 
 
 def available_timetable_list(directory: Path) -> list[str]:
-    """List the csv files from the given directory"""
-    file_list = [path.name for path in directory.glob("*.csv")]
+    """List the csv and binary timetable files from the given directory"""
+    file_list = [
+        path.name for path in directory.iterdir()
+        if path.suffix in (".csv", TIMETABLE_FILE_SUFFIX)
+    ]
     return file_list
 
 
@@ -33,10 +39,10 @@ def get_user_inputs() -> Course:
     while True:
         try:
             credits = int(input("Enter credits: "))
-            if credits >= 0:
+            if 0 <= credits <= _MAX_CREDITS:
                 break
             else:
-                print("Invalid input. Credits must be a positive integer")
+                print(f"Invalid input. Please enter credits between 0 and {_MAX_CREDITS}.")
         except ValueError:
             print("Invalid input. Credits must be a positive integer")
 
@@ -50,7 +56,7 @@ def get_user_inputs() -> Course:
     while True:
         start = input("Enter start time (HH:MM) in 24 hour format: ")
         try:
-            datetime.strptime(start, "%H:%M")
+            minutes_since_midnight(start)
             break
         except ValueError:
             print("Invalid time. Please enter time in HH:MM (24-hour format).")
@@ -75,9 +81,14 @@ def get_user_inputs() -> Course:
 
 
 def cli_generation(
-        figsize_timetable: tuple[int, int]
+        figsize_timetable: tuple[int, int],
+        store: TimetableStore | None = None,
 ) -> None:
-    """Generate study-planner using a command line interface."""
+    """Generate study-planner using a command line interface.
+
+    With a timetable store, the timetables stored in it are offered
+    instead of the csv files in the data folder.
+    """
 
     print(show_welcome())
 
@@ -85,7 +96,10 @@ def cli_generation(
 
     print("The following timetables are available:\n")
 
-    timetable_list = available_timetable_list(DATA_DIR)
+    if store is None:
+        timetable_list = available_timetable_list(DATA_DIR)
+    else:
+        timetable_list = store.timetable_names()
 
     for i, file in enumerate(timetable_list, start = 1):
         print(f"{i}. {file}")
@@ -115,12 +129,16 @@ def cli_generation(
                     if choice != "y":
                         break
 
-                df = all_users_courses.to_df()
+                courses = all_users_courses.courses
                 break
 
             elif 1 <= selection <= len(timetable_list):
                 filename = timetable_list[selection - 1]
-                df = load_course_data(filename)
+                with span("cli_generation.load_courses", file=filename):
+                    if store is None:
+                        courses = list(iter_courses(filename))
+                    else:
+                        courses = store.load(filename).to_courses()
                 break
 
             else:
@@ -177,20 +195,6 @@ def cli_generation(
         except ValueError:
             print("Invalid choice. Please try again.")
 
-    courses = []
-
-    for i, (subject, row) in enumerate(df.iterrows()):
-        course = Course(
-            subject,
-            row["credits"],
-            row["week_day"],
-            row["start_time"],
-            row["duration_minutes"],
-            row["room"],
-            row["lecturer"]
-        )
-        courses.append(course)
-
     timetable = choose_layout(layout_type, courses, choose_theme(theme), figsize_timetable, user)
     timetable.display_timetable().show()
 
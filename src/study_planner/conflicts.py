@@ -0,0 +1,109 @@
+from enum import StrEnum
+
+import numpy as np
+import pandas as pd
+
+from src.study_planner.intervals import overlapping_pairs
+from src.study_planner.timetable import Course, CourseTable, WEEKDAYS
+
+_MINUTES_PER_DAY: int = 24 * 60
+_MINUTES_PER_WEEK: int = 7 * _MINUTES_PER_DAY
+
+_CONFLICT_COLUMNS = [
+    "first_index",
+    "second_index",
+    "first_course",
+    "second_course",
+    "week_day",
+    "start_time",
+    "overlap_minutes",
+]
+
+
+class ConflictType(StrEnum):
+    """Distinct kinds of overlapping sessions by name."""
+    WEEK_DAY = "week_day"
+    ROOM = "room"
+    LECTURER = "lecturer"
+
+
+def week_intervals(table: CourseTable) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end of every course in minutes since Sunday midnight.
+
+    Like calc_yrange_for_plotting, a session rolling past midnight simply
+    ends after 24:00 of its week day, so it also overlaps early sessions of
+    the following day.
+    """
+    start = table.week_day.astype(np.int64) * _MINUTES_PER_DAY + table.start_minutes
+    end = start + table.duration_minutes
+    return start, end
+
+
+def find_conflicts(
+    courses: list[Course] | CourseTable,
+    by: ConflictType = ConflictType.WEEK_DAY,
+) -> pd.DataFrame:
+    """Find all pairs of overlapping sessions.
+
+    ``week_day`` reports every overlap in time, ``room`` and ``lecturer``
+    only overlaps of sessions sharing the same room or lecturer. The result
+    has one row per pair with the day and start time of the overlap.
+    """
+    by = ConflictType(by)
+    table = courses if isinstance(courses, CourseTable) else CourseTable.from_courses(courses)
+    start, end = week_intervals(table)
+    index = np.arange(len(table))
+
+    if by == ConflictType.WEEK_DAY:
+        groups = np.zeros(len(table), dtype=np.int64)
+    else:
+        groups = np.asarray(getattr(table, by).codes, dtype=np.int64)
+
+    # Sessions running past Saturday midnight continue on Sunday morning.
+    wraps = end > _MINUTES_PER_WEEK
+    start = np.concatenate([start, start[wraps] - _MINUTES_PER_WEEK])
+    end = np.concatenate([end, end[wraps] - _MINUTES_PER_WEEK])
+    groups = np.concatenate([groups, groups[wraps]])
+    index = np.concatenate([index, index[wraps]])
+
+    pairs = np.array(overlapping_pairs(start, end, groups), dtype=np.int64).reshape(-1, 2)
+    a, b = pairs[:, 0], pairs[:, 1]
+    first = np.minimum(index[a], index[b])
+    second = np.maximum(index[a], index[b])
+    overlap_start = np.maximum(start[a], start[b]) % _MINUTES_PER_WEEK
+    overlap_minutes = np.minimum(end[a], end[b]) - np.maximum(start[a], start[b])
+    minutes = overlap_start % _MINUTES_PER_DAY
+
+    df = pd.DataFrame({
+        "first_index": first,
+        "second_index": second,
+        "first_course": np.asarray(table.course_name)[first],
+        "second_course": np.asarray(table.course_name)[second],
+        "week_day": np.array([day.value for day in WEEKDAYS])[overlap_start // _MINUTES_PER_DAY],
+        "start_time": [f"{m // 60:02d}:{m % 60:02d}" for m in minutes.tolist()],
+        "overlap_minutes": overlap_minutes,
+    }, columns=_CONFLICT_COLUMNS)
+
+    df = df[df["first_index"] != df["second_index"]]
+    df = df.drop_duplicates(["first_index", "second_index"])
+    if by != ConflictType.WEEK_DAY:
+        df.insert(4, str(by), np.asarray(getattr(table, by))[df["first_index"].to_numpy()])
+    return df.sort_values(["first_index", "second_index"], ignore_index=True)
+
+
+def validate_no_conflicts(
+    courses: list[Course] | CourseTable,
+    by: tuple[ConflictType, ...] = (ConflictType.ROOM, ConflictType.LECTURER),
+) -> None:
+    """Raise a ValueError listing the clashes if sessions share a room or lecturer."""
+    messages = []
+
+    for conflict_type in by:
+        for row in find_conflicts(courses, conflict_type).itertuples():
+            messages.append(
+                f"{row.first_course} and {row.second_course} overlap on {row.week_day} "
+                f"at {row.start_time} ({conflict_type})"
+            )
+
+    if messages:
+        raise ValueError("Conflicting sessions:\n" + "\n".join(messages))
@@ -0,0 +1,202 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.study_planner.helper_functions import DATA_DIR, _MAX_CREDITS, _MAX_MINUTES_IN_A_DAY
+from src.study_planner.instrumentation import span
+from src.study_planner.timetable import Course, CourseTable, WEEKDAYS
+from src.study_planner.timetable import _parse_times
+from src.study_planner.timetable_file import TIMETABLE_FILE_SUFFIX, TimetableFile
+from src.study_planner.timetable_file import write_timetable_file
+
+COURSE_COLUMNS: list[str] = [
+    "course_name",
+    "credits",
+    "week_day",
+    "start_time",
+    "duration_minutes",
+    "room",
+    "lecturer",
+]
+
+# Dtypes used while reading. Numbers are read as text first, so that a bad
+# value is reported for its row instead of failing the whole chunk.
+COURSE_SCHEMA: dict[str, str] = {
+    "course_name": "string",
+    "credits": "string",
+    "week_day": "category",
+    "start_time": "string",
+    "duration_minutes": "string",
+    "room": "category",
+    "lecturer": "category",
+}
+
+_DEFAULT_CHUNKSIZE: int = 50_000
+
+# Number of row errors quoted when a file is rejected.
+_MAX_REPORTED_ERRORS: int = 5
+
+
+@dataclass
+class RowError:
+    """One invalid value in a course csv file, rows are counted from 1."""
+    row: int
+    column: str
+    value: object
+    message: str
+
+    def __str__(self) -> str:
+        return f"row {self.row}, {self.column}={self.value!r}: {self.message}"
+
+
+def iter_course_batches(
+    file: str,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    errors: list[RowError] | None = None,
+) -> Iterator[CourseTable]:
+    """Stream a course csv file as validated course tables of at most chunksize rows.
+
+    Without an error list, the first invalid chunk raises a ValueError
+    describing its bad rows. With an error list, invalid rows are skipped
+    and their errors are appended to it. Binary timetable files are read
+    in the same chunks, they were validated when they were written.
+    """
+    filepath = DATA_DIR / file
+
+    if filepath.suffix == TIMETABLE_FILE_SUFFIX:
+        timetable_file = TimetableFile(filepath)
+        for start in range(0, len(timetable_file), chunksize):
+            yield timetable_file[start:start + chunksize]
+        return
+
+    header = pd.read_csv(filepath, nrows=0).columns
+    missing = [column for column in COURSE_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"{file} is missing the columns: {', '.join(missing)}")
+
+    first_row = 1
+    with pd.read_csv(
+        filepath,
+        usecols=COURSE_COLUMNS,
+        dtype=COURSE_SCHEMA,
+        chunksize=chunksize,
+        skipinitialspace=True,
+    ) as reader:
+        while True:
+            with span("course_io.parse_chunk", file=file):
+                chunk = next(reader, None)
+            if chunk is None:
+                break
+
+            with span("course_io.validate_chunk", rows=len(chunk)):
+                table = validate_chunk(chunk, first_row, errors)
+            yield table
+            first_row += len(chunk)
+
+
+def iter_courses(
+    file: str,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    errors: list[RowError] | None = None,
+) -> Iterator[Course]:
+    """Stream the courses of a csv file one by one, see iter_course_batches."""
+    for batch in iter_course_batches(file, chunksize, errors):
+        with span("course_io.to_courses", rows=len(batch)):
+            courses = list(batch)
+        yield from courses
+
+
+def csv_to_timetable_file(
+    csv_file: str,
+    timetable_file: str,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+) -> None:
+    """Convert a course csv file into a binary timetable file.
+
+    Both file names are resolved against the data folder like in the loaders.
+    """
+    table = CourseTable.concat(list(iter_course_batches(csv_file, chunksize)))
+    write_timetable_file(DATA_DIR / timetable_file, table)
+
+
+def timetable_file_to_csv(timetable_file: str, csv_file: str) -> None:
+    """Convert a binary timetable file back into a course csv file."""
+    table = TimetableFile(DATA_DIR / timetable_file).table()
+    table.to_df().to_csv(DATA_DIR / csv_file)
+
+
+def courses_from_records(records: list[dict]) -> CourseTable:
+    """Validate course records with the csv columns, e.g. parsed from json, like a csv file.
+
+    Raises a ValueError describing the invalid rows.
+    """
+    chunk = pd.DataFrame(records, columns=COURSE_COLUMNS).astype(COURSE_SCHEMA)
+    return validate_chunk(chunk, 1, None)
+
+
+def validate_chunk(
+    chunk: pd.DataFrame, first_row: int, errors: list[RowError] | None
+) -> CourseTable:
+    """Convert a raw chunk into a course table, reporting the invalid rows.
+
+    Rows are counted from first_row. Without an error list the invalid rows
+    raise a ValueError, otherwise they are skipped and their errors appended.
+    """
+    found: list[tuple[np.ndarray, str, str]] = []
+
+    found.append((chunk["course_name"].isna().to_numpy(), "course_name", "is empty"))
+
+    credits = pd.to_numeric(chunk["credits"].astype(object), errors="coerce")
+    found.append((
+        ~((credits >= 0) & (credits <= _MAX_CREDITS) & (credits % 1 == 0)).to_numpy(dtype=bool),
+        "credits",
+        f"must be an integer between 0 and {_MAX_CREDITS}",
+    ))
+
+    week_day = pd.Categorical(chunk["week_day"], categories=WEEKDAYS)
+    found.append((week_day.codes < 0, "week_day", "must be a week day (Sunday, ..., Saturday)"))
+
+    start_minutes, invalid_times = _parse_times(
+        chunk["start_time"].to_numpy(dtype=object, na_value=None)
+    )
+    found.append((invalid_times, "start_time", "must be HH:MM in 24 hour format"))
+
+    duration = pd.to_numeric(chunk["duration_minutes"].astype(object), errors="coerce")
+    found.append((
+        ~((duration >= 0) & (duration <= _MAX_MINUTES_IN_A_DAY) & (duration % 1 == 0))
+        .to_numpy(dtype=bool),
+        "duration_minutes",
+        f"must be a whole number of minutes between 0 and {_MAX_MINUTES_IN_A_DAY}",
+    ))
+
+    invalid = np.zeros(len(chunk), dtype=bool)
+    chunk_errors = []
+    for mask, column, message in found:
+        invalid |= mask
+        for row in np.flatnonzero(mask).tolist():
+            value = chunk[column].iloc[row]
+            value = None if pd.isna(value) else value
+            chunk_errors.append(RowError(first_row + row, column, value, message))
+
+    if chunk_errors:
+        chunk_errors.sort(key=lambda error: error.row)
+        if errors is None:
+            details = "; ".join(str(error) for error in chunk_errors[:_MAX_REPORTED_ERRORS])
+            if len(chunk_errors) > _MAX_REPORTED_ERRORS:
+                details += f"; ... ({len(chunk_errors)} errors in this chunk)"
+            raise ValueError(f"Invalid course data: {details}")
+        errors.extend(chunk_errors)
+
+    valid = ~invalid
+    return CourseTable(
+        course_name=pd.Categorical(chunk["course_name"][valid].astype(object)),
+        credits=credits[valid].to_numpy(dtype=np.int16),
+        week_day=week_day.codes[valid].astype(np.int8),
+        start_time=pd.Categorical(chunk["start_time"][valid].astype(object)),
+        start_minutes=start_minutes[valid],
+        duration_minutes=duration[valid].to_numpy(dtype=np.int16),
+        room=pd.Categorical(chunk["room"][valid]),
+        lecturer=pd.Categorical(chunk["lecturer"][valid]),
+    )
@@ -1,35 +1,139 @@
+import base64
 from datetime import time
+import json
+from io import TextIOBase
+from pathlib import Path
 
 import matplotlib.colors as mcolors
 from matplotlib.figure import Figure
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
+from src.study_planner.instrumentation import instrumented
+from src.study_planner.timetable import CourseGeometry, ExportFormat, RenderMode, SkeletonCache
 from src.study_planner.timetable import TimetableLayout, WeekDay
-from src.study_planner.timetable import minutes_since_midnight
+
+# The header draws one rectangle and one label per week day, the layout one
+# line per week day, so the shapes and labels of the courses follow those.
+_FIRST_COURSE_SHAPE: int = 2 * len(WeekDay)
+_FIRST_COURSE_ANNOTATION: int = len(WeekDay)
+
+# Figures with header, grid and hour axis, see DynamicTimetable.display_timetable,
+# and the same skeletons as json for DynamicTimetable.figure_dict.
+_SKELETONS = SkeletonCache()
+_SKELETON_JSON = SkeletonCache()
+
+_BAR_HOVERTEMPLATE: str = (
+    "<b>%{customdata[0]}</b> "
+    "<br> %{customdata[1]}"
+    "<br> %{customdata[2]}"
+    "<br> %{customdata[3]}"
+    "<br> %{customdata[4]}"
+    "<extra></extra>"
+)
 
 
 class DynamicTimetable(TimetableLayout):
     """Dynamic Timetable Layout"""
+    export_formats = (ExportFormat.HTML,)
+
+    @instrumented
     def display_timetable(self) -> Figure:
-        """Plotting the timetable with courses."""
+        """Plotting the timetable with courses.
+
+        The figure starts as a copy of a skeleton shared with every
+        timetable of the same theme, size and y-range, only the title and
+        the courses are added per timetable.
+        """
+        geometry = self.compute_course_geometry()
+        y_ticks = self.calc_yrange_for_plotting(geometry)
+        skeleton = _SKELETONS.get(self.skeleton_key(y_ticks), lambda: self._skeleton(geometry))
+
+        fig = go.Figure(skeleton)
+        fig.update_layout(title_text=f"{self.user}'s Study Timetable")
+        self.display_courses(fig, geometry)
+
+        return fig
+
+    @instrumented
+    def figure_dict(self) -> dict:
+        """Build the same figure as display_timetable as a plain dict.
+
+        Only the skeleton goes through the graph_objects validation, once
+        per theme, size and y-range. The courses are written as plain
+        dicts with numeric columns as base64 typed arrays, which plotly.js
+        decodes into the same values. The skeleton is cached as json and
+        parsed for every call, so callers may change the returned dict.
+        """
+        geometry = self.compute_course_geometry()
+        y_ticks = self.calc_yrange_for_plotting(geometry)
+        key = self.skeleton_key(y_ticks)
+        skeleton = _SKELETON_JSON.get(
+            key, lambda: _SKELETONS.get(key, lambda: self._skeleton(geometry)).to_json()
+        )
+
+        layout = json.loads(skeleton)["layout"]
+        layout["title"]["text"] = f"{self.user}'s Study Timetable"
+        data = []
+
+        font_color = mcolors.to_hex(self.theme.font_color)
+        if self.render_mode == RenderMode.BATCHED:
+            if self.courses:
+                layout["barmode"] = "overlay"
+                data.extend(self._raw_batched_traces(geometry, font_color))
+        else:
+            for values in zip(
+                self.courses,
+                (geometry.x * 100).tolist(),
+                (geometry.widths * 100).tolist(),
+                geometry.start_minutes.tolist(),
+                geometry.durations.tolist(),
+                geometry.end_minutes.tolist(),
+                geometry.hex_colors,
+            ):
+                shape, annotation, hover = self._raw_course(*values, font_color)
+                layout["shapes"].append(shape)
+                layout["annotations"].append(annotation)
+                data.append(hover)
+
+        return {"data": data, "layout": layout}
+
+    def _skeleton(self, geometry: CourseGeometry) -> go.Figure:
+        """Build header, grid and hour axis without courses."""
         height_ratios = [1, 8]
 
         fig = make_subplots(
             2, 1, shared_xaxes=True, vertical_spacing=0, row_heights=height_ratios
         )
-        fig.update_layout(title=f"{self.user}'s Study Timetable")
         fig.update_layout(title_font_color=mcolors.to_hex(self.theme.theme_color),
                           title_font_shadow="auto")
         fig.update_xaxes(visible=False, col=1, row=2)
         fig.update_xaxes(range=[0, self.figsize_timetable[0] * 100], row=2, col=1)
 
         self.create_timetable_header(fig)
-        self.create_timetable_layout(fig)
-        self.display_courses(fig)
+        self.create_timetable_layout(fig, geometry)
 
         return fig
 
+    def export_figure(self) -> dict:
+        """Exports are written from the unvalidated figure dict."""
+        return self.figure_dict()
+
+    @instrumented
+    def write_figure(self, fig, target, export_format: ExportFormat, self_contained: bool) -> None:
+        """Write a figure or figure dict as html, embedding plotly.js or linking it from a CDN."""
+        html = pio.to_html(fig, include_plotlyjs=True if self_contained else "cdn", validate=False)
+
+        if isinstance(target, (str, Path)):
+            Path(target).write_text(html, encoding="utf-8")
+        elif isinstance(target, TextIOBase):
+            target.write(html)
+        else:
+            target.write(html.encode("utf-8"))
+
+    @instrumented
     def create_timetable_header(self, fig):
         """Creating timetable header with week days."""
 
@@ -61,10 +165,11 @@ class DynamicTimetable(TimetableLayout):
             )
         fig.update_yaxes(range=[0, 1], visible=False, col=1, row=1)
 
-    def create_timetable_layout(self, fig):
+    @instrumented
+    def create_timetable_layout(self, fig, geometry: CourseGeometry | None = None):
         """Creating timetable layout"""
 
-        y_ticks = self.calc_yrange_for_plotting()
+        y_ticks = self.calc_yrange_for_plotting(geometry)
         day_lines = [
             i * self.figsize_timetable[0] * 100 / len(WeekDay)
             for i, _ in enumerate(WeekDay)
@@ -93,63 +198,273 @@ class DynamicTimetable(TimetableLayout):
         )
 
 
-    def display_courses(self, fig):
+    @instrumented
+    def display_courses(self, fig, geometry: CourseGeometry | None = None):
         """Plotting the courses into the timetable layout."""
+        if geometry is None:
+            geometry = self.compute_course_geometry()
 
-        day_width = self.figsize_timetable[0] / len(WeekDay)
+        if self.render_mode == RenderMode.BATCHED:
+            self.display_courses_batched(fig, geometry)
+            return
 
-        for i_subject, subject in enumerate(self.courses):
-            day_to_x = {
-                day: i * self.figsize_timetable[0] / len(WeekDay) for i, day in enumerate(WeekDay)
-            }
-            x = day_to_x[subject.week_day]
-            endtime_minutes = minutes_since_midnight(subject.start_time) + subject.duration_minutes
-            endtime_hours = (endtime_minutes // 60) % 24
-            endtime_minutes_left = endtime_minutes % 60
-            endtime = time(hour = endtime_hours, minute=endtime_minutes_left)
-            y = minutes_since_midnight(subject.start_time)
+        font_color = mcolors.to_hex(self.theme.font_color)
 
-            fig.add_shape(
-                type="rect",
-                x0=x * 100,
-                x1=x * 100 + day_width * 100,
-                y1=y,
-                y0=y + int(subject.duration_minutes),
-                xref="x2",
-                yref="y2",
-                fillcolor=mcolors.to_hex(self.theme.color_list(len(self.courses))[i_subject]),
-                col=1,
-                row=2,
-            )
-            fig.add_annotation(
-                x=(x * 100 + 0.5 * day_width * 100),
-                y=y + 0.5 * int(subject.duration_minutes),
-                text=f"{subject.course_name[:6]}",
-                showarrow=False,
-                col=1,
-                row=2,
-                font={"color": mcolors.to_hex(self.theme.font_color)},
+        for subject, x, width, y, duration, end, color in zip(
+            self.courses,
+            (geometry.x * 100).tolist(),
+            (geometry.widths * 100).tolist(),
+            geometry.start_minutes.tolist(),
+            geometry.durations.tolist(),
+            geometry.end_minutes.tolist(),
+            geometry.hex_colors,
+        ):
+            shape, annotation, hover = self._course_properties(
+                subject, x, width, y, duration, end, color, font_color
             )
+            fig.add_shape(type="rect", xref="x2", yref="y2", col=1, row=2, **shape)
+            fig.add_annotation(showarrow=False, col=1, row=2, font={"color": font_color}, **annotation)
             # add hover info:
             fig.add_trace(
-                go.Scatter(
-                    x=[x * 100 + 0.5 * day_width * 100],
-                    y=[y + 0.5 * int(subject.duration_minutes)],
-                    marker=dict(
-                        size=int(subject.duration_minutes), opacity=0
-                    ),
-                    mode="markers",
-                    hovertemplate=f"<b>{subject.course_name}</b> "
-                                  f"<br> {subject.lecturer}"
-                                  f"<br> {subject.room}"
-                                  f"<br> {subject.start_time}"
-                                  f"<br> {endtime}"
-                                  f"<extra></extra>",
-                    hoverlabel=dict(bgcolor=mcolors.to_hex(self.theme.color_list(len(self.courses))[i_subject]),
-                                    font_color=mcolors.to_hex(self.theme.font_color),
-                                    bordercolor=mcolors.to_hex(self.theme.font_color)),
-                    showlegend=False,
-                ),
+                go.Scatter(mode="markers", showlegend=False, **hover),
                 row=2,
                 col=1,
-            )
\ No newline at end of file
+            )
+
+    @instrumented
+    def display_courses_batched(self, fig, geometry: CourseGeometry):
+        """Plotting all courses as one bar trace and one text trace.
+
+        Course blocks are drawn as bars with an explicit base, so the figure
+        only grows by two traces regardless of the number of courses. The
+        hover information is carried through customdata.
+        """
+        if not self.courses:
+            return
+
+        font_color = mcolors.to_hex(self.theme.font_color)
+        bars, labels = self._batched_properties(geometry)
+
+        fig.update_layout(barmode="overlay")
+        fig.add_trace(
+            go.Bar(
+                hovertemplate=_BAR_HOVERTEMPLATE,
+                showlegend=False,
+                **bars,
+            ),
+            row=2,
+            col=1,
+        )
+        fig.add_trace(
+            go.Scatter(
+                mode="text",
+                textfont=dict(color=font_color),
+                hoverinfo="skip",
+                showlegend=False,
+                **labels,
+            ),
+            row=2,
+            col=1,
+        )
+
+    def draw_course(self, index: int, geometry: CourseGeometry) -> None:
+        """Add the shape, label and hover trace of one new course to the open figure."""
+        if self.render_mode == RenderMode.BATCHED:
+            self._refresh_batched(geometry)
+            return
+
+        font_color = mcolors.to_hex(self.theme.font_color)
+        shape, annotation, hover = self._course_properties(
+            *self._course_values(index, geometry), font_color
+        )
+        self.figure.add_shape(type="rect", xref="x2", yref="y2", col=1, row=2, **shape)
+        self.figure.add_annotation(
+            showarrow=False, col=1, row=2, font={"color": font_color}, **annotation
+        )
+        self.figure.add_trace(go.Scatter(mode="markers", showlegend=False, **hover), row=2, col=1)
+
+    def erase_course(self, index: int, geometry: CourseGeometry) -> None:
+        """Remove the shape, label and hover trace of one course from the open figure."""
+        if self.render_mode == RenderMode.BATCHED:
+            self._refresh_batched(geometry)
+            return
+
+        fig = self.figure
+        shape = _FIRST_COURSE_SHAPE + index
+        annotation = _FIRST_COURSE_ANNOTATION + index
+        fig.layout.shapes = fig.layout.shapes[:shape] + fig.layout.shapes[shape + 1:]
+        fig.layout.annotations = (
+            fig.layout.annotations[:annotation] + fig.layout.annotations[annotation + 1:]
+        )
+        fig.data = fig.data[:index] + fig.data[index + 1:]
+
+    def redraw_courses(self, indices: list[int], geometry: CourseGeometry) -> None:
+        """Move, recolor and relabel the shapes, labels and hover traces of existing courses."""
+        if self.render_mode == RenderMode.BATCHED:
+            self._refresh_batched(geometry)
+            return
+
+        font_color = mcolors.to_hex(self.theme.font_color)
+        for index in indices:
+            shape, annotation, hover = self._course_properties(
+                *self._course_values(index, geometry), font_color
+            )
+            self.figure.layout.shapes[_FIRST_COURSE_SHAPE + index].update(shape)
+            self.figure.layout.annotations[_FIRST_COURSE_ANNOTATION + index].update(annotation)
+            self.figure.data[index].update(hover)
+
+    def redraw_y_range(self, y_ticks: np.ndarray) -> None:
+        """Update the hour axis and the length of the day lines."""
+        for shape in self.figure.layout.shapes[len(WeekDay):_FIRST_COURSE_SHAPE]:
+            shape.update(y0=y_ticks[0], y1=y_ticks[-1])
+        self.figure.update_yaxes(
+            range=[max(y_ticks), min(y_ticks)],
+            tickvals=y_ticks,
+            ticktext=[f"{int((h / 60) % 24):02d}:{int(h % 60):02d}" for h in y_ticks],
+            row=2,
+            col=1,
+        )
+
+    def _course_values(self, index: int, geometry: CourseGeometry) -> tuple:
+        """Course, position, size, end and color of one course in plot units."""
+        return (
+            self.courses[index],
+            float(geometry.x[index]) * 100,
+            float(geometry.widths[index]) * 100,
+            int(geometry.start_minutes[index]),
+            int(geometry.durations[index]),
+            int(geometry.end_minutes[index]),
+            geometry.hex_colors[index],
+        )
+
+    def _course_properties(
+        self, subject, x: float, width: float, y: int, duration: int, end: int, color: str, font_color: str
+    ) -> tuple[dict, dict, dict]:
+        """Properties of the shape, label and hover trace of one course that depend on it."""
+        endtime = time(hour=(end // 60) % 24, minute=end % 60)
+
+        shape = dict(x0=x, x1=x + width, y1=y, y0=y + duration, fillcolor=color)
+        annotation = dict(x=x + 0.5 * width, y=y + 0.5 * duration, text=f"{subject.course_name[:6]}")
+        hover = dict(
+            x=[x + 0.5 * width],
+            y=[y + 0.5 * duration],
+            marker=dict(size=duration, opacity=0),
+            hovertemplate=f"<b>{subject.course_name}</b> "
+                          f"<br> {subject.lecturer}"
+                          f"<br> {subject.room}"
+                          f"<br> {subject.start_time}"
+                          f"<br> {endtime}"
+                          f"<extra></extra>",
+            hoverlabel=dict(bgcolor=color, font_color=font_color, bordercolor=font_color),
+        )
+        return shape, annotation, hover
+
+    def _raw_course(
+        self, subject, x: float, width: float, y: int, duration: int, end: int, color: str, font_color: str
+    ) -> tuple[dict, dict, dict]:
+        """Shape, label and hover trace of one course as unvalidated plotly dicts."""
+        shape, annotation, hover = self._course_properties(
+            subject, x, width, y, duration, end, color, font_color
+        )
+        hover["hoverlabel"] = {
+            "bgcolor": color, "bordercolor": font_color, "font": {"color": font_color}
+        }
+        return (
+            {**shape, "type": "rect", "xref": "x2", "yref": "y2"},
+            {**annotation, "font": {"color": font_color}, "showarrow": False,
+             "xref": "x2", "yref": "y2"},
+            {**hover, "mode": "markers", "showlegend": False, "type": "scatter",
+             "xaxis": "x2", "yaxis": "y2"},
+        )
+
+    def _raw_batched_traces(self, geometry: CourseGeometry, font_color: str) -> list[dict]:
+        """Bar trace and text trace of all courses as plotly dicts with typed arrays."""
+        colors = list(geometry.hex_colors)
+        x_centres = geometry.x * 100 + 0.5 * geometry.widths * 100
+        durations = geometry.durations
+        bars = {
+            "base": _typed_array(geometry.start_minutes),
+            "customdata": self._customdata(geometry),
+            "hoverlabel": {"bgcolor": colors, "bordercolor": font_color, "font": {"color": font_color}},
+            "hovertemplate": _BAR_HOVERTEMPLATE,
+            "marker": {"color": colors, "line": {"color": "#444", "width": 2}},
+            "showlegend": False,
+            "width": _typed_array(geometry.widths * 100),
+            "x": _typed_array(x_centres),
+            "y": _typed_array(durations),
+            "type": "bar",
+            "xaxis": "x2",
+            "yaxis": "y2",
+        }
+        labels = {
+            "hoverinfo": "skip",
+            "mode": "text",
+            "showlegend": False,
+            "text": [subject.course_name[:6] for subject in self.courses],
+            "textfont": {"color": font_color},
+            "x": _typed_array(x_centres),
+            "y": _typed_array(geometry.start_minutes + 0.5 * durations),
+            "type": "scatter",
+            "xaxis": "x2",
+            "yaxis": "y2",
+        }
+        return [bars, labels]
+
+    def _customdata(self, geometry: CourseGeometry) -> list[list[str]]:
+        """Name, lecturer, room, start and end time of every course for the hover labels."""
+        return [
+            [
+                subject.course_name,
+                subject.lecturer,
+                subject.room,
+                subject.start_time,
+                f"{time(hour=(end // 60) % 24, minute=end % 60)}",
+            ]
+            for subject, end in zip(self.courses, geometry.end_minutes.tolist())
+        ]
+
+    def _batched_properties(self, geometry: CourseGeometry) -> tuple[dict, dict]:
+        """Data of the bar trace and the text trace of all courses."""
+        widths = (geometry.widths * 100).tolist()
+        colors = geometry.hex_colors
+        font_color = mcolors.to_hex(self.theme.font_color)
+
+        x_centres = (geometry.x * 100 + 0.5 * geometry.widths * 100).tolist()
+        y_starts = geometry.start_minutes.tolist()
+        durations = geometry.durations.tolist()
+        customdata = self._customdata(geometry)
+
+        bars = dict(
+            x=x_centres,
+            y=durations,
+            base=y_starts,
+            width=widths,
+            marker=dict(color=colors, line=dict(color="#444", width=2)),
+            customdata=customdata,
+            hoverlabel=dict(bgcolor=colors, font_color=font_color, bordercolor=font_color),
+        )
+        labels = dict(
+            x=x_centres,
+            y=[y + 0.5 * d for y, d in zip(y_starts, durations)],
+            text=[subject.course_name[:6] for subject in self.courses],
+        )
+        return bars, labels
+
+    def _refresh_batched(self, geometry: CourseGeometry) -> None:
+        """Replace the data of the bar and text traces of the open figure."""
+        fig = self.figure
+        if not self.courses:
+            fig.data = ()
+        elif not fig.data:
+            self.display_courses_batched(fig, geometry)
+        else:
+            bars, labels = self._batched_properties(geometry)
+            fig.data[0].update(bars)
+            fig.data[1].update(labels)
+
+
+def _typed_array(values: np.ndarray) -> dict:
+    """Encode a numeric array as a plotly.js typed array."""
+    code = "f8" if values.dtype.kind == "f" else "i4"
+    values = np.ascontiguousarray(values, dtype=f"<{code}")
+    return {"dtype": code, "bdata": base64.b64encode(values.tobytes()).decode("ascii")}
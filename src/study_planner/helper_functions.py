@@ -1,16 +1,20 @@
 from pathlib import Path
 from enum import StrEnum
+from functools import lru_cache
 
 import pandas as pd
 
-from src.study_planner.static_timetable import StaticTimetable
-from src.study_planner.dynamic_timetable import DynamicTimetable
+from src.study_planner.instrumentation import instrumented
 from src.study_planner.themes import *
-from src.study_planner.timetable import TimetableLayout
+from src.study_planner.timetable import CourseTable, RenderMode, TimetableLayout
+from src.study_planner.timetable_file import TIMETABLE_FILE_SUFFIX, TimetableFile
 from src.study_planner.themes import Theme
 
 _MAX_MINUTES_IN_A_DAY: int = 1440
 
+# Credits are stored as int16 in a course table.
+_MAX_CREDITS: int = 32767
+
 BASE_DIR = Path(__file__).resolve().parents[2]
 
 DATA_DIR = BASE_DIR / "data"
@@ -32,6 +36,7 @@ class TimetableTheme(StrEnum):
     NATURE = "nature"
 
 
+@instrumented
 def load_course_data(file: str) -> pd.DataFrame:
     """Load course data from csv file in a pandas dataframe"""
     filepath = DATA_DIR / file
@@ -40,29 +45,63 @@ def load_course_data(file: str) -> pd.DataFrame:
     return df
 
 
-def choose_layout(layout_type, courses, theme, figsize_timetable, user) -> TimetableLayout:
-    """Choose a layout type by name."""
+@instrumented
+def load_course_table(file: str) -> CourseTable:
+    """Load course data from csv or binary timetable file into a columnar course table"""
+    filepath = DATA_DIR / file
+    if filepath.suffix == TIMETABLE_FILE_SUFFIX:
+        return TimetableFile(filepath).table()
+    return CourseTable.from_df(load_course_data(file))
+
+
+def choose_layout(
+    layout_type,
+    courses,
+    theme,
+    figsize_timetable,
+    user,
+    render_mode: RenderMode = RenderMode.PER_COURSE,
+) -> TimetableLayout:
+    """Choose a layout type by name.
+
+    The plotting backends are imported here, so only the selected one is loaded.
+    """
     if layout_type == LayoutType.STATIC:
-        return StaticTimetable(courses, theme, figsize_timetable, user)
+        from src.study_planner.static_timetable import StaticTimetable
+
+        return StaticTimetable(courses, theme, figsize_timetable, user, render_mode)
 
     elif layout_type == LayoutType.DYNAMIC:
-        return DynamicTimetable(courses, theme, figsize_timetable, user)
+        from src.study_planner.dynamic_timetable import DynamicTimetable
+
+        return DynamicTimetable(courses, theme, figsize_timetable, user, render_mode)
 
     raise ValueError(f"Unknown timetable type: {layout_type}")
 
 
+_THEME_CLASSES: dict[TimetableTheme, type[Theme]] = {
+    TimetableTheme.DARK: DarkTheme,
+    TimetableTheme.LIGHT: LightTheme,
+    TimetableTheme.RAINBOW: RainbowTheme,
+    TimetableTheme.AUTUMN: AutumnTheme,
+    TimetableTheme.NEUTRAL: NeutralTheme,
+    TimetableTheme.NATURE: NatureTheme,
+}
+
+
 def choose_theme(theme: TimetableTheme) -> Theme:
-    theme_dict: dict[TimetableTheme, Theme] = {
-        TimetableTheme.DARK: DarkTheme(),
-        TimetableTheme.LIGHT: LightTheme(),
-        TimetableTheme.RAINBOW: RainbowTheme(),
-        TimetableTheme.AUTUMN: AutumnTheme(),
-        TimetableTheme.NEUTRAL: NeutralTheme(),
-        TimetableTheme.NATURE: NatureTheme(),
-    }
+    """Choose a theme by name.
 
+    Every theme is built once on first use and shared by all later calls.
+    """
     try:
-        return theme_dict[theme]
+        return _shared_theme(TimetableTheme(theme))
+
+    except ValueError:
+        raise ValueError(f"Unknown theme: {theme}") from None
+
 
-    except KeyError:
-        raise ValueError(f"Unknown theme: {theme}")
\ No newline at end of file
+@lru_cache(maxsize=None)
+def _shared_theme(theme: TimetableTheme) -> Theme:
+    """Build the instance of a theme that is shared by all timetables."""
+    return _THEME_CLASSES[theme]()
\ No newline at end of file
@@ -0,0 +1,183 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+import cProfile
+from dataclasses import dataclass, field
+from functools import wraps
+import json
+import logging
+import math
+from pathlib import Path
+import pstats
+from time import perf_counter
+
+# Upper bounds of the histogram buckets in seconds, from 10 us to about 3 minutes.
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(10.0 ** (exponent / 4) for exponent in range(-20, 10))
+
+# Sinks receiving the finished spans, instrumentation is off while this is empty.
+_sinks: list["SpanSink"] = []
+
+
+@dataclass
+class Span:
+    """Duration of one instrumented step."""
+    name: str
+    seconds: float
+    attributes: dict = field(default_factory=dict)
+
+
+class SpanSink(ABC):
+    """Abstract base class for receivers of finished spans"""
+
+    @abstractmethod
+    def record(self, span: Span) -> None:
+        """Handle one finished span"""
+        pass
+
+
+class LoggingSink(SpanSink):
+    """Write every span as one json line to a logger."""
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO):
+        self.logger = logging.getLogger("study_planner.spans") if logger is None else logger
+        self.level = level
+
+    def record(self, span: Span) -> None:
+        """Log the span as json with its name, duration and attributes."""
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                json.dumps({"span": span.name, "seconds": span.seconds, **span.attributes},
+                           default=str),
+            )
+
+
+@dataclass
+class SpanStats:
+    """Aggregated durations of all spans with one name."""
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(_BUCKET_BOUNDS) + 1))
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average duration of the spans."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile of the durations."""
+        target = math.ceil(q * self.count)
+        seen = 0
+        for bound, count in zip(_BUCKET_BOUNDS, self.buckets):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+
+class HistogramSink(SpanSink):
+    """Keep per name counts and a fixed bucket histogram of the durations in memory."""
+    def __init__(self):
+        self.stats: dict[str, SpanStats] = {}
+
+    def record(self, span: Span) -> None:
+        """Add the span duration to the histogram of its name."""
+        stats = self.stats.setdefault(span.name, SpanStats())
+        stats.count += 1
+        stats.total_seconds += span.seconds
+        stats.max_seconds = max(stats.max_seconds, span.seconds)
+        stats.buckets[_bucket(span.seconds)] += 1
+
+    def summary(self) -> str:
+        """Human readable table of the recorded spans, slowest in total first."""
+        lines = [f"{'span':<48}{'count':>8}{'total [s]':>12}{'mean [ms]':>12}{'p95 [ms]':>12}"]
+        for name, stats in sorted(self.stats.items(), key=lambda item: -item[1].total_seconds):
+            lines.append(
+                f"{name:<48}{stats.count:>8}{stats.total_seconds:>12.3f}"
+                f"{stats.mean_seconds * 1e3:>12.2f}{stats.quantile(0.95) * 1e3:>12.2f}"
+            )
+        return "\n".join(lines)
+
+
+def add_sink(sink: SpanSink) -> None:
+    """Send all following spans to a sink, which switches the instrumentation on."""
+    _sinks.append(sink)
+
+
+def remove_sink(sink: SpanSink) -> None:
+    """Stop sending spans to a sink."""
+    _sinks.remove(sink)
+
+
+@contextmanager
+def recording(sink: SpanSink) -> Iterator[SpanSink]:
+    """Send the spans of a block to a sink."""
+    add_sink(sink)
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[None]:
+    """Time a block and report it to the sinks, if there are any."""
+    if not _sinks:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _emit(Span(name, perf_counter() - start, attributes))
+
+
+def instrumented(func):
+    """Time every call of a function as a span named by its qualified name."""
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _sinks:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _emit(Span(name, perf_counter() - start))
+
+    return wrapper
+
+
+@contextmanager
+def profiled(output: Path | None = None, sort: str = "cumulative") -> Iterator[cProfile.Profile]:
+    """Run a block under cProfile.
+
+    With an output path, the raw stats are dumped there for snakeviz or
+    pstats; otherwise the 25 most expensive functions are printed.
+    """
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        if output is not None:
+            profile.dump_stats(output)
+        else:
+            stats = pstats.Stats(profile).sort_stats(sort)
+            stats.print_stats(25)
+
+
+def _emit(finished: Span) -> None:
+    """Hand a finished span to every sink."""
+    for sink in list(_sinks):
+        sink.record(finished)
+
+
+def _bucket(seconds: float) -> int:
+    """Index of the first histogram bucket whose bound is not below the duration."""
+    return bisect_left(_BUCKET_BOUNDS, seconds)
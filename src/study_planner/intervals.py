@@ -0,0 +1,81 @@
+import heapq
+
+import numpy as np
+
+
+def overlapping_pairs(
+    start: np.ndarray, end: np.ndarray, groups: np.ndarray
+) -> list[tuple[int, int]]:
+    """Find all pairs of overlapping intervals within the same group.
+
+    Sort-and-sweep over the intervals ordered by group and start: an active
+    heap holds the ends of the intervals that are still running, so the
+    cost is O(n log n) plus the number of reported pairs. Intervals that
+    only touch do not overlap.
+    """
+    order = np.lexsort((start, groups))
+    pairs = []
+    active: list[tuple[int, int]] = []
+    current_group = None
+
+    for i in order.tolist():
+        if groups[i] != current_group:
+            current_group = groups[i]
+            active = []
+
+        while active and active[0][0] <= start[i]:
+            heapq.heappop(active)
+
+        if end[i] <= start[i]:
+            continue
+
+        pairs.extend((j, i) if j < i else (i, j) for _, j in active)
+        heapq.heappush(active, (int(end[i]), i))
+
+    return pairs
+
+
+def assign_lanes(
+    start: np.ndarray, end: np.ndarray, groups: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pack overlapping intervals of each group into side-by-side lanes.
+
+    Greedy interval graph colouring in start order: every interval takes
+    the lowest lane freed by an interval that has already ended. A run of
+    transitively overlapping intervals forms a cluster, and all intervals
+    of a cluster share its number of lanes, so intervals without any
+    overlap keep a single full-width lane. Runs in O(n log n).
+
+    Returns the lane of every interval and the number of lanes of its cluster.
+    """
+    order = np.lexsort((start, groups))
+    lanes = np.zeros(len(start), dtype=np.int64)
+    clusters = np.zeros(len(start), dtype=np.int64)
+
+    active: list[tuple[int, int]] = []
+    free_lanes: list[int] = []
+    current_group = None
+    current_cluster = -1
+
+    for i in order.tolist():
+        if groups[i] != current_group:
+            current_group = groups[i]
+            active = []
+
+        while active and active[0][0] <= start[i]:
+            _, lane = heapq.heappop(active)
+            heapq.heappush(free_lanes, lane)
+
+        if not active:
+            current_cluster += 1
+            free_lanes = []
+
+        lane = heapq.heappop(free_lanes) if free_lanes else len(active)
+        lanes[i] = lane
+        clusters[i] = current_cluster
+        # Sessions without duration still occupy their lane for a minute.
+        heapq.heappush(active, (max(int(end[i]), int(start[i]) + 1), lane))
+
+    lanes_per_cluster = np.zeros(current_cluster + 1, dtype=np.int64)
+    np.maximum.at(lanes_per_cluster, clusters, lanes + 1)
+    return lanes, lanes_per_cluster[clusters]
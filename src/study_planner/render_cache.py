@@ -0,0 +1,191 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from src.study_planner.timetable import ExportFormat, TimetableLayout, WEEKDAYS
+
+_DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """Counters of a render cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class RenderCache:
+    """On-disk cache of exported timetables with size bounded LRU eviction.
+
+    Entries are keyed by a hash of the normalised course data and every
+    setting that changes the output, so an unchanged timetable is served
+    with one hash and one file read.
+
+    The directory is the only index: the modification time of an entry is
+    its last use, and eviction rescans the directory under a file lock, so
+    processes sharing a cache directory share its size limit.
+    """
+    def __init__(self, directory: Path, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def key(
+        self,
+        layout: TimetableLayout,
+        export_format: ExportFormat,
+        self_contained: bool = True,
+    ) -> str:
+        """Stable hash of the courses and render settings of a layout."""
+        table = layout.course_table()
+        settings = {
+            "layout": type(layout).__name__,
+            "render_mode": str(layout.render_mode),
+            "theme": type(layout.theme).__name__,
+            "figsize": [float(size) for size in layout.figsize_timetable],
+            "user": layout.user,
+            "format": str(ExportFormat(export_format)),
+            "self_contained": self_contained,
+        }
+        # The palette depends on the position of a course, so the order is kept.
+        # The start time is hashed as written, since hover texts show it so.
+        rows = zip(
+            table.course_name,
+            table.credits.tolist(),
+            (WEEKDAYS[day].value for day in table.week_day.tolist()),
+            map(str, table.start_time),
+            table.duration_minutes.tolist(),
+            table.room,
+            table.lecturer,
+        )
+
+        digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+        for row in rows:
+            digest.update(json.dumps(row).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached content for a key, or None on a miss."""
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+
+        try:
+            _mark_used(path)
+        except FileNotFoundError:
+            pass  # evicted by another process after the read
+        self.stats.hits += 1
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """Store content under a key and evict the least recently used entries."""
+        path = self._path(key)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(content)
+        _mark_used(temporary)
+        os.replace(temporary, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries of all processes until the cache fits."""
+        with _exclusive_lock(self.directory / ".lock"):
+            entries = self._scan()
+            size = sum(entry_size for _, entry_size, _ in entries)
+
+            for _, entry_size, path in entries[:-1]:
+                if size <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                size -= entry_size
+                self.stats.evictions += 1
+
+    def _scan(self) -> list[tuple[int, int, Path]]:
+        """Modification time, size and path of every entry, least recently used first."""
+        entries = []
+        for path in self.directory.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # removed by another process during the scan
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def render(
+        self,
+        layout: TimetableLayout,
+        export_format: ExportFormat,
+        self_contained: bool = True,
+    ) -> bytes:
+        """Return the exported layout from the cache, rendering it on a miss."""
+        key = self.key(layout, export_format, self_contained)
+        content = self.get(key)
+
+        if content is None:
+            content = layout.export_bytes(export_format, self_contained)
+            self.put(key, content)
+
+        return content
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for path in self.directory.glob("*.bin"):
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return sum(1 for _ in self.directory.glob("*.bin"))
+
+    def _path(self, key: str) -> Path:
+        """File holding the content of a key."""
+        return self.directory / f"{key}.bin"
+
+
+def _mark_used(path: Path) -> None:
+    """Set the modification time, which orders the entries for eviction, to now.
+
+    The clock is read explicitly, since file systems may only update
+    modification times every few milliseconds.
+    """
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+@contextmanager
+def _exclusive_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a lock file, waiting for other processes to release it."""
+    with open(path, "w") as lock:
+        if fcntl is not None:
+            # Released when the file is closed.
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+            return
+
+        # msvcrt locks the first byte and gives up after about ten seconds.
+        while True:
+            try:
+                msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                continue
+        try:
+            yield
+        finally:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,93 @@
+"""Thin client of the render daemon, see render_daemon.py.
+
+Only the standard library is imported here, so a call costs an
+interpreter start and one socket round trip:
+
+    python -m src.study_planner.render_client static "planner.csv" timetable.png --theme dark
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+import socket
+import tempfile
+
+# Socket of the render daemon, shared by the daemon and the client.
+DEFAULT_SOCKET_PATH: Path = Path(
+    os.environ.get(
+        "STUDY_PLANNER_SOCKET",
+        Path(tempfile.gettempdir()) / f"study_planner-{os.getuid()}.sock",
+    )
+)
+
+_RESPONSE_LIMIT_BYTES: int = 64 * 1024
+
+
+def render_remote(
+    layout_type: str,
+    filename: str,
+    theme,
+    figsize_timetable: tuple[int, int],
+    user: str,
+    output: Path,
+    socket_path: Path = DEFAULT_SOCKET_PATH,
+) -> Path:
+    """Export a timetable like auto_generation, but rendered by the daemon.
+
+    The file name is resolved against the data folder by the daemon, the
+    output path against the current directory. Raises a ValueError with
+    the daemon's message if the render failed and ConnectionError if no
+    daemon is listening.
+    """
+    job = {
+        "layout_type": str(layout_type),
+        "filename": str(filename),
+        "theme": str(theme),
+        "figsize_timetable": list(figsize_timetable),
+        "user": user,
+        "output": str(Path(output).absolute()),
+    }
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        connection.sendall(json.dumps(job).encode() + b"\n")
+        connection.shutdown(socket.SHUT_WR)
+        response = json.loads(_read_all(connection))
+
+    if not response["ok"]:
+        raise ValueError(response["error"])
+    return Path(response["output"])
+
+
+def _read_all(connection: socket.socket) -> bytes:
+    """Read until the daemon closes the connection."""
+    chunks = []
+    size = 0
+    while chunk := connection.recv(4096):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > _RESPONSE_LIMIT_BYTES:
+            raise ValueError("The response of the render daemon is too large.")
+    return b"".join(chunks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a timetable with the render daemon.")
+    parser.add_argument("layout_type", choices=["static", "dynamic"])
+    parser.add_argument("filename")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--theme", default="light")
+    parser.add_argument("--figsize", type=float, nargs=2, default=(10, 10))
+    parser.add_argument("--user", default="")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    args = parser.parse_args()
+
+    try:
+        print(render_remote(
+            args.layout_type, args.filename, args.theme, tuple(args.figsize), args.user,
+            args.output, args.socket,
+        ))
+    except (ConnectionError, FileNotFoundError):
+        parser.exit(2, f"No render daemon is listening on {args.socket}.\n")
+    except ValueError as error:
+        parser.exit(1, f"{error}\n")
@@ -0,0 +1,188 @@
+"""Pre-forked render daemon listening on a Unix domain socket.
+
+Start it once:
+
+    python -m src.study_planner.render_daemon --workers 2
+
+and render with the thin client, which skips the imports and the warm up:
+
+    python -m src.study_planner.render_client static "planner.csv" timetable.png
+
+The daemon imports pandas, matplotlib and plotly, samples every theme's
+colormap and renders one timetable with each layout before it forks its
+workers, so every worker starts warm and shares those pages with the
+parent. A job is one json line with the arguments of auto_generation,
+the answer is one json line.
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+import signal
+import socket
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from src.study_planner.auto_generation import auto_generation
+from src.study_planner.helper_functions import LayoutType, TimetableTheme
+from src.study_planner.helper_functions import choose_layout, choose_theme
+from src.study_planner.render_client import DEFAULT_SOCKET_PATH
+from src.study_planner.timetable import Course, WeekDay
+
+# Workers exit after this many jobs and are replaced, so memory leaked by
+# the plotting libraries cannot pile up in a long running daemon.
+_MAX_JOBS_PER_WORKER: int = 200
+
+# Palettes of up to this many courses are sampled before forking.
+_WARM_PALETTE_SIZES: int = 64
+
+_MAX_JOB_BYTES: int = 64 * 1024
+_LISTEN_BACKLOG: int = 128
+
+
+class RenderDaemon:
+    """Parent process of the pre-forked render workers.
+
+    All workers accept on the same listening socket, so the kernel hands
+    every connection to an idle worker. Workers that exit are replaced.
+    """
+    def __init__(
+        self,
+        socket_path: Path = DEFAULT_SOCKET_PATH,
+        workers: int = 2,
+        max_jobs_per_worker: int = _MAX_JOBS_PER_WORKER,
+    ):
+        self.socket_path = Path(socket_path)
+        self.workers = workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._children: set[int] = set()
+        self._listener: socket.socket | None = None
+
+    def serve_forever(self) -> None:
+        """Warm up, fork the workers and replace them until SIGTERM or SIGINT."""
+        warm_up()
+        self._listener = self._bind()
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            for _ in range(self.workers):
+                self._fork_worker()
+            while True:
+                pid, _ = os.wait()
+                self._children.discard(pid)
+                self._fork_worker()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Terminate the workers and remove the socket."""
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._children.clear()
+        if self._listener is not None:
+            self._listener.close()
+            self.socket_path.unlink(missing_ok=True)
+            self._listener = None
+
+    def _bind(self) -> socket.socket:
+        """Listen on the socket path, replacing a socket left behind by a dead daemon."""
+        if self.socket_path.is_socket():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+            except ConnectionRefusedError:
+                self.socket_path.unlink()
+            else:
+                raise ValueError(f"A render daemon is already listening on {self.socket_path}")
+            finally:
+                probe.close()
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        listener.listen(_LISTEN_BACKLOG)
+        return listener
+
+    def _fork_worker(self) -> None:
+        """Fork one worker that serves jobs from the shared listening socket."""
+        pid = os.fork()
+        if pid:
+            self._children.add(pid)
+            return
+
+        # The parent stops the workers with SIGTERM, Ctrl-C is handled there.
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            for _ in range(self.max_jobs_per_worker):
+                connection, _ = self._listener.accept()
+                with connection:
+                    serve_job(connection)
+        finally:
+            os._exit(0)
+
+
+def warm_up() -> None:
+    """Load the colormaps and render every layout once, so forked workers start warm."""
+    for theme in TimetableTheme:
+        shared_theme = choose_theme(theme)
+        for number_of_courses in range(1, _WARM_PALETTE_SIZES + 1):
+            shared_theme.palette(number_of_courses)
+
+    course = Course("Warm up", 1, WeekDay.MONDAY, "9:00", 60, "A1", "Daemon")
+    for layout_type in LayoutType:
+        layout = choose_layout(layout_type, [course], choose_theme(TimetableTheme.LIGHT), (4, 3), "")
+        layout.export_bytes(layout.export_formats[0], self_contained=False)
+
+
+def serve_job(connection: socket.socket) -> None:
+    """Run one json job from a connection and answer with one json line."""
+    try:
+        job = json.loads(_read_job(connection))
+        output = Path(job["output"])
+        auto_generation(
+            job["layout_type"],
+            job["filename"],
+            job["theme"],
+            tuple(job["figsize_timetable"]),
+            job["user"],
+            output=output,
+        )
+        response = {"ok": True, "output": str(output)}
+    except Exception as error:
+        response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+
+    try:
+        connection.sendall(json.dumps(response).encode() + b"\n")
+    except OSError:
+        pass
+
+
+def _read_job(connection: socket.socket) -> bytes:
+    """Read one job line, the client closes its side after sending it."""
+    chunks = []
+    size = 0
+    while chunk := connection.recv(4096):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > _MAX_JOB_BYTES:
+            raise ValueError("The job is too large.")
+    return b"".join(chunks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render timetables for the render client.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-jobs-per-worker", type=int, default=_MAX_JOBS_PER_WORKER)
+    args = parser.parse_args()
+
+    RenderDaemon(args.socket, args.workers, args.max_jobs_per_worker).serve_forever()
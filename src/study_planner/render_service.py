@@ -0,0 +1,293 @@
+"""Long-running HTTP service that renders timetables on a local socket.
+
+Start it from the repository root:
+
+    python -m src.study_planner.render_service --port 8765
+
+and POST a json document to ``/render``::
+
+    {"courses": [{"course_name": "Math", "credits": 6, "week_day": "Monday",
+                  "start_time": "9:00", "duration_minutes": 90,
+                  "room": "A1", "lecturer": "Dr. Euler"}],
+     "layout": "static", "theme": "light", "figsize": [10, 8], "user": "Anna"}
+
+The response body is the exported timetable. ``GET /stats`` returns the
+service counters as json.
+"""
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import hashlib
+from http import HTTPStatus
+import json
+from multiprocessing import get_context
+import os
+
+from src.study_planner.batch_generation import init_worker
+from src.study_planner.course_io import courses_from_records
+from src.study_planner.helper_functions import LayoutType, TimetableTheme
+from src.study_planner.helper_functions import choose_layout, choose_theme
+from src.study_planner.timetable import ExportFormat, RenderMode
+
+_DEFAULT_HOST: str = "127.0.0.1"
+_DEFAULT_PORT: int = 8765
+
+# Renders waiting for a free worker. Further requests are answered with 503
+# right away, so a burst cannot grow the waiting time without bound.
+_DEFAULT_MAX_QUEUE: int = 64
+
+_MAX_BODY_BYTES: int = 16 * 1024 * 1024
+_READ_TIMEOUT_SECONDS: float = 10.0
+_RETRY_AFTER_SECONDS: int = 1
+
+_DEFAULT_FORMAT: dict[LayoutType, ExportFormat] = {
+    LayoutType.STATIC: ExportFormat.PNG,
+    LayoutType.DYNAMIC: ExportFormat.HTML,
+}
+
+_CONTENT_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.PNG: "image/png",
+    ExportFormat.SVG: "image/svg+xml",
+    ExportFormat.PDF: "application/pdf",
+    ExportFormat.HTML: "text/html; charset=utf-8",
+}
+
+
+class ServiceBusy(Exception):
+    """Raised when the render queue is full."""
+
+
+@dataclass
+class ServiceStats:
+    """Counters of a render service."""
+    rendered: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+    failed: int = 0
+
+
+class RenderService:
+    """Render timetables in a process pool behind a bounded queue.
+
+    Identical requests arriving while one of them is waiting or rendering
+    share its result instead of being rendered again. Parsing, validation
+    and rendering all run in the workers, the event loop only hashes the
+    request body and moves bytes.
+    """
+    def __init__(self, max_workers: int | None = None, max_queue: int = _DEFAULT_MAX_QUEUE):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.stats = ServiceStats()
+        self._queue: asyncio.Queue | None = None
+        self._max_queue = max_queue
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._dispatchers: list[asyncio.Task] = []
+        self._executor: ProcessPoolExecutor | None = None
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = _DEFAULT_HOST, port: int = _DEFAULT_PORT) -> asyncio.Server:
+        """Start the workers and listen for http requests."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=get_context("spawn"),
+            initializer=init_worker,
+        )
+        self._queue = asyncio.Queue(self._max_queue)
+        # One dispatcher per worker keeps every worker busy while the
+        # remaining requests wait in the bounded queue.
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)
+        ]
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        """Stop listening, cancel waiting renders and shut the workers down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        for future in self._in_flight.values():
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> "RenderService":
+        """Start the service on a free local port."""
+        await self.start(port=0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the service."""
+        await self.close()
+
+    @property
+    def port(self) -> int:
+        """Port the service listens on."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def render(self, body: bytes) -> tuple[str, bytes]:
+        """Render a json request body and return the content type and content.
+
+        Raises ServiceBusy when the queue is full and a ValueError for an
+        invalid request.
+        """
+        key = hashlib.sha256(body).hexdigest()
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            if self._queue.full():
+                self.stats.rejected += 1
+                raise ServiceBusy("The render queue is full.")
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self._queue.put_nowait((body, future))
+        # A client that disconnects must not cancel the render other clients wait for.
+        return await asyncio.shield(future)
+
+    async def _dispatch(self) -> None:
+        """Hand queued requests to the process pool, one at a time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            body, future = await self._queue.get()
+            try:
+                result = await loop.run_in_executor(self._executor, render_request, body)
+            except Exception as error:
+                self.stats.failed += 1
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                self.stats.rendered += 1
+                if not future.done():
+                    future.set_result(result)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer one http request and close the connection."""
+        try:
+            try:
+                status, content_type, content = await self._respond(reader)
+            except (asyncio.LimitOverrunError, ValueError):
+                status, content_type, content = _error(
+                    HTTPStatus.BAD_REQUEST, "Malformed or oversized request head."
+                )
+
+            headers = [
+                f"HTTP/1.1 {status.value} {status.phrase}",
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(content)}",
+                "Connection: close",
+            ]
+            if status == HTTPStatus.SERVICE_UNAVAILABLE:
+                headers.append(f"Retry-After: {_RETRY_AFTER_SECONDS}")
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + content)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, reader: asyncio.StreamReader) -> tuple[HTTPStatus, str, bytes]:
+        """Read a request and return the status, content type and body of the response."""
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), _READ_TIMEOUT_SECONDS)
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, _ = request_line.split(" ", 2)
+        except ValueError:
+            return _error(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+        headers = {
+            name.strip().lower(): value.strip()
+            for name, _, value in (line.partition(":") for line in header_lines if line)
+        }
+
+        if path == "/stats":
+            if method != "GET":
+                return _error(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET.")
+            return HTTPStatus.OK, "application/json", json.dumps(asdict(self.stats)).encode()
+        if path != "/render":
+            return _error(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+        if method != "POST":
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST.")
+
+        try:
+            length = int(headers.get("content-length", ""))
+        except ValueError:
+            return _error(HTTPStatus.LENGTH_REQUIRED, "A Content-Length is required.")
+        if length < 0:
+            return _error(HTTPStatus.BAD_REQUEST, "The Content-Length must not be negative.")
+        if length > _MAX_BODY_BYTES:
+            return _error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "The request body is too large.")
+        body = await asyncio.wait_for(reader.readexactly(length), _READ_TIMEOUT_SECONDS)
+
+        try:
+            content_type, content = await self.render(body)
+        except ServiceBusy as error:
+            return _error(HTTPStatus.SERVICE_UNAVAILABLE, str(error))
+        except ValueError as error:
+            return _error(HTTPStatus.BAD_REQUEST, str(error))
+        except Exception as error:
+            return _error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(error).__name__}: {error}")
+        return HTTPStatus.OK, content_type, content
+
+
+def render_request(body: bytes) -> tuple[str, bytes]:
+    """Parse, validate and render a json request body in a worker process."""
+    request = json.loads(body)
+    if not isinstance(request, dict) or not isinstance(request.get("courses"), list):
+        raise ValueError("The request must be a json object with a list of courses.")
+
+    try:
+        layout_type = LayoutType(request.get("layout", LayoutType.STATIC))
+        theme = TimetableTheme(request.get("theme", TimetableTheme.LIGHT))
+        render_mode = RenderMode(request.get("render_mode", RenderMode.BATCHED))
+        export_format = ExportFormat(request.get("format", _DEFAULT_FORMAT[layout_type]))
+    except ValueError as error:
+        raise ValueError(f"Invalid option: {error}") from None
+    try:
+        width, height = map(float, request.get("figsize", (10, 8)))
+    except (TypeError, ValueError):
+        raise ValueError("figsize must be a pair of numbers.") from None
+
+    courses = courses_from_records(request["courses"])
+
+    layout = choose_layout(
+        layout_type, courses, choose_theme(theme), (width, height),
+        str(request.get("user", "")), render_mode,
+    )
+    content = layout.export_bytes(export_format, bool(request.get("self_contained", False)))
+    return _CONTENT_TYPES[export_format], content
+
+
+def _error(status: HTTPStatus, message: str) -> tuple[HTTPStatus, str, bytes]:
+    """Plain text error response."""
+    return status, "text/plain; charset=utf-8", message.encode()
+
+
+async def serve(host: str, port: int, max_workers: int | None, max_queue: int) -> None:
+    """Run a render service until it is interrupted."""
+    service = RenderService(max_workers, max_queue)
+    server = await service.start(host, port)
+    print(f"Rendering timetables on http://{host}:{service.port}/render")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render timetables over http.")
+    parser.add_argument("--host", default=_DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=_DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queue", type=int, default=_DEFAULT_MAX_QUEUE)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_queue))
+    except KeyboardInterrupt:
+        pass
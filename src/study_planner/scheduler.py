@@ -0,0 +1,215 @@
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter
+
+import numpy as np
+
+from src.study_planner.timetable import Course, Timetable, WeekDay, WEEKDAYS
+from src.study_planner.timetable import minutes_since_midnight
+
+_MINUTES_PER_DAY: int = 24 * 60
+
+# Sessions placed within this many repair steps are not evicted again,
+# which stops two sessions from endlessly evicting each other.
+_TABU_TENURE: int = 10
+
+# Number of unplaced sessions named in the error message.
+_MAX_REPORTED_SESSIONS: int = 10
+
+
+@dataclass
+class SessionRequest:
+    """One course session that still needs a week day and a start time."""
+    course_name: str
+    credits: int
+    duration_minutes: int
+    room: str
+    lecturer: str
+    allowed_days: tuple[WeekDay, ...] = field(default_factory=lambda: tuple(WeekDay))
+    earliest_start: str = "8:00"
+    latest_end: str = "20:00"
+
+
+def schedule_courses(
+    requests: list[SessionRequest],
+    slot_minutes: int = 15,
+    time_budget: float = 10.0,
+    seed: int = 0,
+) -> Timetable:
+    """Place sessions on days and start times without room or lecturer clashes.
+
+    Sessions are first placed greedily, most constrained first. Sessions
+    that do not fit are then repaired by local search: an unplaced session
+    takes the candidate slot with the least occupied time, evicting the
+    sessions in its way, until everything is placed or the time budget in
+    seconds runs out. The same seed gives the same timetable as long as the
+    budget is not exhausted. Raises a ValueError naming the sessions that
+    could not be placed.
+    """
+    schedule = _Schedule(requests, slot_minutes, np.random.default_rng(seed))
+    deadline = perf_counter() + time_budget
+
+    order = sorted(
+        range(len(requests)),
+        key=lambda i: (schedule.number_of_candidates(i), -schedule.length[i], i),
+    )
+    unplaced = deque(i for i in order if not schedule.place_greedy(i))
+    impossible = []
+
+    while unplaced and perf_counter() < deadline:
+        i = unplaced.popleft()
+        evicted = schedule.place_evicting(i)
+
+        if evicted is None:
+            impossible.append(i)
+        else:
+            unplaced.extend(evicted)
+
+    unplaced = list(unplaced) + impossible
+    if unplaced:
+        names = sorted(requests[i].course_name for i in unplaced)
+        details = ", ".join(names[:_MAX_REPORTED_SESSIONS])
+        if len(names) > _MAX_REPORTED_SESSIONS:
+            details += ", ..."
+        raise ValueError(f"Could not place {len(unplaced)} sessions within the time budget: {details}")
+
+    return schedule.to_timetable()
+
+
+class _Schedule:
+    """Occupancy of rooms and lecturers on a grid of time slots."""
+    def __init__(self, requests: list[SessionRequest], slot_minutes: int, rng: np.random.Generator):
+        self.requests = requests
+        self.slot_minutes = slot_minutes
+        self.rng = rng
+        slots_per_day = _MINUTES_PER_DAY // slot_minutes
+
+        rooms = {name: i for i, name in enumerate(dict.fromkeys(r.room for r in requests))}
+        lecturers = {name: i for i, name in enumerate(dict.fromkeys(r.lecturer for r in requests))}
+        self.room = np.array([rooms[r.room] for r in requests], dtype=np.int64)
+        self.lecturer = np.array([lecturers[r.lecturer] for r in requests], dtype=np.int64)
+        self.length = np.array(
+            [max(1, -(-int(r.duration_minutes) // slot_minutes)) for r in requests], dtype=np.int64
+        )
+
+        # Index of the session occupying a slot, or -1 if the slot is free.
+        self.room_owner = np.full((len(rooms), len(WeekDay), slots_per_day), -1, dtype=np.int64)
+        self.lecturer_owner = np.full(
+            (len(lecturers), len(WeekDay), slots_per_day), -1, dtype=np.int64
+        )
+        self.day = np.full(len(requests), -1, dtype=np.int64)
+        self.slot = np.full(len(requests), -1, dtype=np.int64)
+
+        # Repair step in which every session was last placed.
+        self.step = 0
+        self.placed_at = np.full(len(requests), -_TABU_TENURE - 1, dtype=np.int64)
+
+        # Boolean mask of the allowed start slots of every session.
+        self.allowed = np.zeros((len(requests), len(WeekDay), slots_per_day), dtype=bool)
+        for i, request in enumerate(requests):
+            first = -(-minutes_since_midnight(request.earliest_start) // slot_minutes)
+            last = minutes_since_midnight(request.latest_end) // slot_minutes - self.length[i]
+            days = [WEEKDAYS.index(WeekDay(day)) for day in request.allowed_days]
+            if last >= first:
+                self.allowed[i, days, first:last + 1] = True
+
+    def number_of_candidates(self, i: int) -> int:
+        """Number of allowed start slots of a session."""
+        return int(self.allowed[i].sum())
+
+    def busy_slots(self, i: int, tabu_weight: int = 0) -> np.ndarray:
+        """Occupied slots of the session's room and lecturer per candidate start.
+
+        With a tabu weight, every slot of a recently placed session counts
+        that many times, so repairs prefer to evict other sessions.
+        """
+        room_owner = self.room_owner[self.room[i]]
+        lecturer_owner = self.lecturer_owner[self.lecturer[i]]
+        busy = ((room_owner >= 0) | (lecturer_owner >= 0)).astype(np.int64)
+
+        if tabu_weight:
+            recent = self.placed_at >= self.step - _TABU_TENURE
+            tabu = (
+                ((room_owner >= 0) & recent[room_owner])
+                | ((lecturer_owner >= 0) & recent[lecturer_owner])
+            )
+            busy += tabu_weight * tabu
+
+        cumulative = np.zeros((busy.shape[0], busy.shape[1] + 1), dtype=np.int64)
+        np.cumsum(busy, axis=1, out=cumulative[:, 1:])
+
+        length = self.length[i]
+        counts = np.full(busy.shape, np.iinfo(np.int64).max)
+        counts[:, :busy.shape[1] - length + 1] = cumulative[:, length:] - cumulative[:, :-length]
+        counts[~self.allowed[i]] = np.iinfo(np.int64).max
+        return counts
+
+    def place_greedy(self, i: int) -> bool:
+        """Place a session in a random free candidate slot, if there is one."""
+        free = np.argwhere(self.busy_slots(i) == 0)
+        if len(free) == 0:
+            return False
+
+        day, slot = free[self.rng.integers(len(free))]
+        self.assign(i, int(day), int(slot))
+        return True
+
+    def place_evicting(self, i: int) -> list[int] | None:
+        """Place a session in the least occupied candidate slot and return the evicted sessions.
+
+        Returns None if the session has no allowed start slot at all.
+        """
+        self.step += 1
+        counts = self.busy_slots(i, tabu_weight=2 * int(self.length.max()))
+        best = counts.min()
+        if best == np.iinfo(np.int64).max:
+            return None
+
+        candidates = np.argwhere(counts == best)
+        day, slot = (int(v) for v in candidates[self.rng.integers(len(candidates))])
+        span = slice(slot, slot + self.length[i])
+
+        evicted = np.union1d(
+            self.room_owner[self.room[i], day, span], self.lecturer_owner[self.lecturer[i], day, span]
+        )
+        evicted = [int(j) for j in evicted if j >= 0]
+        for j in evicted:
+            self.unassign(j)
+
+        self.assign(i, day, slot)
+        return evicted
+
+    def assign(self, i: int, day: int, slot: int) -> None:
+        """Occupy the room and lecturer of a session."""
+        span = slice(slot, slot + self.length[i])
+        self.room_owner[self.room[i], day, span] = i
+        self.lecturer_owner[self.lecturer[i], day, span] = i
+        self.day[i] = day
+        self.slot[i] = slot
+        self.placed_at[i] = self.step
+
+    def unassign(self, i: int) -> None:
+        """Free the room and lecturer of a session."""
+        span = slice(self.slot[i], self.slot[i] + self.length[i])
+        self.room_owner[self.room[i], self.day[i], span] = -1
+        self.lecturer_owner[self.lecturer[i], self.day[i], span] = -1
+        self.day[i] = -1
+        self.slot[i] = -1
+
+    def to_timetable(self) -> Timetable:
+        """Timetable of all placed sessions in request order."""
+        timetable = Timetable()
+        for request, day, slot in zip(self.requests, self.day.tolist(), self.slot.tolist()):
+            start = slot * self.slot_minutes
+            timetable.add_course(
+                Course(
+                    request.course_name,
+                    request.credits,
+                    WEEKDAYS[day],
+                    f"{start // 60:02d}:{start % 60:02d}",
+                    request.duration_minutes,
+                    request.room,
+                    request.lecturer,
+                )
+            )
+        return timetable
@@ -0,0 +1,233 @@
+"""Expand weekly courses into the dated sessions of a semester.
+
+A course only says on which week day and at what time it takes place.
+``expand_semester`` turns a timetable into one event per session between
+the first and last day of a semester, skipping holidays and breaks, and
+``write_ics`` streams the events as an iCalendar file:
+
+    semester = SemesterCalendar(date(2026, 10, 12), date(2027, 1, 29))
+    semester.add_break(date(2026, 12, 21), date(2027, 1, 3))
+    write_ics(expand_semester(timetable, semester), "semester.ics")
+
+Both are generators all the way down, so only the courses of one
+timetable are held in memory, however many weeks or students are written.
+"""
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+import hashlib
+from pathlib import Path
+
+from src.study_planner.timetable import Course, Timetable, WeekDay, WEEKDAYS
+
+_ONE_DAY = timedelta(days=1)
+
+# Content lines longer than this many octets are folded, see RFC 5545 3.1.
+_MAX_LINE_OCTETS: int = 75
+
+_PRODUCT_ID: str = "-//Study-Planner//Semester Timetable//EN"
+_UID_DOMAIN: str = "study-planner"
+
+# Courses whose escaped text is kept by iter_ics. The cache is emptied when
+# it is full, so chaining many timetables into one stream stays bounded.
+_MAX_CACHED_COURSES: int = 1024
+
+
+@dataclass
+class SemesterCalendar:
+    """Teaching period of a semester and the days without teaching."""
+    first_day: date
+    last_day: date
+    holidays: set[date] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        """Check that the semester does not end before it starts."""
+        if self.last_day < self.first_day:
+            raise ValueError(
+                f"The semester ends on {self.last_day} before it starts on {self.first_day}."
+            )
+        self.holidays = set(self.holidays)
+
+    def add_break(self, first_day: date, last_day: date | None = None) -> None:
+        """Exclude a single day or every day from first_day to last_day."""
+        last_day = first_day if last_day is None else last_day
+        if last_day < first_day:
+            raise ValueError(f"The break ends on {last_day} before it starts on {first_day}.")
+        day = first_day
+        while day <= last_day:
+            self.holidays.add(day)
+            day += _ONE_DAY
+
+    def teaching_days(self) -> Iterator[date]:
+        """Yield every day of the semester that is not a holiday, in order."""
+        day = self.first_day
+        while day <= self.last_day:
+            if day not in self.holidays:
+                yield day
+            day += _ONE_DAY
+
+
+@dataclass(slots=True, frozen=True)
+class SemesterEvent:
+    """One dated session of a course."""
+    course: Course
+    start: datetime
+    end: datetime
+    index: int
+
+
+def expand_semester(
+    courses: Timetable | Iterable[Course],
+    semester: SemesterCalendar,
+) -> Iterator[SemesterEvent]:
+    """Yield the sessions of the courses on the teaching days of the semester.
+
+    Events come in chronological order, sessions starting at the same time
+    in the order of the courses. ``index`` is the position of the course
+    in the timetable. Times are local times without a time zone.
+    """
+    if isinstance(courses, Timetable):
+        courses = courses.courses
+
+    by_week_day: list[list[tuple[int, Course]]] = [[] for _ in WEEKDAYS]
+    for index, course in enumerate(courses):
+        by_week_day[WEEKDAYS.index(WeekDay(course.week_day))].append((index, course))
+    for sessions in by_week_day:
+        sessions.sort(key=lambda session: session[1].start_minute)
+
+    for day in semester.teaching_days():
+        # date.weekday() counts from Monday, WEEKDAYS from Sunday.
+        sessions = by_week_day[(day.weekday() + 1) % 7]
+        if not sessions:
+            continue
+        midnight = datetime(day.year, day.month, day.day)
+        for index, course in sessions:
+            start = midnight + timedelta(minutes=course.start_minute)
+            yield SemesterEvent(
+                course, start, start + timedelta(minutes=course.duration_minutes), index
+            )
+
+
+def iter_ics(
+    events: Iterable[SemesterEvent],
+    name: str = "",
+    created: datetime | None = None,
+) -> Iterator[str]:
+    """Yield the iCalendar file in pieces of whole lines ending with CRLF.
+
+    Every UID is derived from the session's start, its course and the
+    calendar ``name``, so sessions of different courses never share a UID,
+    even with the default name or with several timetables in one stream.
+    ``created`` is the DTSTAMP of every event, the current time by default.
+    """
+    created = datetime.now(timezone.utc) if created is None else created.astimezone(timezone.utc)
+    stamp = f"{created:%Y%m%dT%H%M%SZ}"
+
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield f"PRODID:{_PRODUCT_ID}\r\n"
+    yield "CALSCALE:GREGORIAN\r\n"
+    if name:
+        yield _content_line(f"X-WR-CALNAME:{_escape(name)}")
+    # The text of a course is the same in every week, so it is escaped and
+    # folded once per course and each event is written as one string. The
+    # cache holds the course itself, so an id is never reused while cached.
+    course_lines: dict[int, tuple[Course, str, str]] = {}
+    for event in events:
+        course = event.course
+        cached = course_lines.get(id(course))
+        if cached is None or cached[0] is not course:
+            if len(course_lines) >= _MAX_CACHED_COURSES:
+                course_lines.clear()
+            cached = course_lines[id(course)] = (
+                course,
+                _uid_suffix(course, name),
+                f"DTSTAMP:{stamp}\r\n"
+                + _content_line(f"SUMMARY:{_escape(course.course_name)}")
+                + _content_line(f"LOCATION:{_escape(course.room)}")
+                + _content_line(f"DESCRIPTION:{_escape(course.lecturer)}")
+                + "END:VEVENT\r\n",
+            )
+        _, suffix, text = cached
+        start = _ics_time(event.start)
+        yield (
+            f"BEGIN:VEVENT\r\nUID:{start}-{event.index}-{suffix}\r\n"
+            f"DTSTART:{start}\r\nDTEND:{_ics_time(event.end)}\r\n{text}"
+        )
+    yield "END:VCALENDAR\r\n"
+
+
+def write_ics(
+    events: Iterable[SemesterEvent],
+    target,
+    name: str = "",
+    created: datetime | None = None,
+) -> int:
+    """Stream the events as iCalendar to a file path or a text stream.
+
+    Returns the number of events written.
+    """
+    if isinstance(target, (str, Path)):
+        with open(target, "w", encoding="utf-8", newline="") as stream:
+            return write_ics(events, stream, name, created)
+
+    written = 0
+
+    def counted(events: Iterable[SemesterEvent]) -> Iterator[SemesterEvent]:
+        nonlocal written
+        for event in events:
+            written += 1
+            yield event
+
+    target.writelines(iter_ics(counted(events), name, created))
+    return written
+
+
+def _uid_suffix(course: Course, name: str) -> str:
+    """Hash of the course and calendar name that ends the UIDs of its sessions."""
+    key = "\x1f".join(map(str, (
+        name, course.course_name, course.week_day, course.start_time,
+        course.duration_minutes, course.room, course.lecturer,
+    )))
+    return f"{hashlib.sha1(key.encode()).hexdigest()[:16]}@{_UID_DOMAIN}"
+
+
+def _ics_time(moment: datetime) -> str:
+    """Local date-time value, e.g. 20261012T080000."""
+    return (
+        f"{moment.year:04d}{moment.month:02d}{moment.day:02d}"
+        f"T{moment.hour:02d}{moment.minute:02d}{moment.second:02d}"
+    )
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value, see RFC 5545 3.3.11."""
+    return (
+        str(text)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _content_line(line: str) -> str:
+    """Terminate a content line, folding it at 75 octets without splitting a character."""
+    if len(line.encode()) <= _MAX_LINE_OCTETS:
+        return line + "\r\n"
+
+    parts = []
+    part = ""
+    octets = 0
+    for character in line:
+        size = len(character.encode())
+        if octets + size > _MAX_LINE_OCTETS:
+            parts.append(part)
+            # Continuation lines start with a space, which counts as an octet.
+            part = " "
+            octets = 1
+        part += character
+        octets += size
+    parts.append(part)
+    return "\r\n".join(parts) + "\r\n"
@@ -1,32 +1,75 @@
+import pickle
+
 from matplotlib.axes import Axes
+import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle
+from matplotlib.legend import Legend
+from matplotlib.patches import Patch, Rectangle
 import matplotlib.patheffects as pe
+import numpy as np
 
+from src.study_planner.instrumentation import instrumented
+from src.study_planner.timetable import CourseGeometry, ExportFormat, RenderMode, SkeletonCache
 from src.study_planner.timetable import TimetableLayout, WeekDay
-from src.study_planner.timetable import minutes_since_midnight
-from src.study_planner.themes import *
+
+# Pickled figures with header, grid and hour axis, see StaticTimetable.display_timetable.
+_SKELETONS = SkeletonCache()
 
 
 class StaticTimetable(TimetableLayout):
+    export_formats = (ExportFormat.PNG, ExportFormat.SVG, ExportFormat.PDF)
+
+    @instrumented
     def display_timetable(self) -> Figure:
-        """Plotting the timetable with courses."""
+        """Plotting the timetable with courses.
+
+        The figure is restored from a pickled skeleton shared with every
+        timetable of the same theme, size and y-range, only the title and
+        the courses are drawn per timetable.
+        """
+        geometry = self.compute_course_geometry()
+        y_ticks = self.calc_yrange_for_plotting(geometry)
+        skeleton = _SKELETONS.get(
+            self.skeleton_key(y_ticks), lambda: self._pickled_skeleton(geometry)
+        )
+
+        fig = pickle.loads(skeleton)
+        fig.axes[0].title.set_text(f"{self.user}'s Study Timetable \n")
+        self.display_courses(fig.axes[1], geometry)
+
+        return fig
+
+
+    def _pickled_skeleton(self, geometry: CourseGeometry) -> bytes:
+        """Build header, grid and hour axis without courses and pickle the figure."""
         height_ratios = [1, 8]
 
         fig = plt.figure(figsize=self.figsize_timetable)
-        fig.subplots_adjust(left=0.1, right=0.95)
-        gs = fig.add_gridspec(2, 1, height_ratios=height_ratios, hspace=0.0)
+        try:
+            fig.subplots_adjust(left=0.1, right=0.95)
+            gs = fig.add_gridspec(2, 1, height_ratios=height_ratios, hspace=0.0)
 
-        ax1 = fig.add_subplot(gs[0])
-        ax2 = fig.add_subplot(gs[1], sharex=ax1)
+            ax1 = fig.add_subplot(gs[0])
+            ax2 = fig.add_subplot(gs[1], sharex=ax1)
 
-        self.display_timetable_header(ax1)
-        self.create_timetable_layout(ax2)
-        self.display_courses(ax2)
+            self.display_timetable_header(ax1)
+            self.create_timetable_layout(ax2, geometry)
+            return pickle.dumps(fig)
+        finally:
+            plt.close(fig)
 
-        return fig
+
+    @instrumented
+    def write_figure(self, fig: Figure, target, export_format: ExportFormat, self_contained: bool) -> None:
+        """Save the figure and close it, so long-running processes do not leak figures."""
+        try:
+            fig.savefig(target, format=str(export_format))
+        finally:
+            plt.close(fig)
 
 
+    @instrumented
     def display_timetable_header(self, ax1: Axes) -> None:
         """Creating timetable header"""
         day_width = self.figsize_timetable[0] / len(WeekDay)
@@ -66,9 +109,10 @@ class StaticTimetable(TimetableLayout):
         ])
 
 
-    def create_timetable_layout(self, ax2: Axes) -> None:
+    @instrumented
+    def create_timetable_layout(self, ax2: Axes, geometry: CourseGeometry | None = None) -> None:
         """Creating timetable layout."""
-        y_ticks = self.calc_yrange_for_plotting()
+        y_ticks = self.calc_yrange_for_plotting(geometry)
         ax2.set_yticks(y_ticks)
         ax2.set_ylim(y_ticks[0], y_ticks[-1])
         ax2.set_xlim(0, self.figsize_timetable[0])
@@ -79,36 +123,232 @@ class StaticTimetable(TimetableLayout):
         ax2.set_axisbelow(True)
         ax2.grid(True, zorder=0)
 
+        day_width = self.figsize_timetable[0] / len(WeekDay)
+        for i, _ in enumerate(WeekDay):
+            ax2.axvline(i * day_width, color="gray", alpha=0.3, zorder=1)
+
 
-    def display_courses(self, ax2: Axes) -> None:
+    @instrumented
+    def display_courses(self, ax2: Axes, geometry: CourseGeometry | None = None) -> None:
         """Plotting the courses into the timetable layout"""
-        day_lines = [i * self.figsize_timetable[0] / len(WeekDay) for i, day in enumerate(WeekDay)]
-        for x in day_lines:
-            ax2.axvline(x, color="gray", alpha=0.3, zorder=1)
-
-        for i_subject, subject in enumerate(self.courses):
-            width = self.figsize_timetable[0] / len(WeekDay)  # One day wide
-            height = subject.duration_minutes
-            day_to_x = {
-                day: i * self.figsize_timetable[0] / len(WeekDay) for i, day in enumerate(WeekDay)
-            }
-            x = day_to_x[subject.week_day]
-            y = minutes_since_midnight(subject.start_time)
-
-            period = Rectangle(
-                xy=(x, y),
-                width=width,
-                height=height,
-                facecolor=self.theme.color_list(len(self.courses))[i_subject],
-                edgecolor=self.theme.font_color,
-                label=subject.course_name,
-            )
-            ax2.add_patch(period)
-            ax2.text(
-                x + width * 0.3,
-                y + height * 0.7,
-                subject.course_name[0:6],
-                zorder=3,
-            )
+        if geometry is None:
+            geometry = self.compute_course_geometry()
+
+        if self.render_mode == RenderMode.BATCHED:
+            self.display_courses_batched(ax2, geometry)
+            return
+
+        for subject, x, width, y, height, color in zip(
+            self.courses,
+            geometry.x.tolist(),
+            geometry.widths.tolist(),
+            geometry.start_minutes.tolist(),
+            geometry.durations.tolist(),
+            geometry.colors,
+        ):
+            ax2.add_patch(self._course_patch(subject, x, width, y, height, color))
+            self._add_course_label(ax2, subject, x, width, y, height)
+
+        ax2.legend()
+
+
+    @instrumented
+    def display_courses_batched(self, ax2: Axes, geometry: CourseGeometry) -> None:
+        """Plotting all courses as a single collection with a proxy legend."""
+        periods = PolyCollection(
+            self._course_verts(geometry),
+            facecolors=geometry.colors,
+            edgecolors=self.theme.font_color,
+        )
+        ax2.add_collection(periods, autolim=False)
+
+        for subject, x, width, y, height in zip(
+            self.courses,
+            geometry.x,
+            geometry.widths,
+            geometry.start_minutes.astype(float),
+            geometry.durations.astype(float),
+        ):
+            self._add_course_label(ax2, subject, x, width, y, height)
+
+        ax2.legend(handles=self._legend_handles(geometry))
+
+
+    def draw_course(self, index: int, geometry: CourseGeometry) -> None:
+        """Add the rectangle and label of one new course to the open figure."""
+        ax2 = self.figure.axes[1]
+        subject, x, width, y, height, color = self._course_values(index, geometry)
+
+        if self.render_mode == RenderMode.BATCHED:
+            self._refresh_collection(ax2, geometry)
+            handle = self._legend_handle(subject, color)
+        else:
+            handle = ax2.add_patch(self._course_patch(subject, x, width, y, height, color))
+        self._add_course_label(ax2, subject, x, width, y, height)
+        self._insert_legend_entry(ax2, index, handle, geometry)
+
+
+    def erase_course(self, index: int, geometry: CourseGeometry) -> None:
+        """Remove the rectangle and label of one course from the open figure."""
+        ax2 = self.figure.axes[1]
+
+        if self.render_mode == RenderMode.BATCHED:
+            self._refresh_collection(ax2, geometry)
+        else:
+            ax2.patches[index].remove()
+        ax2.texts[index].remove()
+        self._remove_legend_entry(ax2, index, geometry)
+
+
+    def redraw_courses(self, indices: list[int], geometry: CourseGeometry) -> None:
+        """Move, recolor and relabel the rectangles and labels of existing courses."""
+        ax2 = self.figure.axes[1]
+
+        if self.render_mode == RenderMode.BATCHED:
+            self._refresh_collection(ax2, geometry)
+
+        for index in indices:
+            subject, x, width, y, height, color = self._course_values(index, geometry)
+            if self.render_mode != RenderMode.BATCHED:
+                patch = ax2.patches[index]
+                patch.set_bounds(x, y, width, height)
+                patch.set_facecolor(color)
+                patch.set_label(subject.course_name)
+
+            label = ax2.texts[index]
+            label.set_position((x + width * 0.3, y + height * 0.7))
+            label.set_text(subject.course_name[0:6])
+
+            legend = ax2.get_legend()
+            if legend is not None:
+                legend.texts[index].set_text(subject.course_name)
+                legend.legend_handles[index].set_facecolor(color)
+
+
+    def redraw_y_range(self, y_ticks: np.ndarray) -> None:
+        """Update ticks and limits of the inverted hour axis."""
+        ax2 = self.figure.axes[1]
+        ax2.set_yticks(y_ticks)
+        ax2.set_ylim(y_ticks[-1], y_ticks[0])
+        ax2.set_yticklabels([f"{int(h / 60 % 24):02d}:00" for h in y_ticks])
+
+
+    def _insert_legend_entry(self, ax2: Axes, index: int, handle, geometry: CourseGeometry) -> None:
+        """Add the legend entry of one course without rebuilding the other entries."""
+        entries = _legend_entries(ax2)
+        if entries is None:
+            self._rebuild_legend(ax2, geometry)
+            return
+
+        # A legend of the new entry alone lays it out like the legend would.
+        single = Legend(ax2, [handle], [handle.get_label()])
+        legend = ax2.get_legend()
+        entries.insert(index, _legend_entries_of(single)[0])
+        legend.texts.insert(index, single.texts[0])
+        legend.legend_handles.insert(index, single.legend_handles[0])
+        legend.stale = True
+
+
+    def _remove_legend_entry(self, ax2: Axes, index: int, geometry: CourseGeometry) -> None:
+        """Remove the legend entry of one course without rebuilding the other entries."""
+        entries = _legend_entries(ax2)
+        if entries is None:
+            self._rebuild_legend(ax2, geometry)
+            return
+
+        legend = ax2.get_legend()
+        del entries[index]
+        del legend.texts[index]
+        del legend.legend_handles[index]
+        legend.stale = True
+
+
+    def _rebuild_legend(self, ax2: Axes, geometry: CourseGeometry) -> None:
+        """Build the legend from all current courses."""
+        if self.render_mode == RenderMode.BATCHED:
+            ax2.legend(handles=self._legend_handles(geometry))
+        else:
+            ax2.legend()
+
+
+    def _course_values(self, index: int, geometry: CourseGeometry) -> tuple:
+        """Course, position, size and color of one course."""
+        return (
+            self.courses[index],
+            float(geometry.x[index]),
+            float(geometry.widths[index]),
+            float(geometry.start_minutes[index]),
+            float(geometry.durations[index]),
+            geometry.colors[index],
+        )
+
+
+    def _course_patch(self, subject, x: float, width: float, y: float, height: float, color) -> Rectangle:
+        """Rectangle of one course."""
+        return Rectangle(
+            xy=(x, y),
+            width=width,
+            height=height,
+            facecolor=color,
+            edgecolor=self.theme.font_color,
+            label=subject.course_name,
+        )
+
+
+    def _add_course_label(self, ax2: Axes, subject, x: float, width: float, y: float, height: float) -> None:
+        """Write the shortened course name into its rectangle."""
+        ax2.text(
+            x + width * 0.3,
+            y + height * 0.7,
+            subject.course_name[0:6],
+            zorder=3,
+        )
+
+
+    def _course_verts(self, geometry: CourseGeometry) -> np.ndarray:
+        """Corners of all course rectangles for a PolyCollection."""
+        x = geometry.x
+        width = geometry.widths
+        y = geometry.start_minutes.astype(float)
+        height = geometry.durations.astype(float)
+
+        verts = np.empty((len(geometry), 4, 2))
+        verts[:, :, 0] = x[:, None] + width[:, None] * np.array([0, 1, 1, 0])
+        verts[:, :, 1] = y[:, None] + height[:, None] * np.array([0, 0, 1, 1])
+        return verts
+
+
+    def _refresh_collection(self, ax2: Axes, geometry: CourseGeometry) -> None:
+        """Replace the rectangles and colors of the course collection."""
+        periods = ax2.collections[0]
+        periods.set_verts(self._course_verts(geometry))
+        periods.set_facecolors(geometry.colors)
+
+
+    def _legend_handles(self, geometry: CourseGeometry) -> list[Patch]:
+        """Proxy legend entries of all courses."""
+        return [
+            self._legend_handle(subject, color)
+            for subject, color in zip(self.courses, geometry.colors)
+        ]
+
+
+    def _legend_handle(self, subject, color) -> Patch:
+        """Proxy legend entry of one course."""
+        return Patch(facecolor=color, edgecolor=self.theme.font_color, label=subject.course_name)
+
+
+def _legend_entries(ax2: Axes) -> list | None:
+    """Entry boxes of the legend of the axes, None if it is missing or empty."""
+    legend = ax2.get_legend()
+    if legend is None:
+        return None
+    return _legend_entries_of(legend)
+
 
-        ax2.legend()
\ No newline at end of file
+def _legend_entries_of(legend: Legend) -> list | None:
+    """Entry boxes of a single column legend, which can be edited in place."""
+    columns = legend._legend_handle_box.get_children()
+    if len(columns) != 1:
+        return None
+    return columns[0].get_children()
@@ -1,7 +1,18 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Number of palettes kept per colormap range, one for every course count.
+_PALETTE_CACHE_SIZE: int = 256
+
+
+@dataclass(frozen=True)
+class Palette:
+    """Course colors of a theme, as given by color_list and as hex strings for plotly."""
+    colors: tuple
+    hex_colors: tuple[str, ...]
 
 
 class Theme(ABC):
@@ -12,74 +23,100 @@ class Theme(ABC):
         """Creates a list of n colors where n is the number of courses"""
         pass
 
+    def palette(self, number_of_courses: int) -> Palette:
+        """Colors of n courses together with their hex strings"""
+        from matplotlib.colors import to_hex
 
-class DarkTheme(Theme):
-    """Dark theme for the timetable"""
-    def __init__(self):
-        self.cmap = plt.get_cmap("bone")
-        self.theme_color = "midnightblue"
-        self.font_color = "white"
+        colors = tuple(self.color_list(number_of_courses))
+        return Palette(colors, tuple(to_hex(color) for color in colors))
 
-    def color_list(self, number_of_courses: int) -> list:
-        """List of colors for the dark theme"""
-        return [self.cmap(i) for i in np.linspace(0.1, 0.5, number_of_courses)]
 
+class ColormapTheme(Theme):
+    """Theme whose course colors are sampled from a matplotlib colormap.
 
-class LightTheme(Theme):
-    """Light theme for the timetable"""
-    def __init__(self):
-        self.cmap = plt.get_cmap("Blues")
-        self.theme_color = "powderblue"
-        self.font_color = "black"
+    The colormap is only looked up on first use, so importing the themes
+    does not import matplotlib.
+    """
+    cmap_name: str
+    color_range: tuple[float, float]
+    theme_color: str
+    font_color: str
+
+    @cached_property
+    def cmap(self):
+        """Matplotlib colormap of the theme."""
+        from matplotlib import colormaps
+
+        return colormaps[self.cmap_name]
 
     def color_list(self, number_of_courses: int) -> list:
-        """List of colors for the light theme"""
-        return [self.cmap(i) for i in np.linspace(0.2, 0.6, number_of_courses)]
+        """List of colors sampled evenly from the theme's colormap range"""
+        return list(self.palette(number_of_courses).colors)
 
+    def palette(self, number_of_courses: int) -> Palette:
+        """Memoised palette of n courses, shared by all themes with the same colormap range"""
+        return _colormap_palette(self.cmap_name, *self.color_range, number_of_courses)
 
-class RainbowTheme(Theme):
-    """Rainbow theme for the timetable"""
-    def __init__(self):
-        self.cmap = plt.get_cmap("rainbow")
-        self.theme_color = "crimson"
-        self.font_color = "lightgrey"
 
-    def color_list(self, number_of_courses: int) -> list:
-        """List of colors for the rainbow theme"""
-        return [self.cmap(i) for i in np.linspace(0, 1, number_of_courses)]
+@lru_cache(maxsize=_PALETTE_CACHE_SIZE)
+def _colormap_palette(cmap_name: str, start: float, stop: float, number_of_courses: int) -> Palette:
+    """Sample a colormap at n evenly spaced points with one vectorised call."""
+    from matplotlib import colormaps
 
+    rgba = colormaps[cmap_name](np.linspace(start, stop, number_of_courses))
+    # Same rounding as matplotlib.colors.to_hex.
+    rgb = np.round(rgba[:, :3] * 255).astype(np.int64)
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
 
-class AutumnTheme(Theme):
-    """Autumn theme for the timetable"""
-    def __init__(self):
-        self.cmap = plt.get_cmap("autumn")
-        self.theme_color = "maroon"
-        self.font_color = "white"
+    return Palette(
+        colors=tuple(map(tuple, rgba.tolist())),
+        hex_colors=tuple(f"#{value:06x}" for value in packed.tolist()),
+    )
 
-    def color_list(self, number_of_courses: int) -> list:
-        """List of colors for the autumn theme"""
-        return [self.cmap(i) for i in np.linspace(0, 0.85, number_of_courses)]
 
+class DarkTheme(ColormapTheme):
+    """Dark theme for the timetable"""
+    cmap_name = "bone"
+    color_range = (0.1, 0.5)
+    theme_color = "midnightblue"
+    font_color = "white"
 
-class NeutralTheme(Theme):
-    """Neutral theme for the timetable"""
-    def __init__(self):
-        self.cmap = plt.get_cmap("copper")
-        self.theme_color = "tan"
-        self.font_color = "black"
 
-    def color_list(self, number_of_courses: int) -> list:
-        """List of colors for the neutral theme"""
-        return [self.cmap(i) for i in np.linspace(0.25, 1, number_of_courses)]
+class LightTheme(ColormapTheme):
+    """Light theme for the timetable"""
+    cmap_name = "Blues"
+    color_range = (0.2, 0.6)
+    theme_color = "powderblue"
+    font_color = "black"
 
 
-class NatureTheme(Theme):
-    """Nature theme for the timetable"""
-    def __init__(self):
-        self.cmap = plt.get_cmap("summer")
-        self.theme_color = "lightgreen"
-        self.font_color = "darkslategrey"
+class RainbowTheme(ColormapTheme):
+    """Rainbow theme for the timetable"""
+    cmap_name = "rainbow"
+    color_range = (0, 1)
+    theme_color = "crimson"
+    font_color = "lightgrey"
 
-    def color_list(self, number_of_courses: int) -> list:
-        """List of colors for the nature theme"""
-        return [self.cmap(i) for i in np.linspace(0, 1, number_of_courses)]
\ No newline at end of file
+
+class AutumnTheme(ColormapTheme):
+    """Autumn theme for the timetable"""
+    cmap_name = "autumn"
+    color_range = (0, 0.85)
+    theme_color = "maroon"
+    font_color = "white"
+
+
+class NeutralTheme(ColormapTheme):
+    """Neutral theme for the timetable"""
+    cmap_name = "copper"
+    color_range = (0.25, 1)
+    theme_color = "tan"
+    font_color = "black"
+
+
+class NatureTheme(ColormapTheme):
+    """Nature theme for the timetable"""
+    cmap_name = "summer"
+    color_range = (0, 1)
+    theme_color = "lightgreen"
+    font_color = "darkslategrey"
@@ -1,13 +1,46 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
+from itertools import chain
+from io import BytesIO
+from pathlib import Path
+import re
+import sys
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
+from src.study_planner.instrumentation import instrumented
+from src.study_planner.intervals import assign_lanes
 from src.study_planner.themes import Theme
 
+_PADDING_MINUTES: int = 120
+
+# Same times as datetime.strptime(..., "%H:%M") accepts, e.g. "9:15" or "09:15".
+_TIME_PATTERN = re.compile(r"([01]?[0-9]|2[0-3]):([0-5]?[0-9])")
+
+# Number of invalid rows quoted in the error message of parse_times.
+_MAX_REPORTED_ROWS: int = 5
+
+# Credits and durations are stored as int16, see CourseTable.
+_SMALL_INT = np.iinfo(np.int16)
+
+# Y-range shown when a timetable has no courses yet.
+_DEFAULT_DAY_START: int = 8 * 60
+_DEFAULT_DAY_END: int = 18 * 60
+
+# Skeletons kept per backend, one for every theme, figure size and y-range in use.
+_SKELETON_CACHE_SIZE: int = 32
+
+# Steps through the candidate palette of a course added to an open figure
+# by the golden ratio, so courses added one after the other get colors far
+# apart, see TimetableLayout.add_course.
+_GOLDEN_STEP: float = (5 ** 0.5 - 1) / 2
+
 
 class WeekDay(StrEnum):
     """Distinct weekdays by name."""
@@ -21,9 +54,32 @@ class WeekDay(StrEnum):
     SATURDAY = "Saturday"
 
 
-@dataclass
+WEEKDAYS: list[WeekDay] = list(WeekDay)
+
+
+class RenderMode(StrEnum):
+    """Distinct strategies for drawing the courses by name."""
+
+    PER_COURSE = "per_course"
+    BATCHED = "batched"
+
+
+class ExportFormat(StrEnum):
+    """Distinct file formats a timetable can be exported to."""
+
+    PNG = "png"
+    SVG = "svg"
+    PDF = "pdf"
+    HTML = "html"
+
+
+@dataclass(slots=True)
 class Course:
-    """One university course."""
+    """One university course.
+
+    Text fields are interned, so courses sharing a room or lecturer share
+    one string. Raises a ValueError if the start time is not 'HH:MM'.
+    """
     course_name: str
     credits: int
     week_day: WeekDay
@@ -32,6 +88,283 @@ class Course:
     room: str
     lecturer: str
 
+    def __post_init__(self) -> None:
+        """Intern the text fields and validate the start time."""
+        self.course_name = _intern(self.course_name)
+        self.start_time = _intern(self.start_time)
+        self.room = _intern(self.room)
+        self.lecturer = _intern(self.lecturer)
+        minutes_since_midnight(self.start_time)
+
+    @property
+    def start_minute(self) -> int:
+        """Start time in minutes since midnight, parsed once per distinct time."""
+        return minutes_since_midnight(self.start_time)
+
+    def freeze(self) -> "FrozenCourse":
+        """Return an immutable, hashable copy of the course."""
+        return FrozenCourse(
+            self.course_name, self.credits, self.week_day, self.start_time,
+            self.duration_minutes, self.room, self.lecturer,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenCourse:
+    """Immutable and hashable variant of ``Course``, e.g. for sets and cache keys."""
+    course_name: str
+    credits: int
+    week_day: WeekDay
+    start_time: str
+    duration_minutes: int
+    room: str
+    lecturer: str
+
+    def __post_init__(self) -> None:
+        """Intern the text fields and validate the start time."""
+        set_field = object.__setattr__
+        set_field(self, "course_name", _intern(self.course_name))
+        set_field(self, "start_time", _intern(self.start_time))
+        set_field(self, "room", _intern(self.room))
+        set_field(self, "lecturer", _intern(self.lecturer))
+        minutes_since_midnight(self.start_time)
+
+    @property
+    def start_minute(self) -> int:
+        """Start time in minutes since midnight, parsed once per distinct time."""
+        return minutes_since_midnight(self.start_time)
+
+    def thaw(self) -> Course:
+        """Return a mutable copy of the course."""
+        return Course(
+            self.course_name, self.credits, self.week_day, self.start_time,
+            self.duration_minutes, self.room, self.lecturer,
+        )
+
+
+@dataclass(eq=False)
+class CourseTable:
+    """Columnar representation of many courses.
+
+    Numeric fields are stored as small integer NumPy arrays, week days as
+    codes into ``WEEKDAYS`` and the text fields as pandas categoricals, so
+    every distinct room, lecturer or start time is stored only once.
+    """
+    course_name: pd.Categorical
+    credits: np.ndarray
+    week_day: np.ndarray
+    start_time: pd.Categorical
+    start_minutes: np.ndarray
+    duration_minutes: np.ndarray
+    room: pd.Categorical
+    lecturer: pd.Categorical
+
+    @classmethod
+    def from_courses(cls, courses: list[Course]) -> "CourseTable":
+        """Build a course table from a list of courses."""
+        day_codes = {day: i for i, day in enumerate(WEEKDAYS)}
+
+        try:
+            week_day = np.fromiter(
+                (day_codes[c.week_day] for c in courses), dtype=np.int8, count=len(courses)
+            )
+        except KeyError as error:
+            raise ValueError(f"Unknown week day: {error.args[0]}") from None
+
+        return cls._from_columns(
+            course_name=[c.course_name for c in courses],
+            credits=[c.credits for c in courses],
+            week_day=week_day,
+            start_time=[c.start_time for c in courses],
+            duration_minutes=[c.duration_minutes for c in courses],
+            room=[c.room for c in courses],
+            lecturer=[c.lecturer for c in courses],
+            # Courses already know their start minute, see Course.start_minute.
+            start_minutes=np.fromiter(
+                (c.start_minute for c in courses), dtype=np.int16, count=len(courses)
+            ),
+        )
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "CourseTable":
+        """Build a course table from a dataframe as returned by the loaders."""
+        if df.index.name == "course_name":
+            df = df.reset_index()
+
+        week_day = pd.Categorical(df["week_day"], categories=WEEKDAYS).codes
+        if (week_day < 0).any():
+            unknown = df["week_day"][week_day < 0].iloc[0]
+            raise ValueError(f"Unknown week day: {unknown}")
+
+        return cls._from_columns(
+            course_name=df["course_name"],
+            credits=df["credits"],
+            week_day=week_day,
+            start_time=df["start_time"],
+            duration_minutes=df["duration_minutes"],
+            room=df["room"],
+            lecturer=df["lecturer"],
+        )
+
+    @classmethod
+    def _from_columns(
+        cls, course_name, credits, week_day, start_time, duration_minutes, room, lecturer,
+        start_minutes: np.ndarray | None = None,
+    ) -> "CourseTable":
+        """Build a course table from column sequences, parsing the start times if not given."""
+        start_time = pd.Categorical(start_time)
+        if start_minutes is None:
+            # Every distinct start time is parsed only once.
+            start_minutes = parse_times(start_time.categories)[start_time.codes]
+
+        return cls(
+            course_name=pd.Categorical(course_name),
+            credits=_small_ints(credits, "credits"),
+            week_day=np.asarray(week_day, dtype=np.int8),
+            start_time=start_time,
+            start_minutes=start_minutes,
+            duration_minutes=_small_ints(duration_minutes, "duration_minutes"),
+            room=pd.Categorical(room),
+            lecturer=pd.Categorical(lecturer),
+        )
+
+    @classmethod
+    def concat(cls, tables: list["CourseTable"]) -> "CourseTable":
+        """Join course tables, merging the categories of their text columns."""
+        if not tables:
+            return cls.from_courses([])
+
+        return cls(
+            course_name=union_categoricals([t.course_name for t in tables]),
+            credits=np.concatenate([t.credits for t in tables]),
+            week_day=np.concatenate([t.week_day for t in tables]),
+            start_time=union_categoricals([t.start_time for t in tables]),
+            start_minutes=np.concatenate([t.start_minutes for t in tables]),
+            duration_minutes=np.concatenate([t.duration_minutes for t in tables]),
+            room=union_categoricals([t.room for t in tables]),
+            lecturer=union_categoricals([t.lecturer for t in tables]),
+        )
+
+    @property
+    def end_minutes(self) -> np.ndarray:
+        """End of every course in minutes since midnight of its week day."""
+        return self.start_minutes.astype(np.int32) + self.duration_minutes
+
+    def to_courses(self) -> list[Course]:
+        """Convert the table back into a list of courses."""
+        return list(self)
+
+    def to_df(self) -> pd.DataFrame:
+        """Generate dataframe representation with categorical text columns."""
+        df = pd.DataFrame(
+            {
+                "credits": self.credits,
+                "week_day": pd.Categorical.from_codes(self.week_day, categories=WEEKDAYS),
+                "start_time": self.start_time,
+                "duration_minutes": self.duration_minutes,
+                "room": self.room,
+                "lecturer": self.lecturer,
+            },
+            index=pd.CategoricalIndex(self.course_name, name="course_name"),
+            copy=False,
+        )
+        return df
+
+    def __iter__(self):
+        """Iterate over the rows as courses."""
+        columns = zip(
+            self.course_name,
+            self.credits.tolist(),
+            self.week_day.tolist(),
+            self.start_time,
+            self.duration_minutes.tolist(),
+            self.room,
+            self.lecturer,
+        )
+        for name, credits, day, start, duration, room, lecturer in columns:
+            yield Course(name, credits, WEEKDAYS[day], start, duration, room, lecturer)
+
+    def __getitem__(self, key) -> "CourseTable":
+        """Select rows by slice, boolean mask or integer positions."""
+        return CourseTable(
+            course_name=self.course_name[key],
+            credits=self.credits[key],
+            week_day=self.week_day[key],
+            start_time=self.start_time[key],
+            start_minutes=self.start_minutes[key],
+            duration_minutes=self.duration_minutes[key],
+            room=self.room[key],
+            lecturer=self.lecturer[key],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of courses in the table."""
+        return len(self.credits)
+
+
+@dataclass(eq=False)
+class CourseGeometry:
+    """Positions and colors of the courses, computed once per render.
+
+    ``x`` is the left edge of each course in figure units (one day is
+    ``day_width`` wide). Overlapping courses of a day share its width in
+    side-by-side lanes, so ``widths`` holds the width of every course.
+    ``end_minutes`` already includes the midnight rollover. ``hex_colors``
+    holds the same colors as hex strings.
+    """
+    day_width: float
+    x: np.ndarray
+    widths: np.ndarray
+    start_minutes: np.ndarray
+    end_minutes: np.ndarray
+    colors: list
+    hex_colors: list[str]
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Duration of every course in minutes."""
+        return self.end_minutes - self.start_minutes
+
+    def __len__(self) -> int:
+        """Return the number of courses in the geometry."""
+        return len(self.x)
+
+
+class SkeletonCache:
+    """Least recently used cache of the parts of a figure that do not show courses.
+
+    The header, the day grid and the hour axis only depend on the theme
+    colors, the figure size and the y-range, so every render sharing those
+    starts from one skeleton built once and only adds its courses.
+    """
+    def __init__(self, maxsize: int = _SKELETON_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], object]):
+        """Return the skeleton of a key, building and storing it on a miss."""
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        skeleton = build()
+        self._entries[key] = skeleton
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return skeleton
+
+    def clear(self) -> None:
+        """Drop all skeletons."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached skeletons."""
+        return len(self._entries)
+
 
 @dataclass
 class Timetable:
@@ -43,9 +376,23 @@ class Timetable:
         self.courses.append(course)
 
     def to_df(self) -> pd.DataFrame:
-        """Generate dataframe representation of timetable."""
-        courses_dict = asdict(self)
-        courses_df = pd.DataFrame(courses_dict["courses"]).set_index("course_name")
+        """Generate dataframe representation of timetable.
+
+        The columns are built directly from the course attributes instead
+        of copying every course into a dict first.
+        """
+        courses = self.courses
+        courses_df = pd.DataFrame(
+            {
+                "credits": [c.credits for c in courses],
+                "week_day": [c.week_day for c in courses],
+                "start_time": [c.start_time for c in courses],
+                "duration_minutes": [c.duration_minutes for c in courses],
+                "room": [c.room for c in courses],
+                "lecturer": [c.lecturer for c in courses],
+            },
+            index=pd.Index([c.course_name for c in courses], name="course_name"),
+        )
         return courses_df
 
     def __len__(self) -> int:
@@ -55,36 +402,81 @@ class Timetable:
 
 class TimetableLayout(ABC):
     """Abstract base class for timetable layouts"""
+    export_formats: tuple[ExportFormat, ...] = ()
+
     def __init__(
         self,
-        courses: list[Course],
+        courses: list[Course] | CourseTable,
         theme: Theme,
         figsize_timetable: tuple[float, float],
-        user: str
+        user: str,
+        render_mode: RenderMode = RenderMode.PER_COURSE,
     ):
         self.courses = courses
         self.theme = theme
         self.figsize_timetable = figsize_timetable
         self.user = user
+        self.render_mode = RenderMode(render_mode)
 
-    def calc_yrange_for_plotting(self) -> np.ndarray:
-        """Calculate the time range on the y-axis for plotting."""
-        start_minutes = []
-        end_minutes = []
+        # Persistent figure edited in place by add_course, remove_course and
+        # update_course, with the geometry and y-range it currently shows.
+        self.figure = None
+        self._geometry: CourseGeometry | None = None
+        self._y_ticks: np.ndarray | None = None
+        # Color and hex color of every course while a figure is open, so an
+        # edit never recolors the other courses.
+        self._course_colors: list[tuple] | None = None
+
+    def course_table(self) -> CourseTable:
+        """Return the courses of the layout as a course table."""
+        if isinstance(self.courses, CourseTable):
+            return self.courses
+        return CourseTable.from_courses(self.courses)
+
+    @instrumented
+    def compute_course_geometry(self) -> CourseGeometry:
+        """Compute day positions, start/end minutes and colors of all courses."""
+        table = self.course_table()
+        day_width = self.figsize_timetable[0] / len(WeekDay)
 
-        for subject in self.courses:
-            start: int = minutes_since_midnight(subject.start_time)
-            end: int = minutes_since_midnight(subject.start_time) + subject.duration_minutes
+        start_minutes = table.start_minutes.astype(np.int64)
+        end_minutes = start_minutes + table.duration_minutes
 
-            # Detect rollover past midnight
-            if end < start:
-                end += 24 * 60
+        # Detect rollover past midnight
+        end_minutes = np.where(end_minutes < start_minutes, end_minutes + 24 * 60, end_minutes)
 
-            start_minutes.append(start)
-            end_minutes.append(end)
+        lanes, lane_counts = assign_lanes(start_minutes, end_minutes, table.week_day)
+        widths = day_width / lane_counts
+
+        if self._course_colors is None:
+            palette = self.theme.palette(len(table))
+            colors, hex_colors = list(palette.colors), list(palette.hex_colors)
+        else:
+            colors = [color for color, _ in self._course_colors]
+            hex_colors = [hex_color for _, hex_color in self._course_colors]
+
+        return CourseGeometry(
+            day_width=day_width,
+            x=(np.arange(len(WeekDay)) * day_width)[table.week_day] + lanes * widths,
+            widths=widths,
+            start_minutes=start_minutes,
+            end_minutes=end_minutes,
+            colors=colors,
+            hex_colors=hex_colors,
+        )
+
+    @instrumented
+    def calc_yrange_for_plotting(self, geometry: CourseGeometry | None = None) -> np.ndarray:
+        """Calculate the time range on the y-axis for plotting."""
+        if geometry is None:
+            geometry = self.compute_course_geometry()
 
-        earliest_time: int = min(start_minutes) - 120
-        latest_time: int = max(end_minutes) + 120
+        if len(geometry) == 0:
+            earliest_time = _DEFAULT_DAY_START
+            latest_time = _DEFAULT_DAY_END
+        else:
+            earliest_time = int(geometry.start_minutes.min()) - _PADDING_MINUTES
+            latest_time = int(geometry.end_minutes.max()) + _PADDING_MINUTES
 
         earliest_hour: int = (earliest_time // 60) * 60
         latest_hour: int = ((latest_time + 59) // 60) * 60
@@ -98,20 +490,272 @@ class TimetableLayout(ABC):
         """Plotting the timetable with courses."""
         pass
 
+    def skeleton_key(self, y_ticks: np.ndarray) -> tuple:
+        """Everything the skeleton of the figure depends on, see SkeletonCache."""
+        return (
+            str(self.theme.theme_color),
+            str(self.theme.font_color),
+            tuple(float(size) for size in self.figsize_timetable),
+            tuple(y_ticks.tolist()),
+        )
+
+    def open_figure(self):
+        """Build the persistent figure that is edited in place by the course edits.
+
+        The figure is drawn in the colors of a plain render. While it is
+        open, every course keeps the color it got when it was drawn, so
+        adding or removing a course does not recolor the others.
+        """
+        self._course_colors = None
+        self.figure = self.display_timetable()
+        self._geometry = self.compute_course_geometry()
+        self._course_colors = list(zip(self._geometry.colors, self._geometry.hex_colors))
+        self._y_ticks = self.calc_yrange_for_plotting(self._geometry)
+        return self.figure
+
+    def add_course(self, course: Course) -> None:
+        """Append a course and draw only its artists on the open figure.
+
+        The new course gets a color of the theme that no other course on the
+        open figure has, as long as the theme has one.
+        """
+        courses = self._editable_courses()
+        courses.append(course)
+        if self._course_colors is not None:
+            self._course_colors.append(self._unused_color())
+        self._apply_edit(inserted=len(courses) - 1)
+
+    def remove_course(self, index: int) -> Course:
+        """Remove a course by position and erase only its artists from the open figure."""
+        courses = self._editable_courses()
+        index = range(len(courses))[index]
+        course = courses.pop(index)
+        if self._course_colors is not None:
+            del self._course_colors[index]
+        self._apply_edit(removed=index)
+        return course
+
+    def update_course(self, index: int, course: Course) -> None:
+        """Replace a course by position and redraw only the artists that changed."""
+        courses = self._editable_courses()
+        index = range(len(courses))[index]
+        courses[index] = course
+        self._apply_edit(updated=index)
+
+    def _unused_color(self) -> tuple:
+        """Color and hex color for a new course that no course on the open figure has.
+
+        The candidates are a palette of twice as many colors as courses,
+        tried in golden ratio steps and then in order. Falls back to the
+        first candidate if the theme has no unused color left.
+        """
+        used = {hex_color for _, hex_color in self._course_colors}
+        size = 2 * (len(self._course_colors) + 1)
+        palette = self.theme.palette(size)
+        steps = (int(step * _GOLDEN_STEP % 1 * size) for step in range(size))
+        for i in chain(steps, range(size)):
+            if palette.hex_colors[i] not in used:
+                return palette.colors[i], palette.hex_colors[i]
+        return palette.colors[0], palette.hex_colors[0]
+
+    def _editable_courses(self) -> list[Course]:
+        """Courses of the layout as a list that can be edited."""
+        if isinstance(self.courses, CourseTable):
+            self.courses = self.courses.to_courses()
+        return self.courses
+
+    @instrumented
+    def _apply_edit(
+        self,
+        inserted: int | None = None,
+        removed: int | None = None,
+        updated: int | None = None,
+    ) -> None:
+        """Bring the open figure up to date after one course was edited.
+
+        The geometry is recomputed with NumPy, but only the artists of the
+        edited course and of courses whose lane changed are touched. Colors
+        stay with their courses, see open_figure. The y-axis is only
+        redrawn when its range changed.
+        """
+        if self.figure is None:
+            return
+
+        old = self._geometry
+        new = self.compute_course_geometry()
+
+        # Rows of the old geometry that still exist, and where they are now.
+        old_rows = np.arange(len(old))
+        if removed is not None:
+            old_rows = np.delete(old_rows, removed)
+            self.erase_course(removed, new)
+        new_rows = np.arange(len(old_rows))
+
+        old_colors = np.asarray(old.hex_colors, dtype=object)
+        new_colors = np.asarray(new.hex_colors, dtype=object)
+        changed = (
+            (old.x[old_rows] != new.x[new_rows])
+            | (old.widths[old_rows] != new.widths[new_rows])
+            | (old.start_minutes[old_rows] != new.start_minutes[new_rows])
+            | (old.end_minutes[old_rows] != new.end_minutes[new_rows])
+            | (old_colors[old_rows] != new_colors[new_rows])
+        )
+        if updated is not None:
+            changed[updated] = True
+        redrawn = new_rows[changed].tolist()
+
+        if redrawn:
+            self.redraw_courses(redrawn, new)
+        if inserted is not None:
+            self.draw_course(inserted, new)
+
+        y_ticks = self.calc_yrange_for_plotting(new)
+        if not np.array_equal(y_ticks, self._y_ticks):
+            self.redraw_y_range(y_ticks)
+            self._y_ticks = y_ticks
+
+        self._geometry = new
+
+    @abstractmethod
+    def draw_course(self, index: int, geometry: CourseGeometry) -> None:
+        """Add the artists and legend entry of one new course to the open figure."""
+        pass
+
+    @abstractmethod
+    def erase_course(self, index: int, geometry: CourseGeometry) -> None:
+        """Remove the artists and legend entry of one course from the open figure."""
+        pass
+
+    @abstractmethod
+    def redraw_courses(self, indices: list[int], geometry: CourseGeometry) -> None:
+        """Update position, color and label of existing course artists."""
+        pass
+
+    @abstractmethod
+    def redraw_y_range(self, y_ticks: np.ndarray) -> None:
+        """Update the y-axis of the open figure."""
+        pass
+
+    @instrumented
+    def export(
+        self,
+        target,
+        export_format: ExportFormat | None = None,
+        self_contained: bool = True,
+    ) -> None:
+        """Render the timetable and write it to a file path or a file-like object.
+
+        Without an explicit format it is taken from the file suffix. Html is
+        self-contained by default and links plotly.js from a CDN otherwise.
+        """
+        if export_format is None:
+            if not isinstance(target, (str, Path)):
+                raise ValueError("An export format is required when exporting to a file object.")
+            export_format = Path(target).suffix.lstrip(".").lower()
+
+        try:
+            export_format = ExportFormat(export_format)
+        except ValueError:
+            raise ValueError(f"Unknown export format: {export_format}") from None
+
+        if export_format not in self.export_formats:
+            raise ValueError(
+                f"{type(self).__name__} cannot be exported as {export_format}, "
+                f"choose one of: {', '.join(self.export_formats)}"
+            )
+
+        self.write_figure(self.export_figure(), target, export_format, self_contained)
+
+    @instrumented
+    def export_bytes(self, export_format: ExportFormat, self_contained: bool = True) -> bytes:
+        """Render the timetable and return the exported file content."""
+        buffer = BytesIO()
+        self.export(buffer, export_format, self_contained)
+        return buffer.getvalue()
+
+    def export_figure(self):
+        """Render the figure that export writes, the displayed figure by default."""
+        return self.display_timetable()
+
+    @abstractmethod
+    def write_figure(self, fig, target, export_format: ExportFormat, self_contained: bool) -> None:
+        """Write a rendered figure to a file path or a file-like object."""
+        pass
+
     def create_timetable_header(self, ax):
         """Create the timetable header with week days."""
         pass
 
-    def create_timetable_layout(self, ax):
+    def create_timetable_layout(self, ax, geometry: CourseGeometry | None = None):
         """Creating timetable layout"""
         pass
 
-    def display_courses(self, ax):
+    def display_courses(self, ax, geometry: CourseGeometry | None = None):
         """Plotting the courses into the timetable layout"""
         pass
 
 
+def _intern(value):
+    """Intern a string, e.g. a room repeated across many courses, leave other values as they are."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=4096)
 def minutes_since_midnight(date: str) -> int:
     """Return the number of minutes since midnight"""
-    date_as_datetime = datetime.strptime(date, "%H:%M")
-    return date_as_datetime.hour * 60 + date_as_datetime.minute
\ No newline at end of file
+    match = _TIME_PATTERN.fullmatch(date)
+    if match is None:
+        raise ValueError(f"time data {date!r} does not match format 'HH:MM'")
+    return int(match[1]) * 60 + int(match[2])
+
+
+def parse_times(times) -> np.ndarray:
+    """Convert a column of 'HH:MM' strings into minutes since midnight.
+
+    Every distinct value is parsed only once. Raises a ValueError naming the
+    offending rows if any value is not a valid 24 hour time.
+    """
+    minutes, invalid = _parse_times(times)
+
+    if invalid.any():
+        rows = np.flatnonzero(invalid)
+        values = np.asarray(times, dtype=object)[rows[:_MAX_REPORTED_ROWS]]
+        details = ", ".join(f"row {row}: {value!r}" for row, value in zip(rows, values))
+        if len(rows) > _MAX_REPORTED_ROWS:
+            details += f", ... ({len(rows)} invalid rows in total)"
+        raise ValueError(f"Invalid start times, expected 'HH:MM' in 24 hour format ({details})")
+
+    return minutes
+
+
+def _small_ints(values, column: str) -> np.ndarray:
+    """Convert a numeric column to int16, raising a ValueError for values that do not fit."""
+    wide = np.asarray(values, dtype=np.int64)
+    out_of_range = (wide < _SMALL_INT.min) | (wide > _SMALL_INT.max)
+
+    if out_of_range.any():
+        rows = np.flatnonzero(out_of_range)
+        details = ", ".join(f"row {row}: {wide[row]}" for row in rows[:_MAX_REPORTED_ROWS])
+        if len(rows) > _MAX_REPORTED_ROWS:
+            details += f", ... ({len(rows)} invalid rows in total)"
+        raise ValueError(
+            f"Invalid {column}, expected values from {_SMALL_INT.min} to {_SMALL_INT.max} ({details})"
+        )
+
+    return wide.astype(np.int16)
+
+
+def _parse_times(times) -> tuple[np.ndarray, np.ndarray]:
+    """Return minutes since midnight and a mask of the rows that failed to parse."""
+    codes, uniques = pd.factorize(np.asarray(times, dtype=object), use_na_sentinel=False)
+    hours_minutes = pd.Series(uniques, dtype="string").str.extract(
+        rf"\A(?:{_TIME_PATTERN.pattern})\Z"
+    )
+    valid = hours_minutes[0].notna().to_numpy(dtype=bool)
+
+    minutes_per_unique = np.zeros(len(uniques), dtype=np.int16)
+    minutes_per_unique[valid] = (
+        hours_minutes[0][valid].astype(int) * 60 + hours_minutes[1][valid].astype(int)
+    ).to_numpy(dtype=np.int16)
+
+    return minutes_per_unique[codes], ~valid[codes]
@@ -0,0 +1,203 @@
+from functools import cached_property
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.study_planner.timetable import Course, CourseTable, Timetable, WeekDay, WEEKDAYS
+
+TIMETABLE_FILE_SUFFIX: str = ".ttb"
+
+_MAGIC: bytes = b"STPLTTB\x01"
+
+# Sections are aligned so that every memory-mapped array starts on a
+# cache line and can be read without copying.
+_ALIGNMENT: int = 64
+
+# One fixed size record per course. Text fields are codes into the
+# categories stored in the header.
+_RECORD_DTYPE = np.dtype([
+    ("course_name", "<i4"),
+    ("start_time", "<i4"),
+    ("room", "<i4"),
+    ("lecturer", "<i4"),
+    ("credits", "<i2"),
+    ("start_minutes", "<i2"),
+    ("duration_minutes", "<i2"),
+    ("week_day", "i1"),
+    ("_padding", "i1"),
+])
+
+_TEXT_COLUMNS: tuple[str, ...] = ("course_name", "start_time", "room", "lecturer")
+
+# Columns with a row index, so their values can be sliced without a scan.
+_INDEXED_COLUMNS: tuple[str, ...] = ("week_day", "room", "lecturer")
+
+
+def write_timetable_file(
+    path: Path,
+    courses: Timetable | pd.DataFrame | CourseTable | list[Course],
+) -> None:
+    """Write courses to a binary timetable file.
+
+    The file holds a small json header with the distinct text values,
+    followed by one fixed size record per course and, for every indexed
+    column, the row numbers sorted by value.
+    """
+    table = _as_course_table(courses)
+
+    records = np.zeros(len(table), dtype=_RECORD_DTYPE)
+    categories = {}
+    for column in _TEXT_COLUMNS:
+        values: pd.Categorical = getattr(table, column)
+        records[column] = values.codes
+        categories[column] = [str(value) for value in values.categories]
+    records["credits"] = table.credits
+    records["start_minutes"] = table.start_minutes
+    records["duration_minutes"] = table.duration_minutes
+    records["week_day"] = table.week_day
+
+    sections = [records.tobytes()]
+    indexes = {}
+    for column in _INDEXED_COLUMNS:
+        codes = records[column].astype(np.int64)
+        number_of_values = len(WEEKDAYS) if column == "week_day" else len(categories[column])
+        order = np.argsort(codes, kind="stable").astype("<i4")
+        bounds = np.searchsorted(codes[order], np.arange(number_of_values + 1))
+        indexes[column] = {"bounds": bounds.tolist()}
+        sections.append(order.tobytes())
+
+    header = {"rows": len(table), "categories": categories, "indexes": indexes}
+    header_bytes = json.dumps(header).encode()
+
+    # The offsets depend on the header length, which depends on the offsets,
+    # so the header is padded to a fixed guess that grows until it fits.
+    reserved = _align(len(header_bytes) + 256)
+    while True:
+        offset = _align(len(_MAGIC) + 8 + reserved)
+        offsets = []
+        for section in sections:
+            offsets.append(offset)
+            offset = _align(offset + len(section))
+        header["offsets"] = offsets
+        header_bytes = json.dumps(header).encode()
+        if len(header_bytes) <= reserved:
+            break
+        reserved = _align(len(header_bytes) + 256)
+
+    with open(path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(len(header_bytes).to_bytes(8, "little"))
+        file.write(header_bytes)
+        for section, section_offset in zip(sections, offsets):
+            file.write(b"\0" * (section_offset - file.tell()))
+            file.write(section)
+
+
+class TimetableFile:
+    """Read-only view of a binary timetable file.
+
+    The records are memory-mapped, so opening a file only reads its header
+    and selecting a week day, room or lecturer only touches the pages of
+    the matching courses.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+        with open(self.path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{self.path} is not a timetable file")
+            header_length = int.from_bytes(file.read(8), "little")
+            header = json.loads(file.read(header_length))
+
+        self.rows: int = header["rows"]
+        self._offsets: list[int] = header["offsets"]
+        self._bounds: dict[str, list[int]] = {
+            column: index["bounds"] for column, index in header["indexes"].items()
+        }
+        self._categories: dict[str, pd.Index] = {
+            column: pd.Index(values, dtype=object) for column, values in header["categories"].items()
+        }
+
+    @cached_property
+    def records(self) -> np.ndarray:
+        """Memory-mapped course records in file order."""
+        return self._map(self._offsets[0], _RECORD_DTYPE, self.rows)
+
+    def table(self) -> CourseTable:
+        """Read all courses into a course table."""
+        return self._to_table(self.records)
+
+    def week_day(self, week_day: WeekDay) -> CourseTable:
+        """Courses on one week day, in file order."""
+        try:
+            code = WEEKDAYS.index(WeekDay(week_day))
+        except ValueError:
+            raise ValueError(f"Unknown week day: {week_day}") from None
+        return self._select("week_day", code)
+
+    def room(self, room: str) -> CourseTable:
+        """Courses in one room, in file order."""
+        return self._select("room", self._categories["room"].get_indexer([room])[0])
+
+    def lecturer(self, lecturer: str) -> CourseTable:
+        """Courses held by one lecturer, in file order."""
+        return self._select("lecturer", self._categories["lecturer"].get_indexer([lecturer])[0])
+
+    def __getitem__(self, key) -> CourseTable:
+        """Read rows by slice, boolean mask or integer positions."""
+        return self._to_table(self.records[key])
+
+    def __len__(self) -> int:
+        """Return the number of courses in the file."""
+        return self.rows
+
+    def _select(self, column: str, code: int) -> CourseTable:
+        """Courses whose column has the given code, found through the column index."""
+        if code < 0:
+            return self._to_table(self.records[:0])
+
+        position = _INDEXED_COLUMNS.index(column)
+        bounds = self._bounds[column]
+        order = self._map(self._offsets[position + 1], np.dtype("<i4"), self.rows)
+        return self._to_table(self.records[order[bounds[code]:bounds[code + 1]]])
+
+    def _map(self, offset: int, dtype: np.dtype, rows: int) -> np.ndarray:
+        """Memory-map one section of the file."""
+        if rows == 0:
+            # An empty section cannot be mapped.
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+
+    def _to_table(self, records: np.ndarray) -> CourseTable:
+        """Convert records into a course table sharing the file's categories."""
+        text = {
+            column: pd.Categorical.from_codes(
+                np.asarray(records[column]), categories=self._categories[column], validate=False
+            )
+            for column in _TEXT_COLUMNS
+        }
+        return CourseTable(
+            credits=np.array(records["credits"], dtype=np.int16),
+            week_day=np.array(records["week_day"], dtype=np.int8),
+            start_minutes=np.array(records["start_minutes"], dtype=np.int16),
+            duration_minutes=np.array(records["duration_minutes"], dtype=np.int16),
+            **text,
+        )
+
+
+def _as_course_table(courses: Timetable | pd.DataFrame | CourseTable | list[Course]) -> CourseTable:
+    """Convert any supported course container into a course table."""
+    if isinstance(courses, CourseTable):
+        return courses
+    if isinstance(courses, pd.DataFrame):
+        return CourseTable.from_df(courses)
+    if isinstance(courses, Timetable):
+        return CourseTable.from_courses(courses.courses)
+    return CourseTable.from_courses(courses)
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the section alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,231 @@
+from pathlib import Path
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from src.study_planner.course_io import iter_course_batches, _DEFAULT_CHUNKSIZE
+from src.study_planner.timetable import Course, CourseTable, Timetable, WeekDay, WEEKDAYS
+from src.study_planner.timetable_file import _as_course_table
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS timetables (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    user TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    timetable_id INTEGER NOT NULL REFERENCES timetables(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    course_name TEXT NOT NULL,
+    credits INTEGER NOT NULL,
+    week_day INTEGER NOT NULL,
+    start_time TEXT NOT NULL,
+    start_minutes INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    room TEXT NOT NULL,
+    lecturer TEXT NOT NULL,
+    PRIMARY KEY (timetable_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS timetables_user ON timetables (user);
+CREATE INDEX IF NOT EXISTS sessions_week_day ON sessions (week_day, start_minutes);
+CREATE INDEX IF NOT EXISTS sessions_room ON sessions (room, week_day, start_minutes);
+CREATE INDEX IF NOT EXISTS sessions_lecturer ON sessions (lecturer, week_day, start_minutes);
+"""
+
+_SESSION_COLUMNS: list[str] = [
+    "course_name",
+    "credits",
+    "week_day",
+    "start_time",
+    "start_minutes",
+    "duration_minutes",
+    "room",
+    "lecturer",
+]
+
+
+class TimetableStore:
+    """Many users' timetables in one SQLite database.
+
+    Sessions are indexed by week day, room and lecturer and timetables by
+    user, so questions across all timetables, like every session in a
+    room on one day, are answered without scanning the whole database.
+    Week days are stored as their position in ``WEEKDAYS``.
+    """
+    def __init__(self, path: Path | str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def add_timetable(
+        self,
+        name: str,
+        user: str,
+        courses: Timetable | pd.DataFrame | CourseTable | list[Course],
+    ) -> None:
+        """Store a timetable under a name, replacing a stored one of the same name."""
+        with self.connection:
+            timetable_id = self._replace_timetable(name, user)
+            self._insert_sessions(timetable_id, 0, _as_course_table(courses))
+
+    def import_csv(
+        self,
+        file: str,
+        user: str | None = None,
+        name: str | None = None,
+        chunksize: int = _DEFAULT_CHUNKSIZE,
+    ) -> int:
+        """Bulk insert a course csv file and return the number of sessions.
+
+        The file is streamed with the csv loader and inserted in one
+        transaction, so an invalid file leaves the store unchanged. The
+        timetable is named like the file, the user defaults to its stem.
+        """
+        name = Path(file).name if name is None else name
+        user = Path(file).stem if user is None else user
+
+        rows = 0
+        with self.connection:
+            timetable_id = self._replace_timetable(name, user)
+            for batch in iter_course_batches(file, chunksize):
+                self._insert_sessions(timetable_id, rows, batch)
+                rows += len(batch)
+        return rows
+
+    def timetable_names(self, user: str | None = None) -> list[str]:
+        """Names of the stored timetables, optionally only those of one user."""
+        if user is None:
+            cursor = self.connection.execute("SELECT name FROM timetables ORDER BY name")
+        else:
+            cursor = self.connection.execute(
+                "SELECT name FROM timetables WHERE user = ? ORDER BY name", (user,)
+            )
+        return [name for name, in cursor]
+
+    def load(self, name: str) -> CourseTable:
+        """Load one timetable into a course table, in the order it was stored."""
+        rows = self.connection.execute(
+            f"""
+            SELECT {", ".join(_SESSION_COLUMNS)}
+            FROM sessions JOIN timetables ON timetables.id = sessions.timetable_id
+            WHERE timetables.name = ?
+            ORDER BY position
+            """,
+            (name,),
+        ).fetchall()
+
+        if not rows and name not in self.timetable_names():
+            raise ValueError(f"Unknown timetable: {name}")
+
+        columns = dict(zip(_SESSION_COLUMNS, zip(*rows))) if rows else {
+            column: () for column in _SESSION_COLUMNS
+        }
+        return CourseTable(
+            course_name=pd.Categorical(columns["course_name"]),
+            credits=np.array(columns["credits"], dtype=np.int16),
+            week_day=np.array(columns["week_day"], dtype=np.int8),
+            start_time=pd.Categorical(columns["start_time"]),
+            start_minutes=np.array(columns["start_minutes"], dtype=np.int16),
+            duration_minutes=np.array(columns["duration_minutes"], dtype=np.int16),
+            room=pd.Categorical(columns["room"]),
+            lecturer=pd.Categorical(columns["lecturer"]),
+        )
+
+    def query(
+        self,
+        week_day: WeekDay | None = None,
+        room: str | None = None,
+        lecturer: str | None = None,
+        user: str | None = None,
+    ) -> pd.DataFrame:
+        """Find sessions across all timetables, sorted by day and start time.
+
+        Every given filter must match. The result has one row per session
+        with the user and timetable it belongs to.
+        """
+        conditions = []
+        parameters = []
+        if week_day is not None:
+            try:
+                parameters.append(WEEKDAYS.index(WeekDay(week_day)))
+            except ValueError:
+                raise ValueError(f"Unknown week day: {week_day}") from None
+            conditions.append("sessions.week_day = ?")
+        for column, value in (("sessions.room", room), ("sessions.lecturer", lecturer),
+                              ("timetables.user", user)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        df = pd.read_sql_query(
+            f"""
+            SELECT timetables.user, timetables.name AS timetable,
+                {", ".join(f"sessions.{column}" for column in _SESSION_COLUMNS)}
+            FROM sessions JOIN timetables ON timetables.id = sessions.timetable_id
+            {where}
+            ORDER BY sessions.week_day, sessions.start_minutes, timetables.name, sessions.position
+            """,
+            self.connection,
+            params=parameters,
+        )
+        df["week_day"] = pd.Categorical.from_codes(df["week_day"], categories=WEEKDAYS)
+        return df
+
+    def remove(self, name: str) -> None:
+        """Delete a timetable and its sessions."""
+        with self.connection:
+            self.connection.execute("DELETE FROM timetables WHERE name = ?", (name,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> "TimetableStore":
+        """Use the store as a context manager that closes the connection."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the database connection."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored timetables."""
+        return self.connection.execute("SELECT COUNT(*) FROM timetables").fetchone()[0]
+
+    def _replace_timetable(self, name: str, user: str) -> int:
+        """Drop a timetable of the same name and return the id of the new one."""
+        self.connection.execute("DELETE FROM timetables WHERE name = ?", (name,))
+        cursor = self.connection.execute(
+            "INSERT INTO timetables (name, user) VALUES (?, ?)", (name, user)
+        )
+        return cursor.lastrowid
+
+    def _insert_sessions(self, timetable_id: int, first_position: int, table: CourseTable) -> None:
+        """Insert the courses of a table with one executemany."""
+        rows = zip(
+            [timetable_id] * len(table),
+            range(first_position, first_position + len(table)),
+            _texts(table.course_name),
+            table.credits.tolist(),
+            table.week_day.tolist(),
+            _texts(table.start_time),
+            table.start_minutes.tolist(),
+            table.duration_minutes.tolist(),
+            _texts(table.room),
+            _texts(table.lecturer),
+        )
+        self.connection.executemany(
+            f"INSERT INTO sessions (timetable_id, position, {', '.join(_SESSION_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(_SESSION_COLUMNS) + 2))})",
+            rows,
+        )
+
+
+def _texts(column: pd.Categorical) -> list[str]:
+    """Values of a text column as strings, with missing values as empty strings."""
+    # Code -1 marks a missing value and picks the appended empty string.
+    values = np.array([*map(str, column.categories), ""], dtype=object)
+    return values[column.codes].tolist()
@@ -0,0 +1,73 @@
+import pytest
+
+from src.study_planner.themes import Theme
+from src.study_planner.timetable import Course, RenderMode, WeekDay
+
+
+def make_course(name, week_day, start_time, duration=90, room="A1", lecturer="Dr. Euler"):
+    """Course of 5 credits, with the fields the tests vary by position."""
+    return Course(name, 5, week_day, start_time, duration, room, lecturer)
+
+
+class SimpleTheme(Theme):
+    font_color = "black"
+    theme_color = "white"
+
+    def color_list(self, number_of_courses: int) -> list:
+        return ["#88c0d0"] * number_of_courses
+
+
+class CountingTheme(SimpleTheme):
+    calls = 0
+
+    def color_list(self, number_of_courses: int) -> list:
+        self.calls += 1
+        return super().color_list(number_of_courses)
+
+
+class FixedTheme(SimpleTheme):
+    """Theme drawing the courses in the given colors, e.g. those of an edited figure."""
+
+    def __init__(self, theme: Theme, colors: list):
+        self.font_color = theme.font_color
+        self.theme_color = theme.theme_color
+        self.colors = list(colors)
+
+    def color_list(self, number_of_courses: int) -> list:
+        return self.colors[:number_of_courses]
+
+
+@pytest.fixture
+def courses():
+    return [
+        Course(
+            course_name="Math",
+            credits=5,
+            week_day=WeekDay.MONDAY,
+            start_time="10:00",
+            duration_minutes=90,
+            room="A1",
+            lecturer="Dr. Euler",
+        ),
+        Course(
+            course_name="Physics",
+            credits=4,
+            week_day=WeekDay.WEDNESDAY,
+            start_time="14:00",
+            duration_minutes=120,
+            room="B2",
+            lecturer="Dr. Newton",
+        ),
+    ]
+
+
+@pytest.fixture
+def batched_layout(layout):
+    """The layout fixture of the test module, drawn in batched mode."""
+    return type(layout)(
+        courses=layout.courses,
+        theme=SimpleTheme(),
+        figsize_timetable=(10, 6),
+        user="Chavez",
+        render_mode=RenderMode.BATCHED,
+    )
@@ -0,0 +1,96 @@
+import pytest
+
+from src.study_planner.batch_generation import BatchReport, batch_generation, collect_jobs
+
+HEADER = "course_name,credits,week_day,start_time,duration_minutes,room,lecturer\n"
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    source = tmp_path / "timetables"
+    source.mkdir()
+    (source / "anna.csv").write_text(HEADER + "Math,6,Monday,9:00,90,A1,Dr. Euler\n")
+    (source / "ben.csv").write_text(HEADER + "Physics,4,Tuesday,10:30,120,B2,Dr. Newton\n")
+    (source / "broken.csv").write_text(HEADER + "Chemistry,4,Someday,10:30,120,C3,Dr. Curie\n")
+    return source
+
+
+def test_collect_jobs_from_directory(csv_dir, tmp_path):
+    jobs = collect_jobs(csv_dir, tmp_path / "out", "static")
+
+    assert [job.user for job in jobs] == ["anna", "ben", "broken"]
+    assert jobs[0].output == tmp_path / "out" / "anna.png"
+
+
+def test_collect_jobs_from_manifest(csv_dir, tmp_path):
+    manifest = csv_dir / "manifest.txt"
+    manifest.write_text("filename,user\nanna.csv,Anna Smith\n")
+    jobs = collect_jobs(manifest, tmp_path / "out", "dynamic")
+
+    assert len(jobs) == 1
+    assert jobs[0].source == csv_dir / "anna.csv"
+    assert jobs[0].user == "Anna Smith"
+    assert jobs[0].output.suffix == ".html"
+
+
+@pytest.mark.parametrize("layout_type, suffix", [("static", ".png"), ("dynamic", ".html")])
+def test_batch_generation_renders_files_and_reports_failures(csv_dir, tmp_path, layout_type, suffix):
+    output_dir = tmp_path / "out"
+    report = batch_generation(csv_dir, output_dir, layout_type, "light", (8, 6), max_workers=2)
+
+    assert sorted(path.name for path in report.rendered) == [f"anna{suffix}", f"ben{suffix}"]
+    assert all(path.stat().st_size > 0 for path in report.rendered)
+    assert list(report.failures) == [csv_dir / "broken.csv"]
+    assert "Someday" in report.failures[csv_dir / "broken.csv"]
+
+
+def test_batch_report_summary():
+    report = BatchReport(elapsed_seconds=2.0)
+
+    assert report.throughput == 0
+    assert "0 failed" in report.summary()
+
+
+def test_batch_generation_fills_render_cache(csv_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = batch_generation(csv_dir, tmp_path / "first", "static", "light", (8, 6), cache_dir=cache_dir)
+    second = batch_generation(csv_dir, tmp_path / "second", "static", "light", (8, 6), cache_dir=cache_dir)
+
+    assert len(list(cache_dir.glob("*.bin"))) == 2
+    for first_path, second_path in zip(sorted(first.rendered), sorted(second.rendered)):
+        assert first_path.read_bytes() == second_path.read_bytes()
+
+
+def test_relative_sources_are_read_from_the_working_directory(csv_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manifest = csv_dir / "manifest.txt"
+    manifest.write_text("filename,user\nanna.csv,Anna Smith\n")
+    report = batch_generation(
+        manifest.relative_to(tmp_path), tmp_path / "out", "dynamic", "light", (8, 6), max_workers=1
+    )
+
+    assert report.failures == {}
+    assert [path.name for path in report.rendered] == ["anna.html"]
+
+
+def test_files_listed_for_several_users_are_written_once_per_user(csv_dir, tmp_path):
+    manifest = csv_dir / "manifest.txt"
+    manifest.write_text("filename,user\nanna.csv,Anna Smith\nanna.csv,Ben\nben.csv,Ben\n")
+    jobs = collect_jobs(manifest, tmp_path / "out", "static")
+
+    assert [job.output.name for job in jobs] == ["anna_Anna_Smith.png", "anna_Ben.png", "ben.png"]
+
+
+def test_jobs_writing_the_same_file_are_rejected(csv_dir, tmp_path):
+    manifest = csv_dir / "manifest.txt"
+    manifest.write_text("filename,user\nanna.csv,Ben\nanna.csv,Ben\n")
+
+    with pytest.raises(ValueError, match="anna_Ben.png"):
+        collect_jobs(manifest, tmp_path / "out", "static")
+
+
+def test_invalid_rows_fail_with_the_loader_errors(csv_dir, tmp_path):
+    (csv_dir / "broken.csv").write_text(HEADER + "Chemistry,four,Monday,10:30,120,C3,Dr. Curie\n")
+    report = batch_generation(csv_dir, tmp_path / "out", "static", "light", (8, 6), max_workers=1)
+
+    assert "row 1, credits='four'" in report.failures[csv_dir / "broken.csv"]
@@ -22,7 +22,7 @@ def test_get_user_inputs_valid(monkeypatch):
 def test_invalid_credits(monkeypatch):
     inputs = iter([
         "Math",
-        -3, "ten", 6,
+        -3, "ten", 40_000, 6,
         WeekDay.MONDAY,
         "10:00",
         90,
@@ -95,9 +95,10 @@ def test_filter_csv_files(tmp_path):
 
     (tmp_path / "file1.csv").touch()
     (tmp_path / "file2.csv").touch()
+    (tmp_path / "file3.ttb").touch()
     (tmp_path / "notes.txt").touch()
     (tmp_path / "to-do-list.pdf").touch()
 
     result = available_timetable_list(tmp_path)
 
-    assert sorted(result) == ["file1.csv", "file2.csv"]
\ No newline at end of file
+    assert sorted(result) == ["file1.csv", "file2.csv", "file3.ttb"]
\ No newline at end of file
@@ -0,0 +1,106 @@
+from itertools import combinations
+import random
+
+import pytest
+
+from src.study_planner.conflicts import find_conflicts, validate_no_conflicts
+from src.study_planner.timetable import CourseTable, WeekDay
+from tests.conftest import make_course
+
+
+def test_no_conflicts():
+    courses = [
+        make_course("Math", WeekDay.MONDAY, "10:00", 90),
+        make_course("Physics", WeekDay.TUESDAY, "10:00", 90),
+    ]
+
+    assert find_conflicts(courses).empty
+
+
+def test_overlap_on_same_day():
+    courses = [
+        make_course("Math", WeekDay.MONDAY, "10:00", 90),
+        make_course("Physics", WeekDay.MONDAY, "11:00", 90),
+    ]
+    conflicts = find_conflicts(courses)
+
+    assert len(conflicts) == 1
+    row = conflicts.iloc[0]
+    assert (row.first_course, row.second_course) == ("Math", "Physics")
+    assert (row.week_day, row.start_time, row.overlap_minutes) == ("Monday", "11:00", 30)
+
+
+def test_touching_sessions_do_not_overlap():
+    courses = [
+        make_course("Math", WeekDay.MONDAY, "10:00", 60),
+        make_course("Physics", WeekDay.MONDAY, "11:00", 60),
+    ]
+
+    assert find_conflicts(courses).empty
+
+
+def test_room_conflicts_need_the_same_room():
+    courses = [
+        make_course("Math", WeekDay.MONDAY, "10:00", 90, room="A1"),
+        make_course("Physics", WeekDay.MONDAY, "10:30", 90, room="B2"),
+        make_course("Chemistry", WeekDay.MONDAY, "11:00", 90, room="A1"),
+    ]
+    conflicts = find_conflicts(courses, "room")
+
+    assert conflicts[["first_course", "second_course", "room"]].values.tolist() == [
+        ["Math", "Chemistry", "A1"]
+    ]
+
+
+def test_session_rolling_past_midnight():
+    courses = [
+        make_course("Night Lab", WeekDay.MONDAY, "23:00", 120),
+        make_course("Early Bird", WeekDay.TUESDAY, "0:30", 60),
+    ]
+    conflicts = find_conflicts(courses)
+
+    assert (conflicts.iloc[0].week_day, conflicts.iloc[0].start_time) == ("Tuesday", "00:30")
+
+
+def test_session_rolling_past_the_end_of_the_week():
+    courses = [
+        make_course("Night Lab", WeekDay.SATURDAY, "23:30", 60),
+        make_course("Early Bird", WeekDay.SUNDAY, "0:00", 60),
+    ]
+
+    assert len(find_conflicts(courses)) == 1
+
+
+def test_matches_pairwise_check():
+    rng = random.Random(1)
+    courses = [
+        make_course(
+            f"Course {i}",
+            rng.choice(list(WeekDay)),
+            f"{rng.randint(8, 18)}:{rng.choice([0, 15, 30, 45]):02d}",
+            rng.choice([45, 90, 120]),
+            room=f"Room {rng.randint(1, 10)}",
+        )
+        for i in range(300)
+    ]
+    table = CourseTable.from_courses(courses)
+    start = table.week_day.astype(int) * 1440 + table.start_minutes
+    end = start + table.duration_minutes
+    expected = [
+        (i, j) for i, j in combinations(range(len(courses)), 2)
+        if start[i] < end[j] and start[j] < end[i] and courses[i].room == courses[j].room
+    ]
+
+    conflicts = find_conflicts(table, "room")
+
+    assert list(zip(conflicts.first_index, conflicts.second_index)) == expected
+
+
+def test_validate_no_conflicts():
+    courses = [
+        make_course("Math", WeekDay.MONDAY, "10:00", 90, lecturer="Dr. Euler"),
+        make_course("Physics", WeekDay.MONDAY, "11:00", 90, room="B2", lecturer="Dr. Euler"),
+    ]
+
+    with pytest.raises(ValueError, match="Math and Physics overlap on Monday at 11:00 \\(lecturer\\)"):
+        validate_no_conflicts(courses)
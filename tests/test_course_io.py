@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+from src.study_planner.course_io import iter_course_batches, iter_courses
+from src.study_planner.timetable import Course, WeekDay
+
+
+@pytest.fixture
+def course_file(tmp_path):
+    filepath = tmp_path / "courses.csv"
+    pd.DataFrame({
+        "course_name": ["Math", "Physics", "Chemistry", "Biology", "History"],
+        "credits": [6, 4, 5, 3, 2],
+        "week_day": [WeekDay.MONDAY, WeekDay.TUESDAY, WeekDay.MONDAY, WeekDay.FRIDAY, WeekDay.SUNDAY],
+        "start_time": ["09:00", "10:00", "8:30", "14:15", "12:00"],
+        "duration_minutes": [90, 120, 60, 45, 90],
+        "room": ["A1", "B2", "A1", "C3", "B2"],
+        "lecturer": ["Dr. Euler", "Dr. Newton", "Dr. Curie", "Dr. Darwin", "Dr. Euler"],
+    }).to_csv(filepath, index=False)
+    return filepath
+
+
+def write_rows(filepath, rows):
+    header = "course_name,credits,week_day,start_time,duration_minutes,room,lecturer\n"
+    filepath.write_text(header + "".join(row + "\n" for row in rows))
+    return filepath
+
+
+def test_iter_courses(course_file):
+    courses = list(iter_courses(str(course_file)))
+
+    assert len(courses) == 5
+    assert courses[0] == Course("Math", 6, WeekDay.MONDAY, "09:00", 90, "A1", "Dr. Euler")
+    assert courses[2].start_time == "8:30"
+
+
+def test_iter_course_batches_chunks(course_file):
+    batches = list(iter_course_batches(str(course_file), chunksize=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert list(batches[1].start_minutes) == [510, 855]
+    assert list(batches[2].course_name) == ["History"]
+
+
+def test_missing_columns(tmp_path):
+    filepath = tmp_path / "courses.csv"
+    filepath.write_text("course_name,credits,week_day\nMath,6,Monday\n")
+
+    with pytest.raises(ValueError, match="missing the columns: start_time, duration_minutes"):
+        list(iter_courses(str(filepath)))
+
+
+def test_invalid_rows_raise(tmp_path):
+    filepath = write_rows(tmp_path / "courses.csv", [
+        "Math,6,Monday,09:00,90,A1,Dr. Euler",
+        "Physics,four,Tuesday,25:00,90,B2,Dr. Newton",
+    ])
+
+    with pytest.raises(ValueError, match=r"row 2, credits='four'.*row 2, start_time='25:00'"):
+        list(iter_courses(str(filepath)))
+
+
+def test_invalid_rows_are_collected(tmp_path):
+    filepath = write_rows(tmp_path / "courses.csv", [
+        "Math,6,Monday,09:00,90,A1,Dr. Euler",
+        "Physics,4,Tuesday,10:00,90,B2,Dr. Newton",
+        "Chemistry,5,Someday,10:00,90,B2,Dr. Curie",
+        "Biology,3,Friday,10:00,2000,C3,Dr. Darwin",
+        ",3,Friday,10:00,60,C3,Dr. Darwin",
+    ])
+    errors = []
+
+    batches = list(iter_course_batches(str(filepath), chunksize=2, errors=errors))
+
+    assert [len(batch) for batch in batches] == [2, 0, 0]
+    assert [(error.row, error.column) for error in errors] == [
+        (3, "week_day"), (4, "duration_minutes"), (5, "course_name")
+    ]
+    assert errors[0].value == "Someday"
+    assert errors[2].value is None
+
+
+def test_credits_that_do_not_fit_int16_are_invalid(tmp_path):
+    filepath = write_rows(tmp_path / "courses.csv", ["Math,70000,Monday,09:00,90,A1,Dr. Euler"])
+    errors = []
+
+    batches = list(iter_course_batches(str(filepath), errors=errors))
+
+    assert len(batches[0]) == 0
+    assert [(error.row, error.column) for error in errors] == [(1, "credits")]
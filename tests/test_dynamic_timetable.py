@@ -1,41 +1,20 @@
+import base64
+import io
+import json
+
+import numpy as np
 from plotly.graph_objects import Figure
+from plotly.utils import PlotlyJSONEncoder
 import pytest
 
 from src.study_planner.dynamic_timetable import DynamicTimetable
-from src.study_planner.timetable import Course, WeekDay
-from src.study_planner.themes import Theme
-
-
-class SimpleTheme(Theme):
-    fontcolor = "black"
-    themecolor = "white"
+from src.study_planner.timetable import Course, RenderMode, WeekDay
+from src.study_planner.themes import RainbowTheme
+from tests.conftest import CountingTheme, FixedTheme, SimpleTheme
 
-    def color_list(self, number_of_courses: int) -> list:
-        return ["#88c0d0"] * number_of_courses
 
 @pytest.fixture
-def layout():
-    courses = [
-        Course(
-            course_name="Math",
-            credits=5,
-            week_day=WeekDay.MONDAY,
-            start_time="10:00",
-            duration_minutes=90,
-            room="A1",
-            lecturer="Dr. Euler",
-        ),
-        Course(
-            course_name="Physics",
-            credits=4,
-            week_day=WeekDay.WEDNESDAY,
-            start_time="14:00",
-            duration_minutes=120,
-            room="B2",
-            lecturer="Dr. Newton",
-        ),
-    ]
-
+def layout(courses):
     return DynamicTimetable(
         courses=courses,
         theme=SimpleTheme(),
@@ -43,6 +22,7 @@ def layout():
         user="Chavez"
     )
 
+
 def test_type_static_timetable(layout):
     assert type(layout) == DynamicTimetable
 
@@ -52,29 +32,34 @@ def test_display_timetable_returns_figure(layout):
 
     assert isinstance(fig, Figure)
 
+
 def test_header_creates_rectangle_per_weekday(layout):
     fig = layout.display_timetable()
     shapes = fig.layout.shapes
 
     assert all(s.type == "rect" for s in shapes[:7])
 
+
 def test_header_title_contains_username(layout):
     fig = layout.display_timetable()
 
     assert "Chavez" in fig.layout.title.text
 
+
 def test_layout_contains_seven_lines(layout):
     fig = layout.display_timetable()
     lines = [s for s in fig.layout.shapes if s.type == "line"]
 
     assert len(lines) == 7
 
+
 def test_body_has_one_rectangle_per_course(layout):
     fig = layout.display_timetable()
     courses = [s for s in fig.layout.shapes[7:] if s.type == "rect"]
 
     assert len(courses) == 2
 
+
 def test_course_y_position(layout):
     fig = layout.display_timetable()
     courses = [s for s in fig.layout.shapes[7:] if s.type == "rect"]
@@ -83,6 +68,7 @@ def test_course_y_position(layout):
     assert first_course.y1 == 10*60
     assert first_course.y0 == 10*60 + 90
 
+
 def test_hover_info_exists_on_the_course(layout):
     fig = layout.display_timetable()
     courses = [s for s in fig.layout.shapes[7:] if s.type == "rect"]
@@ -90,6 +76,7 @@ def test_hover_info_exists_on_the_course(layout):
 
     assert len(courses) == len(hover_info)
 
+
 def test_rectangle_width_equals_day_width(layout):
     fig = layout.display_timetable()
     courses = [s for s in fig.layout.shapes[7:] if s.type == "rect"]
@@ -99,6 +86,7 @@ def test_rectangle_width_equals_day_width(layout):
 
     assert course_width == expected_width
 
+
 def test_no_courses_creates_no_patches():
     empty_layout = DynamicTimetable(
         courses=[],
@@ -113,5 +101,206 @@ def test_no_courses_creates_no_patches():
     assert len(courses) == 0
 
 
+def test_batched_draws_no_course_shapes(batched_layout):
+    fig = batched_layout.display_timetable()
+    courses = [s for s in fig.layout.shapes[7:] if s.type == "rect"]
+
+    assert len(courses) == 0
+    assert len(fig.layout.annotations) == len(WeekDay)
+
+
+def test_batched_uses_constant_number_of_traces(batched_layout):
+    fig = batched_layout.display_timetable()
+
+    assert len(fig.data) == 2
+    assert len(fig.data[0].x) == 2
+
+
+def test_batched_course_position(batched_layout):
+    fig = batched_layout.display_timetable()
+    blocks = fig.data[0]
+
+    assert blocks.base[0] == 10 * 60
+    assert blocks.y[0] == 90
+    assert blocks.width[0] == 10 / len(WeekDay) * 100
+
+
+def test_batched_hover_info_uses_customdata(batched_layout):
+    fig = batched_layout.display_timetable()
+    blocks = fig.data[0]
+
+    assert "customdata[0]" in blocks.hovertemplate
+    assert blocks.customdata[1][0] == "Physics"
+    assert blocks.customdata[0][4] == "11:30:00"
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_palette_is_computed_once_per_render(layout, render_mode):
+    theme = CountingTheme()
+    counting_layout = DynamicTimetable(layout.courses, theme, (10, 6), "Chavez", render_mode)
+    counting_layout.display_timetable()
+
+    assert theme.calls == 1
+
+
+def test_batched_no_courses_creates_no_traces():
+    empty_layout = DynamicTimetable(
+        courses=[],
+        theme=SimpleTheme(),
+        figsize_timetable=(10, 6),
+        user="Chavez",
+        render_mode=RenderMode.BATCHED,
+    )
+
+    fig = empty_layout.display_timetable()
+
+    assert len(fig.data) == 0
+
+
+def test_export_self_contained_html(layout, tmp_path):
+    layout.export(tmp_path / "timetable.html")
+    html = (tmp_path / "timetable.html").read_text(encoding="utf-8")
+
+    assert "Chavez" in html
+    assert 'src="https://cdn.plot.ly' not in html
+
+
+def test_export_cdn_html_to_text_stream(layout):
+    stream = io.StringIO()
+    layout.export(stream, "html", self_contained=False)
+
+    assert 'src="https://cdn.plot.ly' in stream.getvalue()
+
+
+def test_export_bytes_is_html(layout):
+    assert layout.export_bytes("html").startswith(b"<html>")
+
+
+def test_export_rejects_png(layout):
+    with pytest.raises(ValueError):
+        layout.export_bytes("png")
+
+
+def test_batched_overlapping_courses_are_drawn_side_by_side(batched_layout):
+    overlapping = Course("Chemistry", 4, WeekDay.MONDAY, "10:30", 60, "C3", "Dr. Curie")
+    side_by_side = DynamicTimetable(
+        batched_layout.courses + [overlapping], SimpleTheme(), (10, 6), "Chavez", RenderMode.BATCHED
+    )
+    blocks = side_by_side.display_timetable().data[0]
+    day_width = 10 / len(WeekDay) * 100
+
+    assert blocks.width[0] == blocks.width[2] == day_width / 2
+    assert blocks.x[2] - blocks.x[0] == pytest.approx(day_width / 2)
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_edits_match_a_fresh_render(layout, render_mode):
+    layout.theme = RainbowTheme()
+    layout.render_mode = RenderMode(render_mode)
+    layout.open_figure()
+    layout.add_course(Course("Chemistry", 4, WeekDay.MONDAY, "10:30", 60, "C3", "Dr. Curie"))
+    layout.update_course(1, Course("Biology", 3, WeekDay.FRIDAY, "20:00", 180, "D4", "Dr. Darwin"))
+    layout.remove_course(0)
+    layout.add_course(Course("Geology", 4, WeekDay.TUESDAY, "9:00", 60, "E5", "Dr. Hutton"))
+
+    colors = layout.compute_course_geometry().colors
+    fresh = type(layout)(
+        layout.courses, FixedTheme(layout.theme, colors), layout.figsize_timetable, "Chavez",
+        layout.render_mode,
+    )
+
+    assert len(set(map(tuple, colors))) == len(colors) == 3
+    assert layout.figure.to_dict() == fresh.display_timetable().to_dict()
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_open_figure_matches_a_plain_render(layout, render_mode):
+    layout.theme = RainbowTheme()
+    layout.render_mode = RenderMode(render_mode)
+    fresh = type(layout)(
+        layout.courses, RainbowTheme(), layout.figsize_timetable, "Chavez", layout.render_mode
+    )
+
+    assert layout.open_figure().to_dict() == fresh.display_timetable().to_dict()
+
+
+def test_added_courses_get_distinct_colors(layout):
+    layout.theme = RainbowTheme()
+    layout.open_figure()
+    for hour in range(9):
+        layout.add_course(Course(f"Course {hour}", 3, WeekDay.THURSDAY, f"{8 + hour}:00", 60, "A", "B"))
+    hex_colors = layout.compute_course_geometry().hex_colors
+
+    assert len(set(hex_colors)) == len(hex_colors) == 11
+
+
+def test_removing_every_course_leaves_an_empty_timetable(batched_layout):
+    batched_layout.open_figure()
+    batched_layout.remove_course(0)
+    batched_layout.remove_course(0)
+
+    assert batched_layout.figure.data == ()
+
+
+def test_skeleton_is_not_changed_by_renders(layout):
+    from src.study_planner.dynamic_timetable import _SKELETONS
+
+    _SKELETONS.clear()
+    first = layout.display_timetable()
+    second = DynamicTimetable(layout.courses, SimpleTheme(), (10, 6), "Marieke").display_timetable()
+
+    assert len(_SKELETONS) == 1
+    assert len(first.layout.shapes) == len(second.layout.shapes)
+    assert second.layout.title.text == "Marieke's Study Timetable"
+    assert second.layout.title.font.color == first.layout.title.font.color
+
+
+def _plain(figure: dict):
+    """Figure dict as json values, with typed arrays decoded to lists."""
+    def decode(value):
+        if isinstance(value, dict):
+            if value.keys() == {"dtype", "bdata"}:
+                return np.frombuffer(base64.b64decode(value["bdata"]), value["dtype"]).tolist()
+            return {key: decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        return value
+
+    return decode(json.loads(json.dumps(figure, cls=PlotlyJSONEncoder)))
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+@pytest.mark.parametrize("with_courses", [True, False])
+def test_figure_dict_matches_the_validated_figure(layout, render_mode, with_courses):
+    layout.render_mode = RenderMode(render_mode)
+    if not with_courses:
+        layout.courses = []
+
+    assert _plain(layout.figure_dict()) == _plain(layout.display_timetable().to_dict())
+
+
+def test_figure_dict_encodes_batched_columns_as_typed_arrays(batched_layout):
+    bars = batched_layout.figure_dict()["data"][0]
+
+    assert bars["base"]["dtype"] == "i4"
+    assert np.frombuffer(base64.b64decode(bars["base"]["bdata"]), "<i4").tolist() == [600, 840]
+
+
+def test_figure_dict_does_not_change_the_cached_skeleton(layout):
+    first = layout.figure_dict()
+    layout.user = "Marieke"
+    second = layout.figure_dict()
+
+    assert len(first["layout"]["shapes"]) == len(second["layout"]["shapes"])
+    assert first["layout"]["title"]["text"] == "Chavez's Study Timetable"
+    assert second["layout"]["title"]["text"] == "Marieke's Study Timetable"
+
 
+def test_changing_a_figure_dict_does_not_change_the_next_one(layout):
+    changed = layout.figure_dict()
+    changed["layout"]["xaxis"]["range"] = [99, 100]
+    changed["layout"]["shapes"][0]["fillcolor"] = "#000000"
+    changed["layout"]["title"]["font"]["size"] = 99
+    layout.user = "Marieke"
 
+    assert _plain(layout.figure_dict()) == _plain(layout.display_timetable().to_dict())
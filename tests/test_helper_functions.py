@@ -1,8 +1,12 @@
+import subprocess
+import sys
+
 import pandas as pd
 import pytest
 
 from src.study_planner.helper_functions import TimetableTheme
-from src.study_planner.helper_functions import load_course_data, choose_layout, choose_theme
+from src.study_planner.helper_functions import load_course_data, load_course_table
+from src.study_planner.helper_functions import choose_layout, choose_theme
 from src.study_planner.themes import *
 from src.study_planner.timetable import WeekDay, TimetableLayout
 
@@ -25,6 +29,20 @@ def test_load_course_data(tmp_path):
     assert df_test.equals(test_dataframe)
 
 
+def test_load_course_table(tmp_path):
+    filepath = tmp_path / "file.csv"
+    filepath.write_text(
+        "course_name,credits,week_day,start_time,duration_minutes,room,lecturer\n"
+        "Math,6,Monday,9:00,90,A1,Dr. Euler\n"
+        "Physics,4,Tuesday,10:30,120,A1,Dr. Newton\n"
+    )
+    table = load_course_table(str(filepath))
+
+    assert len(table) == 2
+    assert table.start_minutes.tolist() == [540, 630]
+    assert list(table.room.categories) == ["A1"]
+
+
 def test_choose_layout():
     courses = []
     theme = "light"
@@ -37,4 +55,35 @@ def test_choose_layout():
 
 def test_choose_theme_light():
     theme = choose_theme(TimetableTheme.LIGHT)
-    assert isinstance(theme, LightTheme)
\ No newline at end of file
+    assert isinstance(theme, LightTheme)
+
+
+def test_choose_theme_is_shared():
+    assert choose_theme(TimetableTheme.DARK) is choose_theme("dark")
+
+
+def test_choose_theme_unknown():
+    with pytest.raises(ValueError, match="Unknown theme: pastel"):
+        choose_theme("pastel")
+
+
+def test_plotting_backends_are_imported_lazily():
+    check = (
+        "import sys, src.main; "
+        "print('matplotlib.pyplot' in sys.modules, 'plotly.graph_objects' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True)
+
+    assert result.stdout.strip() == "False False"
+
+
+def test_choose_layout_loads_only_selected_backend():
+    check = (
+        "import sys\n"
+        "from src.study_planner.helper_functions import choose_layout\n"
+        "choose_layout('static', [], 'light', (10, 10), 'Peter')\n"
+        "print('plotly.graph_objects' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True)
+
+    assert result.stdout.strip() == "False"
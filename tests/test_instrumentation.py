@@ -0,0 +1,122 @@
+import json
+import logging
+import pstats
+
+import pandas as pd
+import pytest
+
+from src.study_planner.auto_generation import auto_generation
+from src.study_planner.instrumentation import HistogramSink, LoggingSink, Span, SpanSink
+from src.study_planner.instrumentation import instrumented, recording, span
+from src.study_planner.timetable import WeekDay
+
+
+class ListSink(SpanSink):
+    def __init__(self):
+        self.spans = []
+
+    def record(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+@pytest.fixture
+def course_file(tmp_path):
+    filepath = tmp_path / "courses.csv"
+    pd.DataFrame({
+        "course_name": ["Math", "Physics"],
+        "credits": [6, 4],
+        "week_day": [WeekDay.MONDAY, WeekDay.TUESDAY],
+        "start_time": ["09:00", "10:00"],
+        "duration_minutes": [90, 120],
+        "room": ["A1", "B2"],
+        "lecturer": ["Dr. Euler", "Dr. Newton"],
+    }).to_csv(filepath, index=False)
+    return filepath
+
+
+def test_span_without_sink_records_nothing():
+    sink = ListSink()
+
+    with span("outside"):
+        pass
+    with recording(sink):
+        with span("inside", rows=3):
+            pass
+
+    assert [(s.name, s.attributes) for s in sink.spans] == [("inside", {"rows": 3})]
+
+
+def test_span_is_recorded_on_error():
+    sink = ListSink()
+
+    with recording(sink), pytest.raises(KeyError):
+        with span("failing"):
+            raise KeyError("x")
+
+    assert [s.name for s in sink.spans] == ["failing"]
+
+
+def test_instrumented_uses_qualified_name():
+    class Layout:
+        @instrumented
+        def render(self, value):
+            return value * 2
+
+    sink = ListSink()
+    with recording(sink):
+        assert Layout().render(4) == 8
+
+    assert sink.spans[0].name.endswith("Layout.render")
+
+
+def test_histogram_sink():
+    sink = HistogramSink()
+    for seconds in (0.001, 0.002, 0.004, 0.5):
+        sink.record(Span("render", seconds))
+
+    stats = sink.stats["render"]
+
+    assert stats.count == 4
+    assert stats.total_seconds == pytest.approx(0.507)
+    assert stats.max_seconds == 0.5
+    assert 0.004 <= stats.quantile(0.75) < 0.01
+    assert stats.quantile(1.0) == 0.5
+    assert "render" in sink.summary()
+
+
+def test_logging_sink(caplog):
+    with caplog.at_level(logging.INFO, logger="study_planner.spans"):
+        LoggingSink().record(Span("load", 0.25, {"file": "a.csv"}))
+
+    assert json.loads(caplog.records[0].getMessage()) == {
+        "span": "load", "seconds": 0.25, "file": "a.csv"
+    }
+
+
+def test_auto_generation_spans(tmp_path, course_file):
+    sink = HistogramSink()
+
+    with recording(sink):
+        auto_generation("dynamic", str(course_file), "light", (8, 6), "Test",
+                        output=tmp_path / "out.html")
+
+    assert {
+        "auto_generation.load_courses",
+        "course_io.parse_chunk",
+        "course_io.validate_chunk",
+        "course_io.to_courses",
+        "TimetableLayout.export",
+        "TimetableLayout.calc_yrange_for_plotting",
+        "DynamicTimetable.figure_dict",
+        "DynamicTimetable.write_figure",
+    } <= set(sink.stats)
+
+
+def test_auto_generation_profile(tmp_path, course_file):
+    profile = tmp_path / "render.prof"
+
+    auto_generation("static", str(course_file), "light", (8, 6), "Test",
+                    output=tmp_path / "out.png", profile=profile)
+
+    stats = pstats.Stats(str(profile))
+    assert any(function == "display_timetable" for _, _, function in stats.stats)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from src.study_planner.intervals import assign_lanes, overlapping_pairs
+
+
+def test_overlapping_pairs_within_groups():
+    start = np.array([0, 30, 60, 0])
+    end = np.array([60, 90, 120, 60])
+    groups = np.array([0, 0, 0, 1])
+
+    assert sorted(overlapping_pairs(start, end, groups)) == [(0, 1), (1, 2)]
+
+
+def test_separate_sessions_keep_full_width():
+    lanes, lane_counts = assign_lanes(np.array([0, 60]), np.array([60, 120]), np.array([0, 0]))
+
+    assert lanes.tolist() == [0, 0]
+    assert lane_counts.tolist() == [1, 1]
+
+
+def test_overlapping_sessions_share_the_day():
+    start = np.array([0, 10, 20, 30, 100, 100])
+    end = np.array([50, 40, 60, 35, 120, 110])
+    groups = np.zeros(6, dtype=int)
+    lanes, lane_counts = assign_lanes(start, end, groups)
+
+    assert lanes.tolist() == [0, 1, 2, 3, 0, 1]
+    assert lane_counts.tolist() == [4, 4, 4, 4, 2, 2]
+
+
+def test_freed_lane_is_reused():
+    start = np.array([0, 0, 30])
+    end = np.array([20, 60, 60])
+    lanes, lane_counts = assign_lanes(start, end, np.zeros(3, dtype=int))
+
+    assert lanes.tolist() == [0, 1, 0]
+    assert lane_counts.tolist() == [2, 2, 2]
+
+
+def test_lanes_never_overlap():
+    rng = np.random.default_rng(0)
+    start = rng.integers(0, 600, 500)
+    end = start + rng.integers(15, 120, 500)
+    groups = rng.integers(0, 7, 500)
+    lanes, lane_counts = assign_lanes(start, end, groups)
+
+    for i, j in overlapping_pairs(start, end, groups):
+        assert lanes[i] != lanes[j]
+        assert lane_counts[i] == lane_counts[j]
+    assert (lanes < lane_counts).all()
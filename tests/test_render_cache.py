@@ -0,0 +1,92 @@
+import matplotlib
+import pytest
+
+from src.study_planner.dynamic_timetable import DynamicTimetable
+from src.study_planner.render_cache import RenderCache
+from src.study_planner.static_timetable import StaticTimetable
+from src.study_planner.themes import DarkTheme, LightTheme
+from src.study_planner.timetable import Course, CourseTable, WeekDay
+
+matplotlib.use("Agg")  # Prevent GUI backend during testing
+
+
+def make_courses(start_time="10:00"):
+    return [
+        Course("Math", 5, WeekDay.MONDAY, start_time, 90, "A1", "Dr. Euler"),
+        Course("Physics", 4, WeekDay.WEDNESDAY, "14:00", 120, "B2", "Dr. Newton"),
+    ]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(tmp_path / "cache")
+
+
+def test_key_is_stable_for_equivalent_data(cache):
+    first = StaticTimetable(make_courses(), LightTheme(), (10, 6), "Chavez")
+    second = StaticTimetable(CourseTable.from_courses(make_courses()), LightTheme(), (10, 6), "Chavez")
+
+    assert cache.key(first, "png") == cache.key(second, "png")
+
+
+def test_start_times_written_differently_are_cached_apart(cache):
+    first = DynamicTimetable(make_courses("9:00"), LightTheme(), (10, 6), "Chavez")
+    second = DynamicTimetable(make_courses("09:00"), LightTheme(), (10, 6), "Chavez")
+
+    assert cache.render(first, "html") != cache.render(second, "html")
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.parametrize("changed", [
+    StaticTimetable(make_courses("11:00"), LightTheme(), (10, 6), "Chavez"),
+    StaticTimetable(make_courses(), DarkTheme(), (10, 6), "Chavez"),
+    StaticTimetable(make_courses(), LightTheme(), (12, 6), "Chavez"),
+    StaticTimetable(make_courses(), LightTheme(), (10, 6), "Marieke"),
+    DynamicTimetable(make_courses(), LightTheme(), (10, 6), "Chavez"),
+])
+def test_key_changes_with_settings(cache, changed):
+    layout = StaticTimetable(make_courses(), LightTheme(), (10, 6), "Chavez")
+
+    assert cache.key(layout, "png") != cache.key(changed, "png")
+
+
+def test_render_counts_hits_and_misses(cache):
+    layout = StaticTimetable(make_courses(), LightTheme(), (10, 6), "Chavez")
+
+    first = cache.render(layout, "png")
+    second = cache.render(layout, "png")
+
+    assert first == second
+    assert first.startswith(b"\x89PNG")
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_bytes=25)
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    cache.get("a")
+    cache.put("c", b"c" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"a" * 10
+    assert cache.stats.evictions == 1
+
+
+def test_cache_survives_reopening(tmp_path):
+    RenderCache(tmp_path / "cache").put("a", b"content")
+    reopened = RenderCache(tmp_path / "cache")
+
+    assert reopened.get("a") == b"content"
+    assert len(reopened) == 1
+
+
+def test_size_limit_is_shared_by_caches_on_one_directory(tmp_path):
+    first = RenderCache(tmp_path / "cache", max_bytes=25)
+    second = RenderCache(tmp_path / "cache", max_bytes=25)
+    first.put("a", b"a" * 10)
+    second.put("b", b"b" * 10)
+    first.put("c", b"c" * 10)
+
+    assert len(first) == len(second) == 2
+    assert second.get("a") is None
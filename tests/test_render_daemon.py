@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.study_planner.render_client import render_remote
+from src.study_planner.render_daemon import serve_job
+
+HEADER = "course_name,credits,week_day,start_time,duration_minutes,room,lecturer\n"
+REPOSITORY = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "anna.csv"
+    path.write_text(HEADER + "Math,6,Monday,9:00,90,A1,Dr. Euler\n")
+    return path
+
+
+@pytest.fixture
+def daemon_socket(tmp_path):
+    socket_path = tmp_path / "daemon.sock"
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "src.study_planner.render_daemon",
+         "--socket", str(socket_path), "--workers", "1"],
+        cwd=REPOSITORY,
+    )
+    deadline = time.monotonic() + 60
+    while not socket_path.exists():
+        assert daemon.poll() is None and time.monotonic() < deadline
+        time.sleep(0.1)
+
+    yield socket_path
+
+    daemon.send_signal(signal.SIGTERM)
+    daemon.wait(timeout=30)
+    assert not socket_path.exists()
+
+
+def run_job(job: dict) -> dict:
+    client, server = socket.socketpair()
+    with client, server:
+        client.sendall(json.dumps(job).encode())
+        client.shutdown(socket.SHUT_WR)
+        serve_job(server)
+        return json.loads(client.recv(65536))
+
+
+def test_serve_job_exports_timetable(csv_file, tmp_path):
+    output = tmp_path / "anna.png"
+    response = run_job({
+        "layout_type": "static", "filename": str(csv_file), "theme": "dark",
+        "figsize_timetable": [6, 4], "user": "Anna", "output": str(output),
+    })
+
+    assert response == {"ok": True, "output": str(output)}
+    assert output.read_bytes().startswith(b"\x89PNG")
+
+def test_serve_job_reports_errors(tmp_path):
+    response = run_job({
+        "layout_type": "static", "filename": str(tmp_path / "missing.csv"), "theme": "dark",
+        "figsize_timetable": [6, 4], "user": "Anna", "output": str(tmp_path / "missing.png"),
+    })
+
+    assert not response["ok"]
+    assert "FileNotFoundError" in response["error"]
+
+def test_client_renders_with_daemon(daemon_socket, csv_file, tmp_path):
+    output = render_remote(
+        "dynamic", str(csv_file), "light", (6, 4), "Anna", tmp_path / "anna.html", daemon_socket
+    )
+
+    assert output == tmp_path / "anna.html"
+    assert output.read_bytes().startswith(b"<html>")
+    with pytest.raises(ValueError, match="Unknown timetable type"):
+        render_remote("3d", str(csv_file), "light", (6, 4), "Anna", tmp_path / "x.png", daemon_socket)
+
+def test_client_without_daemon(tmp_path):
+    with pytest.raises(OSError):
+        render_remote("static", "anna.csv", "light", (6, 4), "Anna", tmp_path / "x.png",
+                      tmp_path / "no.sock")
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import pytest
+
+from src.study_planner.render_service import RenderService, ServiceBusy, render_request
+
+COURSES = [
+    {"course_name": "Math", "credits": 6, "week_day": "Monday", "start_time": "9:00",
+     "duration_minutes": 90, "room": "A1", "lecturer": "Dr. Euler"},
+    {"course_name": "Physics", "credits": 4, "week_day": "Tuesday", "start_time": "10:30",
+     "duration_minutes": 120, "room": "B2", "lecturer": "Dr. Newton"},
+]
+
+
+def request_body(**options) -> bytes:
+    return json.dumps({"courses": COURSES, "figsize": [6, 4], "user": "Anna", **options}).encode()
+
+
+async def post(port: int, path: str, body: bytes, method: str = "POST") -> tuple[int, dict, bytes]:
+    return await send(
+        port,
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body,
+    )
+
+
+async def send(port: int, request: bytes) -> tuple[int, dict, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, content = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, content
+
+
+def test_render_request_static_png():
+    content_type, content = render_request(request_body())
+
+    assert content_type == "image/png"
+    assert content.startswith(b"\x89PNG")
+
+def test_render_request_dynamic_html():
+    content_type, content = render_request(request_body(layout="dynamic"))
+
+    assert content_type.startswith("text/html")
+    assert content.startswith(b"<html>")
+
+@pytest.mark.parametrize("body, message", [
+    (b"[]", "json object"),
+    (request_body(theme="purple"), "Invalid option"),
+    (request_body(figsize=3), "figsize"),
+    (json.dumps({"courses": [{**COURSES[0], "week_day": "Someday"}]}).encode(), "row 1, week_day"),
+])
+def test_render_request_rejects_invalid_requests(body, message):
+    with pytest.raises(ValueError, match=message):
+        render_request(body)
+
+def test_http_render_and_errors():
+    async def scenario():
+        async with RenderService(max_workers=1) as service:
+            rendered = await post(service.port, "/render", request_body())
+            invalid = await post(service.port, "/render", request_body(layout="3d"))
+            unknown = await post(service.port, "/timetable", b"")
+            stats = await post(service.port, "/stats", b"", method="GET")
+        return rendered, invalid, unknown, stats
+
+    rendered, invalid, unknown, stats = asyncio.run(scenario())
+
+    assert rendered[0] == 200
+    assert rendered[1]["Content-Type"] == "image/png"
+    assert rendered[2].startswith(b"\x89PNG")
+    assert invalid[0] == 400
+    assert unknown[0] == 404
+    assert json.loads(stats[2])["rendered"] == 1
+
+def test_malformed_request_heads_are_answered_with_400():
+    async def scenario():
+        async with RenderService(max_workers=1) as service:
+            negative = await send(
+                service.port, b"POST /render HTTP/1.1\r\nContent-Length: -5\r\n\r\n"
+            )
+            oversized = await send(
+                service.port, b"POST /render HTTP/1.1\r\nX-Padding: " + b"x" * 100_000 + b"\r\n\r\n"
+            )
+        return negative, oversized
+
+    negative, oversized = asyncio.run(scenario())
+
+    assert negative[0] == 400
+    assert oversized[0] == 400
+
+def test_identical_requests_are_coalesced():
+    async def scenario():
+        async with RenderService(max_workers=1) as service:
+            results = await asyncio.gather(*(service.render(request_body()) for _ in range(4)))
+        return service.stats, results
+
+    stats, results = asyncio.run(scenario())
+
+    assert stats.rendered == 1
+    assert stats.coalesced == 3
+    assert len({content for _, content in results}) == 1
+
+def test_full_queue_rejects_requests():
+    async def scenario():
+        async with RenderService(max_workers=1, max_queue=1) as service:
+            results = await asyncio.gather(
+                *(service.render(request_body(user=f"User {i}")) for i in range(4)),
+                return_exceptions=True,
+            )
+        return service.stats, results
+
+    stats, results = asyncio.run(scenario())
+
+    assert any(isinstance(result, ServiceBusy) for result in results)
+    assert stats.rejected + stats.rendered == 4
@@ -0,0 +1,68 @@
+import pytest
+
+from src.study_planner.conflicts import find_conflicts
+from src.study_planner.scheduler import SessionRequest, schedule_courses
+from src.study_planner.timetable import Timetable, WeekDay, minutes_since_midnight
+
+
+def request(name, duration=90, room="A1", lecturer="Dr. Euler", **kwargs):
+    return SessionRequest(name, 5, duration, room, lecturer, **kwargs)
+
+
+def test_schedule_returns_timetable_without_clashes():
+    requests = [request(f"Course {i}", lecturer=f"Lecturer {i % 3}") for i in range(30)]
+    timetable = schedule_courses(requests)
+
+    assert isinstance(timetable, Timetable)
+    assert len(timetable) == 30
+    assert find_conflicts(timetable.courses, "room").empty
+    assert find_conflicts(timetable.courses, "lecturer").empty
+
+
+def test_schedule_respects_days_and_time_windows():
+    requests = [
+        request(
+            f"Course {i}",
+            duration=60,
+            room=f"Room {i}",
+            allowed_days=(WeekDay.TUESDAY, WeekDay.THURSDAY),
+            earliest_start="9:30",
+            latest_end="12:00",
+        )
+        for i in range(4)
+    ]
+    timetable = schedule_courses(requests)
+
+    for course in timetable.courses:
+        start = minutes_since_midnight(course.start_time)
+        assert course.week_day in (WeekDay.TUESDAY, WeekDay.THURSDAY)
+        assert 9 * 60 + 30 <= start and start + 60 <= 12 * 60
+
+
+def test_fully_packed_day_is_solved():
+    # Eight 90 minute sessions fill the 12 hours of a single room exactly.
+    requests = [request(f"Course {i}", allowed_days=(WeekDay.MONDAY,)) for i in range(8)]
+    timetable = schedule_courses(requests, seed=3)
+
+    starts = sorted(minutes_since_midnight(c.start_time) for c in timetable.courses)
+    assert starts == list(range(8 * 60, 20 * 60, 90))
+
+
+def test_same_seed_gives_same_timetable():
+    requests = [request(f"Course {i}", room=f"Room {i % 4}") for i in range(40)]
+
+    assert schedule_courses(requests, seed=7) == schedule_courses(requests, seed=7)
+
+
+def test_unplaceable_sessions_raise():
+    requests = [request(f"Course {i}", allowed_days=(WeekDay.MONDAY,)) for i in range(9)]
+
+    with pytest.raises(ValueError, match="Could not place"):
+        schedule_courses(requests, time_budget=0.2)
+
+
+def test_session_outside_its_window_raises():
+    too_long = request("Marathon", duration=300, earliest_start="9:00", latest_end="12:00")
+
+    with pytest.raises(ValueError, match="Marathon"):
+        schedule_courses([too_long])
@@ -0,0 +1,129 @@
+from datetime import date, datetime, timezone
+import io
+import itertools
+import types
+
+import pytest
+
+from src.study_planner.semester import SemesterCalendar, expand_semester, iter_ics, write_ics
+from src.study_planner.timetable import Timetable, WeekDay
+from tests.conftest import make_course
+
+CREATED = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def semester():
+    # Monday 12th to Sunday 25th of October 2026.
+    return SemesterCalendar(date(2026, 10, 12), date(2026, 10, 25))
+
+
+@pytest.fixture
+def timetable():
+    return Timetable([
+        make_course("Physics", WeekDay.WEDNESDAY, "14:00"),
+        make_course("Math", WeekDay.MONDAY, "10:00"),
+        make_course("Late Lab", WeekDay.MONDAY, "8:00"),
+    ])
+
+
+def test_expand_semester_is_lazy(timetable, semester):
+    assert isinstance(expand_semester(timetable, semester), types.GeneratorType)
+
+
+def test_one_event_per_week_in_chronological_order(timetable, semester):
+    events = list(expand_semester(timetable, semester))
+
+    assert [(event.course.course_name, event.start) for event in events] == [
+        ("Late Lab", datetime(2026, 10, 12, 8, 0)),
+        ("Math", datetime(2026, 10, 12, 10, 0)),
+        ("Physics", datetime(2026, 10, 14, 14, 0)),
+        ("Late Lab", datetime(2026, 10, 19, 8, 0)),
+        ("Math", datetime(2026, 10, 19, 10, 0)),
+        ("Physics", datetime(2026, 10, 21, 14, 0)),
+    ]
+    assert [event.index for event in events[:3]] == [2, 1, 0]
+
+
+def test_holidays_and_breaks_are_skipped(timetable, semester):
+    semester.holidays.add(date(2026, 10, 14))
+    semester.add_break(date(2026, 10, 18), date(2026, 10, 20))
+
+    starts = [event.start.date() for event in expand_semester(timetable, semester)]
+
+    assert starts == [date(2026, 10, 12), date(2026, 10, 12), date(2026, 10, 21)]
+
+
+def test_sessions_past_midnight_end_on_the_next_day(semester):
+    events = list(expand_semester([make_course("Night", WeekDay.SUNDAY, "23:00", 120)], semester))
+
+    assert events[0].start == datetime(2026, 10, 18, 23, 0)
+    assert events[0].end == datetime(2026, 10, 19, 1, 0)
+
+
+def test_semester_must_not_end_before_it_starts():
+    with pytest.raises(ValueError):
+        SemesterCalendar(date(2026, 10, 12), date(2026, 10, 11))
+
+
+def test_write_ics_streams_valid_calendar(timetable, semester):
+    stream = io.StringIO(newline="")
+    written = write_ics(expand_semester(timetable, semester), stream, "Marieke", CREATED)
+    text = stream.getvalue()
+
+    assert written == 6
+    assert text.startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+    assert text.endswith("END:VCALENDAR\r\n")
+    assert text.count("BEGIN:VEVENT") == 6
+    assert "DTSTART:20261012T080000\r\nDTEND:20261012T093000\r\n" in text
+    assert "DTSTAMP:20261001T120000Z\r\n" in text
+    assert "\n" not in text.replace("\r\n", "")
+
+
+def test_uids_are_unique_per_session_and_calendar(timetable, semester):
+    def uids(name):
+        lines = "".join(iter_ics(expand_semester(timetable, semester), name, CREATED)).split("\r\n")
+        return {line for line in lines if line.startswith("UID:")}
+
+    assert len(uids("Marieke")) == 6
+    assert uids("Marieke").isdisjoint(uids("Chavez"))
+
+
+def test_text_is_escaped_and_long_lines_are_folded(semester):
+    name = "Linear Algebra; Geometry, and Analysis " + "ä" * 60
+    lines = "".join(iter_ics(expand_semester([make_course(name, WeekDay.MONDAY, "10:00")], semester)))
+    physical = lines.split("\r\n")
+
+    assert all(len(line.encode()) <= 75 for line in physical)
+    unfolded = lines.replace("\r\n ", "")
+    assert "SUMMARY:Linear Algebra\\; Geometry\\, and Analysis " + "ä" * 60 + "\r\n" in unfolded
+
+
+def test_write_ics_to_path(timetable, semester, tmp_path):
+    path = tmp_path / "semester.ics"
+    write_ics(expand_semester(timetable, semester), path, created=CREATED)
+
+    assert path.read_bytes().count(b"\r\nBEGIN:VEVENT\r\n") == 6
+
+
+def test_chained_timetables_keep_their_own_text_and_uids(semester):
+    first = [make_course("Math", WeekDay.MONDAY, "10:00", room="A1")]
+    second = [make_course("Physics", WeekDay.MONDAY, "10:00", room="B2")]
+    events = itertools.chain(expand_semester(first, semester), expand_semester(second, semester))
+    text = "".join(iter_ics(events, created=CREATED))
+    uids = [line for line in text.split("\r\n") if line.startswith("UID:")]
+
+    assert text.count("SUMMARY:Physics\r\nLOCATION:B2") == 2
+    assert text.count("SUMMARY:Math\r\nLOCATION:A1") == 2
+    assert len(set(uids)) == len(uids) == 4
+
+
+def test_default_name_does_not_make_uids_of_different_students_collide(semester):
+    def uids(courses):
+        lines = "".join(iter_ics(expand_semester(courses, semester), created=CREATED)).split("\r\n")
+        return {line for line in lines if line.startswith("UID:")}
+
+    marieke = uids([make_course("Math", WeekDay.MONDAY, "10:00")])
+    chavez = uids([make_course("Physics", WeekDay.MONDAY, "10:00")])
+
+    assert marieke.isdisjoint(chavez)
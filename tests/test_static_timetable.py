@@ -1,47 +1,28 @@
+import io
+
 import matplotlib
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 import matplotlib.pyplot as plt
 import pytest
 
 from src.study_planner.static_timetable import StaticTimetable
-from src.study_planner.themes import Theme
-from src.study_planner.timetable import Course, WeekDay, Timetable
+from src.study_planner.themes import RainbowTheme
+from src.study_planner.timetable import Course, RenderMode, WeekDay, Timetable
+from tests.conftest import CountingTheme, FixedTheme, SimpleTheme
 
 matplotlib.use("Agg")  # Prevent GUI backend during testing
 
 
-class SimpleTheme(Theme):
-    fontcolor = "black"
-    themecolor = "white"
-
-    def color_list(self, number_of_courses: int) -> list:
-        return ["#88c0d0"] * number_of_courses
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close("all")
 
 
 @pytest.fixture
-def layout():
-    courses = [
-        Course(
-            course_name="Math",
-            credits=5,
-            week_day=WeekDay.MONDAY,
-            start_time="10:00",
-            duration_minutes=90,
-            room="A1",
-            lecturer="Dr. Euler",
-        ),
-        Course(
-            course_name="Physics",
-            credits=4,
-            week_day=WeekDay.WEDNESDAY,
-            start_time="14:00",
-            duration_minutes=120,
-            room="B2",
-            lecturer="Dr. Newton",
-        ),
-    ]
-
+def layout(courses):
     return StaticTimetable(
         courses=courses,
         theme=SimpleTheme(),
@@ -67,12 +48,14 @@ def test_header_creates_rectangle_per_weekday(layout):
     assert len(ax_header.patches) == len(WeekDay)
     assert all(isinstance(p, Rectangle) for p in ax_header.patches)
 
+
 def test_header_title_contains_username(layout):
     fig = layout.display_timetable()
     ax_header = fig.axes[0]
 
     assert "Chavez" in ax_header.get_title()
 
+
 def test_body_axis_is_inverted(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
@@ -80,12 +63,14 @@ def test_body_axis_is_inverted(layout):
     bottom, top = ax_body.get_ylim()
     assert bottom > top
 
+
 def test_body_has_one_rectangle_per_course(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
 
     assert len(ax_body.patches) == 2
 
+
 def test_course_y_position(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
@@ -94,6 +79,7 @@ def test_course_y_position(layout):
 
     assert rect.get_y() == 10 * 60
 
+
 def test_course_height_equals_duration(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
@@ -101,18 +87,21 @@ def test_course_height_equals_duration(layout):
     rect = ax_body.patches[0]
     assert rect.get_height() == 90
 
+
 def test_vertical_day_lines_exist(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
 
     assert len(ax_body.lines) == len(WeekDay)
 
+
 def test_legend_is_created(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
 
     assert ax_body.get_legend() is not None
 
+
 def test_no_courses_creates_no_patches():
     empty_layout = StaticTimetable(
         courses=[],
@@ -126,6 +115,7 @@ def test_no_courses_creates_no_patches():
 
     assert len(ax_body.patches) == 0
 
+
 def test_rectangle_width_equals_day_width(layout):
     fig = layout.display_timetable()
     ax_body = fig.axes[1]
@@ -133,4 +123,205 @@ def test_rectangle_width_equals_day_width(layout):
     rect = ax_body.patches[0]
     expected_width = 10 / len(WeekDay)
 
-    assert rect.get_width() == expected_width
\ No newline at end of file
+    assert rect.get_width() == expected_width
+
+
+def test_batched_draws_one_collection(batched_layout):
+    fig = batched_layout.display_timetable()
+    ax_body = fig.axes[1]
+
+    assert len(ax_body.patches) == 0
+    assert len(ax_body.collections) == 1
+    assert isinstance(ax_body.collections[0], PolyCollection)
+
+
+def test_batched_course_geometry(batched_layout):
+    fig = batched_layout.display_timetable()
+    ax_body = fig.axes[1]
+
+    first_course = ax_body.collections[0].get_paths()[0].vertices
+    expected_x = 10 / len(WeekDay)
+
+    assert first_course[:, 1].min() == 10 * 60
+    assert first_course[:, 1].max() == 10 * 60 + 90
+    assert first_course[:, 0].min() == expected_x
+    assert first_course[:, 0].max() == 2 * expected_x
+
+
+def test_batched_legend_uses_course_names(batched_layout):
+    fig = batched_layout.display_timetable()
+    legend = fig.axes[1].get_legend()
+
+    assert [t.get_text() for t in legend.get_texts()] == ["Math", "Physics"]
+
+
+def test_batched_matches_per_course_labels(layout, batched_layout):
+    per_course = layout.display_timetable().axes[1]
+    batched = batched_layout.display_timetable().axes[1]
+
+    assert [t.get_position() for t in per_course.texts] == [t.get_position() for t in batched.texts]
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_palette_is_computed_once_per_render(layout, render_mode):
+    theme = CountingTheme()
+    counting_layout = StaticTimetable(layout.courses, theme, (10, 6), "Chavez", render_mode)
+    counting_layout.display_timetable()
+
+    assert theme.calls == 1
+
+
+@pytest.mark.parametrize("export_format, magic", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF")])
+def test_export_bytes(layout, export_format, magic):
+    content = layout.export_bytes(export_format)
+
+    assert content.startswith(magic)
+
+
+def test_export_closes_figure(layout, tmp_path):
+    open_figures = len(plt.get_fignums())
+    layout.export(tmp_path / "timetable.png")
+
+    assert (tmp_path / "timetable.png").stat().st_size > 0
+    assert len(plt.get_fignums()) == open_figures
+
+
+def test_export_rejects_html(layout, tmp_path):
+    with pytest.raises(ValueError):
+        layout.export(tmp_path / "timetable.html")
+
+
+def test_export_to_file_object_needs_format(layout):
+    with pytest.raises(ValueError):
+        layout.export(io.BytesIO())
+
+
+def test_overlapping_courses_are_drawn_side_by_side(layout):
+    overlapping = Course("Chemistry", 4, WeekDay.MONDAY, "10:30", 60, "C3", "Dr. Curie")
+    side_by_side = StaticTimetable(layout.courses + [overlapping], SimpleTheme(), (10, 6), "Chavez")
+    ax_body = side_by_side.display_timetable().axes[1]
+    math, _, chemistry = ax_body.patches
+    day_width = 10 / len(WeekDay)
+
+    assert math.get_width() == chemistry.get_width() == day_width / 2
+    assert chemistry.get_x() == math.get_x() + day_width / 2
+
+
+def _body_state(fig):
+    ax_body = fig.axes[1]
+    legend = ax_body.get_legend()
+    return (
+        [(p.get_x(), p.get_y(), p.get_width(), p.get_height(), p.get_label(), p.get_facecolor())
+         for p in ax_body.patches],
+        [(t.get_position(), t.get_text()) for t in ax_body.texts],
+        [c.get_paths()[i].vertices.tolist() for c in ax_body.collections for i in range(len(c.get_paths()))],
+        [c.get_facecolors().tolist() for c in ax_body.collections],
+        ax_body.get_ylim(),
+        list(ax_body.get_yticks()),
+        [(t.get_text(), h.get_facecolor()) for t, h in zip(legend.texts, legend.legend_handles)]
+        if legend else None,
+    )
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_edits_match_a_fresh_render(layout, render_mode):
+    layout.theme = RainbowTheme()
+    layout.render_mode = RenderMode(render_mode)
+    layout.open_figure()
+    layout.add_course(Course("Chemistry", 4, WeekDay.MONDAY, "10:30", 60, "C3", "Dr. Curie"))
+    layout.update_course(1, Course("Biology", 3, WeekDay.FRIDAY, "20:00", 180, "D4", "Dr. Darwin"))
+    layout.remove_course(0)
+    layout.add_course(Course("Geology", 4, WeekDay.TUESDAY, "9:00", 60, "E5", "Dr. Hutton"))
+
+    colors = layout.compute_course_geometry().colors
+    fresh = type(layout)(
+        layout.courses, FixedTheme(layout.theme, colors), layout.figsize_timetable, "Chavez",
+        layout.render_mode,
+    )
+
+    assert len(set(map(tuple, colors))) == len(colors) == 3
+    assert _body_state(layout.figure) == _body_state(fresh.display_timetable())
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_open_figure_matches_a_plain_render(layout, render_mode):
+    layout.theme = RainbowTheme()
+    layout.render_mode = RenderMode(render_mode)
+    fresh = type(layout)(
+        layout.courses, RainbowTheme(), layout.figsize_timetable, "Chavez", layout.render_mode
+    )
+
+    assert _body_state(layout.open_figure()) == _body_state(fresh.display_timetable())
+
+
+def test_added_courses_get_distinct_colors(layout):
+    layout.theme = RainbowTheme()
+    layout.open_figure()
+    for hour in range(9):
+        layout.add_course(Course(f"Course {hour}", 3, WeekDay.THURSDAY, f"{8 + hour}:00", 60, "A", "B"))
+    hex_colors = layout.compute_course_geometry().hex_colors
+
+    assert len(set(hex_colors)) == len(hex_colors) == 11
+
+
+@pytest.mark.parametrize("render_mode", list(RenderMode))
+def test_add_keeps_the_colors_and_legend_entries_of_other_courses(layout, render_mode, monkeypatch):
+    layout.theme = RainbowTheme()
+    layout.render_mode = RenderMode(render_mode)
+    layout.open_figure()
+    legend = layout.figure.axes[1].get_legend()
+    entries = list(zip(legend.texts, legend.legend_handles))
+    colors = [handle.get_facecolor() for _, handle in entries]
+    redrawn = []
+    monkeypatch.setattr(layout, "redraw_courses", lambda indices, geometry: redrawn.extend(indices))
+    layout.add_course(Course("Chemistry", 4, WeekDay.TUESDAY, "10:30", 60, "C3", "Dr. Curie"))
+
+    assert redrawn == []
+    assert list(zip(legend.texts, legend.legend_handles))[:2] == entries
+    assert [handle.get_facecolor() for handle in legend.legend_handles[:2]] == colors
+    assert legend.texts[2].get_text() == "Chemistry"
+    assert layout.figure.axes[1].get_legend() is legend
+
+
+def test_update_only_touches_the_edited_course(layout):
+    layout.open_figure()
+    math, physics = layout.figure.axes[1].patches
+    layout.update_course(1, Course("Physics", 4, WeekDay.WEDNESDAY, "15:00", 60, "B2", "Dr. Newton"))
+
+    assert layout.figure.axes[1].patches[0] is math
+    assert layout.figure.axes[1].patches[1] is physics
+    assert math.get_y() == 10 * 60
+    assert physics.get_y() == 15 * 60
+
+
+def test_y_range_is_only_redrawn_when_it_changes(layout, monkeypatch):
+    layout.open_figure()
+    redrawn = []
+    monkeypatch.setattr(layout, "redraw_y_range", redrawn.append)
+    layout.add_course(Course("Chemistry", 4, WeekDay.MONDAY, "11:00", 60, "C3", "Dr. Curie"))
+    layout.add_course(Course("Astronomy", 4, WeekDay.MONDAY, "23:00", 60, "C3", "Dr. Kepler"))
+
+    assert len(redrawn) == 1
+
+
+def test_edits_without_open_figure_only_change_courses(layout):
+    removed = layout.remove_course(-1)
+
+    assert removed.course_name == "Physics"
+    assert [course.course_name for course in layout.courses] == ["Math"]
+    assert layout.figure is None
+
+
+def test_skeleton_is_shared_between_users(layout):
+    from src.study_planner.static_timetable import _SKELETONS
+
+    _SKELETONS.clear()
+    misses = _SKELETONS.misses
+    other = StaticTimetable(layout.courses, SimpleTheme(), (10, 6), "Marieke")
+    first, second = layout.display_timetable(), other.display_timetable()
+
+    assert (_SKELETONS.misses - misses, len(_SKELETONS)) == (1, 1)
+    assert "Chavez" in first.axes[0].get_title()
+    assert "Marieke" in second.axes[0].get_title()
+    assert first.axes[1] is not second.axes[1]
+    assert len(second.axes[1].patches) == 2
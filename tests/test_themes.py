@@ -66,4 +66,38 @@ def test_color_list_returns_rgba(ThemeClass):
     for color in colors:
         assert isinstance(color, tuple)
         assert len(color) == 4  # RGBA
-        assert all(0 <= c <= 1 for c in color)
\ No newline at end of file
+        assert all(0 <= c <= 1 for c in color)
+
+@pytest.mark.parametrize("ThemeClass", THEME_CLASSES)
+def test_palette_matches_colormap(ThemeClass):
+    import matplotlib.colors as mcolors
+    import numpy as np
+
+    theme = ThemeClass()
+
+    palette = theme.palette(7)
+
+    expected = [theme.cmap(i) for i in np.linspace(*theme.color_range, 7)]
+    assert list(palette.colors) == [tuple(map(float, color)) for color in expected]
+    assert list(palette.hex_colors) == [mcolors.to_hex(color) for color in expected]
+
+
+def test_palette_is_memoised():
+    assert LightTheme().palette(12) is LightTheme().palette(12)
+    assert LightTheme().palette(12) is not LightTheme().palette(13)
+
+
+def test_color_list_is_a_copy():
+    theme = DarkTheme()
+
+    theme.color_list(3).append("red")
+
+    assert len(theme.color_list(3)) == 3
+
+
+def test_default_palette_uses_color_list():
+    class NamedTheme(Theme):
+        def color_list(self, number_of_courses: int) -> list:
+            return ["red"] * number_of_courses
+
+    assert NamedTheme().palette(2).hex_colors == ("#ff0000", "#ff0000")
@@ -2,11 +2,17 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from src.study_planner.static_timetable import StaticTimetable
+from src.study_planner.themes import LightTheme
 from src.study_planner.timetable import (
     WeekDay,
     Course,
+    CourseTable,
+    FrozenCourse,
+    SkeletonCache,
     Timetable,
-    minutes_since_midnight
+    minutes_since_midnight,
+    parse_times,
 )
 
 
@@ -61,6 +67,41 @@ def test_is_course():
     assert type(dynamics) == Course
     assert type(math) == Course
 
+def test_course_has_no_instance_dict():
+    assert not hasattr(dynamics, "__dict__")
+
+def test_course_parses_start_minute():
+    assert dynamics.start_minute == 20 * 60 + 35
+    assert math.start_minute == 9 * 60 + 15
+
+def test_start_minute_follows_the_start_time():
+    course = Course("Math", 3, WeekDay.MONDAY, "8:00", 90, "A", "B")
+    course.start_time = "14:00"
+
+    assert course.start_minute == 14 * 60
+    assert CourseTable.from_courses([course]).start_minutes.tolist() == [14 * 60]
+
+def test_course_rejects_invalid_start_time():
+    with pytest.raises(ValueError):
+        Course("Math", 3, WeekDay.MONDAY, "25:00", 90, "A", "B")
+
+def test_course_interns_text_fields():
+    room = "".join(["Geom ", "1528"])
+    course = Course("Algebra", 3, WeekDay.MONDAY, "9:15", 90, room, "John Smith")
+
+    assert course.room is math.room
+    assert course.start_time is math.start_time
+
+def test_frozen_course_is_hashable_and_immutable():
+    frozen = math.freeze()
+
+    assert isinstance(frozen, FrozenCourse)
+    assert frozen.start_minute == math.start_minute
+    assert len({frozen, math.freeze()}) == 1
+    with pytest.raises(AttributeError):
+        frozen.room = "A1"
+    assert frozen.thaw() == math
+
 
 # Tests for Timetable Class
 def test_add_course():
@@ -78,6 +119,14 @@ def test_to_df_generates_dataframe():
 
     assert isinstance(df, pd.DataFrame)
 
+def test_to_df_columns():
+    df = test_timetable.to_df()
+
+    assert df.index.name == "course_name"
+    assert list(df.index) == ["Dynamics", "Mathematics"]
+    assert list(df.columns) == ["credits", "week_day", "start_time", "duration_minutes", "room", "lecturer"]
+    assert df["credits"].tolist() == [6, 3]
+
 
 # Testing functions
 def test_minutes_since_midnight():
@@ -88,6 +137,20 @@ def test_minutes_since_midnight_invalid_format():
     with pytest.raises(ValueError):
         minutes_since_midnight("25:00")
 
+@pytest.mark.parametrize("invalid_time", ["24:00", "9:60", "9", "09:15:00", " 9:15", "9:15\n", ""])
+def test_minutes_since_midnight_is_strict(invalid_time):
+    with pytest.raises(ValueError):
+        minutes_since_midnight(invalid_time)
+
+def test_parse_times():
+    minutes = parse_times(["0:00", "9:15", "09:15", "23:59"])
+
+    assert minutes.tolist() == [0, 555, 555, 1439]
+
+def test_parse_times_reports_invalid_rows():
+    with pytest.raises(ValueError, match="row 1: '25:00'.*row 3: None"):
+        parse_times(["10:00", "25:00", "11:00", None])
+
 
 # Testing calc_yrange_for_plotting function
 def calc_yrange_for_plotting():
@@ -117,4 +180,99 @@ def calc_yrange_for_plotting():
     # Y-ticks for labelling y-axis.
     y_ticks = np.arange(earliest_hour, latest_hour + 1, 60)
 
-    assert y_ticks == np.array([1260, 1320, 1380, 1440, 1500, 1560, 1620])
\ No newline at end of file
+    assert y_ticks == np.array([1260, 1320, 1380, 1440, 1500, 1560, 1620])
+
+
+# Testing the precomputed course geometry
+def test_compute_course_geometry():
+    layout = StaticTimetable([dynamics, math], LightTheme(), (7, 6), "Chavez")
+    geometry = layout.compute_course_geometry()
+
+    assert geometry.day_width == 1
+    assert geometry.x.tolist() == [2, 5]
+    assert geometry.start_minutes.tolist() == [20 * 60 + 35, 9 * 60 + 15]
+    assert geometry.durations.tolist() == [90, 120]
+    assert len(geometry.colors) == 2
+
+def test_calc_yrange_pads_two_hours():
+    layout = StaticTimetable([dynamics, math], LightTheme(), (7, 6), "Chavez")
+    y_ticks = layout.calc_yrange_for_plotting()
+
+    assert y_ticks[0] == 7 * 60
+    assert y_ticks[-1] == 25 * 60
+
+def test_calc_yrange_without_courses():
+    layout = StaticTimetable([], LightTheme(), (7, 6), "Chavez")
+    y_ticks = layout.calc_yrange_for_plotting()
+
+    assert y_ticks[0] == 8 * 60
+    assert y_ticks[-1] == 18 * 60
+
+
+# Tests for CourseTable class
+def test_course_table_round_trip():
+    table = CourseTable.from_courses([dynamics, math])
+
+    assert table.to_courses() == [dynamics, math]
+
+def test_course_table_column_types():
+    table = CourseTable.from_courses([dynamics, math])
+
+    assert table.start_minutes.dtype == np.int16
+    assert table.duration_minutes.dtype == np.int16
+    assert table.week_day.tolist() == [2, 5]
+    assert table.end_minutes.tolist() == [20 * 60 + 35 + 90, 9 * 60 + 15 + 120]
+
+def test_course_table_to_df_matches_timetable():
+    df = CourseTable.from_courses([dynamics, math]).to_df()
+    expected = test_timetable.to_df()
+
+    assert list(df.index) == list(expected.index)
+    assert df["room"].dtype == "category"
+    assert df["week_day"].astype(str).tolist() == ["Tuesday", "Friday"]
+
+def test_course_table_from_df():
+    table = CourseTable.from_df(test_timetable.to_df())
+
+    assert table.to_courses() == [dynamics, math]
+
+def test_course_tables_compare_by_identity():
+    table = CourseTable.from_courses([dynamics, math])
+
+    assert table == table
+    assert table != CourseTable.from_courses([dynamics, math])
+
+def test_course_table_boolean_selection():
+    table = CourseTable.from_courses([dynamics, math])
+    fridays = table[table.week_day == 5]
+
+    assert [c.course_name for c in fridays] == ["Mathematics"]
+
+def test_course_table_unknown_week_day():
+    course = Course("Math", 3, "Someday", "9:00", 90, "A", "B")
+
+    with pytest.raises(ValueError):
+        CourseTable.from_courses([course])
+
+def test_course_table_rejects_numbers_that_do_not_fit_int16():
+    course = Course("Math", 3, "Monday", "9:00", 40_000, "A", "B")
+
+    with pytest.raises(ValueError, match="duration_minutes.*row 0: 40000"):
+        CourseTable.from_courses([course])
+
+def test_layout_accepts_course_table():
+    table = CourseTable.from_courses([dynamics, math])
+    layout = StaticTimetable(table, LightTheme(), (7, 6), "Chavez")
+
+    assert layout.compute_course_geometry().x.tolist() == [2, 5]
+
+def test_skeleton_cache_evicts_least_recently_used():
+    cache = SkeletonCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 3)
+    cache.get("c", lambda: 4)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    assert cache.get("a", lambda: 5) == 1
+    assert cache.get("b", lambda: 6) == 6
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+from src.study_planner.course_io import csv_to_timetable_file, iter_course_batches
+from src.study_planner.course_io import timetable_file_to_csv
+from src.study_planner.helper_functions import load_course_data, load_course_table
+from src.study_planner.timetable import Course, CourseTable, Timetable, WeekDay
+from src.study_planner.timetable_file import TimetableFile, write_timetable_file
+
+
+@pytest.fixture
+def stored_courses():
+    return [
+        Course("Math", 6, WeekDay.MONDAY, "09:00", 90, "A1", "Dr. Euler"),
+        Course("Physics", 4, WeekDay.TUESDAY, "10:00", 120, "B2", "Dr. Newton"),
+        Course("Chemistry", 5, WeekDay.MONDAY, "8:30", 60, "B2", "Dr. Curie"),
+        Course("Analysis", 3, WeekDay.FRIDAY, "14:15", 45, "A1", "Dr. Euler"),
+    ]
+
+
+def test_round_trip(tmp_path, stored_courses):
+    path = tmp_path / "courses.ttb"
+    write_timetable_file(path, Timetable(stored_courses))
+
+    timetable_file = TimetableFile(path)
+
+    assert len(timetable_file) == 4
+    assert timetable_file.table().to_courses() == stored_courses
+    assert list(timetable_file.table().start_minutes) == [540, 600, 510, 855]
+
+
+def test_write_from_dataframe(tmp_path, stored_courses):
+    path = tmp_path / "courses.ttb"
+    write_timetable_file(path, Timetable(stored_courses).to_df())
+
+    assert TimetableFile(path).table().to_courses() == stored_courses
+
+
+def test_select_by_index(tmp_path, stored_courses):
+    path = tmp_path / "courses.ttb"
+    write_timetable_file(path, stored_courses)
+    timetable_file = TimetableFile(path)
+
+    assert list(timetable_file.week_day(WeekDay.MONDAY).course_name) == ["Math", "Chemistry"]
+    assert len(timetable_file.week_day(WeekDay.SUNDAY)) == 0
+    assert list(timetable_file.lecturer("Dr. Euler").course_name) == ["Math", "Analysis"]
+    assert list(timetable_file.room("B2").course_name) == ["Physics", "Chemistry"]
+    assert len(timetable_file.room("Z9")) == 0
+    assert list(timetable_file[1:3].course_name) == ["Physics", "Chemistry"]
+
+
+def test_unknown_week_day(tmp_path, stored_courses):
+    path = tmp_path / "courses.ttb"
+    write_timetable_file(path, stored_courses)
+
+    with pytest.raises(ValueError, match="Unknown week day"):
+        TimetableFile(path).week_day("Someday")
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.ttb"
+    write_timetable_file(path, [])
+
+    assert len(TimetableFile(path).table()) == 0
+    assert len(TimetableFile(path).week_day(WeekDay.MONDAY)) == 0
+
+
+def test_not_a_timetable_file(tmp_path):
+    path = tmp_path / "courses.ttb"
+    path.write_text("course_name,credits\n")
+
+    with pytest.raises(ValueError, match="not a timetable file"):
+        TimetableFile(path)
+
+
+def test_csv_conversion(tmp_path, stored_courses):
+    csv_path = tmp_path / "courses.csv"
+    Timetable(stored_courses).to_df().to_csv(csv_path)
+
+    csv_to_timetable_file(str(csv_path), str(tmp_path / "courses.ttb"), chunksize=3)
+    timetable_file_to_csv(str(tmp_path / "courses.ttb"), str(tmp_path / "copy.csv"))
+
+    assert load_course_table(str(tmp_path / "courses.ttb")).to_courses() == stored_courses
+    pd.testing.assert_frame_equal(
+        load_course_data(str(tmp_path / "copy.csv")), load_course_data(str(csv_path))
+    )
+    batches = list(iter_course_batches(str(tmp_path / "courses.ttb"), chunksize=3))
+    assert [len(batch) for batch in batches] == [3, 1]
+
+
+def test_concat(stored_courses):
+    tables = [
+        CourseTable.from_courses(stored_courses[:2]), CourseTable.from_courses(stored_courses[2:])
+    ]
+
+    assert CourseTable.concat(tables).to_courses() == stored_courses
+    assert len(CourseTable.concat([])) == 0
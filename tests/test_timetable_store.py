@@ -0,0 +1,126 @@
+import pytest
+
+from src.study_planner.auto_generation import auto_generation
+from src.study_planner.timetable import Course, Timetable, WeekDay
+from src.study_planner.timetable_store import TimetableStore
+
+
+@pytest.fixture
+def store():
+    with TimetableStore() as store:
+        store.add_timetable("alice.csv", "Alice", [
+            Course("Math", 6, WeekDay.MONDAY, "09:00", 90, "A1", "Dr. Euler"),
+            Course("Physics", 4, WeekDay.TUESDAY, "10:00", 120, "B2", "Dr. Newton"),
+        ])
+        store.add_timetable("bob.csv", "Bob", Timetable([
+            Course("Chemistry", 5, WeekDay.TUESDAY, "8:30", 60, "B2", "Dr. Curie"),
+            Course("Analysis", 3, WeekDay.FRIDAY, "14:15", 45, "A1", "Dr. Euler"),
+        ]))
+        yield store
+
+
+def test_load(store):
+    table = store.load("bob.csv")
+
+    assert table.to_courses() == [
+        Course("Chemistry", 5, WeekDay.TUESDAY, "8:30", 60, "B2", "Dr. Curie"),
+        Course("Analysis", 3, WeekDay.FRIDAY, "14:15", 45, "A1", "Dr. Euler"),
+    ]
+    assert list(table.start_minutes) == [510, 855]
+
+
+def test_load_unknown(store):
+    with pytest.raises(ValueError, match="Unknown timetable: carol.csv"):
+        store.load("carol.csv")
+
+
+def test_timetable_names(store):
+    assert store.timetable_names() == ["alice.csv", "bob.csv"]
+    assert store.timetable_names(user="Bob") == ["bob.csv"]
+    assert len(store) == 2
+
+
+def test_query_across_users(store):
+    df = store.query(week_day=WeekDay.TUESDAY, room="B2")
+
+    assert list(df["course_name"]) == ["Chemistry", "Physics"]
+    assert list(df["user"]) == ["Bob", "Alice"]
+    assert list(df["week_day"]) == [WeekDay.TUESDAY, WeekDay.TUESDAY]
+    assert list(store.query(lecturer="Dr. Euler")["course_name"]) == ["Math", "Analysis"]
+    assert len(store.query(user="Alice", room="A1")) == 1
+
+
+def test_query_uses_indexes(store):
+    plan = store.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM sessions WHERE room = ? AND week_day = ?", ("B2", 2)
+    ).fetchall()
+
+    assert "sessions_room" in " ".join(str(row) for row in plan)
+
+
+def test_replace_and_remove(store):
+    store.add_timetable("alice.csv", "Alice", [
+        Course("History", 2, WeekDay.SUNDAY, "12:00", 90, "C3", "Dr. Gibbon"),
+    ])
+
+    assert list(store.load("alice.csv").course_name) == ["History"]
+    assert len(store.query(room="B2")) == 1
+
+    store.remove("alice.csv")
+
+    assert store.timetable_names() == ["bob.csv"]
+    assert len(store.query(user="Alice")) == 0
+
+
+def test_import_csv(tmp_path):
+    filepath = tmp_path / "carol.csv"
+    Timetable([
+        Course("Math", 6, WeekDay.MONDAY, "09:00", 90, "A1", "Dr. Euler"),
+        Course("Physics", 4, WeekDay.TUESDAY, "10:00", 120, "B2", "Dr. Newton"),
+        Course("Chemistry", 5, WeekDay.TUESDAY, "8:30", 60, "B2", "Dr. Curie"),
+    ]).to_df().to_csv(filepath)
+
+    with TimetableStore(tmp_path / "store.db") as store:
+        assert store.import_csv(str(filepath), chunksize=2) == 3
+
+    with TimetableStore(tmp_path / "store.db") as store:
+        assert store.timetable_names(user="carol") == ["carol.csv"]
+        assert list(store.load("carol.csv").course_name) == ["Math", "Physics", "Chemistry"]
+
+
+def test_import_csv_stores_missing_rooms_and_lecturers_as_empty_text(tmp_path, store):
+    filepath = tmp_path / "dana.csv"
+    filepath.write_text(
+        "course_name,credits,week_day,start_time,duration_minutes,room,lecturer\n"
+        "Math,6,Monday,09:00,90,,Dr. Euler\n"
+        "Physics,4,Tuesday,10:00,120,B2,\n"
+    )
+    store.import_csv(str(filepath))
+
+    table = store.load("dana.csv")
+
+    assert list(table.room) == ["", "B2"]
+    assert list(table.lecturer) == ["Dr. Euler", ""]
+    assert store.query(room="nan").empty
+
+
+def test_import_invalid_csv_leaves_store_unchanged(tmp_path, store):
+    filepath = tmp_path / "alice.csv"
+    filepath.write_text(
+        "course_name,credits,week_day,start_time,duration_minutes,room,lecturer\n"
+        "Math,6,Monday,09:00,90,A1,Dr. Euler\n"
+        "Physics,4,Someday,10:00,120,B2,Dr. Newton\n"
+    )
+
+    with pytest.raises(ValueError, match="Invalid course data"):
+        store.import_csv(str(filepath), user="Alice")
+
+    assert len(store.load("alice.csv")) == 2
+
+
+def test_auto_generation_from_store(tmp_path, store):
+    output = tmp_path / "bob.html"
+
+    auto_generation("dynamic", "bob.csv", "light", (8, 6), "Bob", output=output, store=store)
+
+    assert "Chemistry" in output.read_text()